@@ -0,0 +1,414 @@
+"""
+Pipeline benchmark suite: mandate latency and sustained throughput, ToSTLinear
+ingest, DaggerLayer fan-out, keyword matching and node startup, written to a
+JSON baseline and compared against one.
+
+    python -m benchmarks.bench_pipeline [--quick] [--only latency,fanout] [--json]
+    python -m benchmarks.bench_pipeline --save            # write benchmarks/baseline.json
+    python -m benchmarks.bench_pipeline --compare [--tolerance 0.15]
+
+Every metric records whether lower or higher is better; compare mode exits with
+status 1 when one moves the wrong way by more than its tolerance. Runs offline
+and deterministically seeded; baselines are only comparable on the same machine
+and with the same sizes (--quick or not).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PACKAGE_ROOT not in sys.path:
+    sys.path.insert(0, PACKAGE_ROOT)
+
+from benchmarks import bench_startup  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_TOLERANCE = 0.15
+# Tail latencies and sleep-driven fan-out are noisier than means and rates.
+TOLERANCES = {
+    "mandate_p99_us": 0.5,
+    "dagger_fanout_speedup": 0.3,
+    "matcher_speedup_vs_regex": 0.3,
+    "matcher_single_pass_speedup": 0.3,
+    "import_ms": 0.3,
+    "construct_cold_us": 0.5,
+}
+
+SIZES = {
+    "full": {
+        "latency_calls": 5000,
+        "throughput_mandates": 100_000,
+        "throughput_windows": 10,
+        "ingest_tokens": 500_000,
+        "fanout_tasks": 500,
+        "matcher_calls": 100_000,
+        "matcher_rule_calls": 200,
+        "startup_runs": 5,
+    },
+    "quick": {
+        "latency_calls": 200,
+        "throughput_mandates": 1000,
+        "throughput_windows": 4,
+        "ingest_tokens": 20_000,
+        "fanout_tasks": 20,
+        "matcher_calls": 2000,
+        "matcher_rule_calls": 10,
+        "startup_runs": 1,
+    },
+}
+
+WORDS = (
+    "market",
+    "dominance",
+    "verifiable",
+    "systems",
+    "data",
+    "pipelines",
+    "sovereign",
+    "ledger",
+    "proof",
+    "signal",
+)
+FANOUT_AGENTS = 8
+FANOUT_DELAY_S = 0.002
+# A clean agent output: the safety check has to rule out every banned term over all of it.
+MATCHER_TEXT = (
+    "Strategic market analysis for dominance complete. ZK proof template prepared for "
+    "PlonK-over-HyperPlonK. Sieved data: refined data for market dominance via verifiable systems"
+)
+# A large rule table against a long intent: where the single automaton pass has to win.
+MATCHER_RULES = 1000
+MATCHER_LONG_INTENT_CHARS = 20_000
+
+Metrics = Dict[str, Dict[str, Any]]
+
+
+def _metric(value: float, unit: str, better: str = "lower") -> Dict[str, Any]:
+    return {"value": value, "unit": unit, "better": better}
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sample."""
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def _intents(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=8)) + f" run-{i}" for i in range(count)]
+
+
+@contextmanager
+def _trusted() -> Iterator[None]:
+    # Trust is uptime-driven, so a fresh node fails its first mandates; measure the success path.
+    from unittest.mock import patch
+
+    from src.axiom_lattice import TrustMetricsEngine
+
+    with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+        yield
+
+
+def bench_latency(sizes: Dict[str, int], detail: Dict[str, Any]) -> Metrics:
+    from src.sovereign_core import ZKVSNodePrime
+
+    calls = sizes["latency_calls"]
+    frameworks = [{"intent": intent} for intent in _intents(calls + calls // 10)]
+    with _trusted():
+        node = ZKVSNodePrime()
+        for framework in frameworks[calls:]:
+            node.execute_mandate(framework, structured=True)
+        samples = []
+        for framework in frameworks[:calls]:
+            started = time.perf_counter_ns()
+            node.execute_mandate(framework, structured=True)
+            samples.append((time.perf_counter_ns() - started) / 1e3)
+        node.close()
+    samples.sort()
+    return {
+        "mandate_p50_us": _metric(_percentile(samples, 0.5), "us"),
+        "mandate_p99_us": _metric(_percentile(samples, 0.99), "us"),
+        "mandate_mean_us": _metric(statistics.fmean(samples), "us"),
+    }
+
+
+def bench_throughput(sizes: Dict[str, int], detail: Dict[str, Any]) -> Metrics:
+    from src.sovereign_core import ZKVSNodePrime
+
+    total, windows = sizes["throughput_mandates"], sizes["throughput_windows"]
+    per_window = max(1, total // windows)
+    frameworks = [{"intent": intent} for intent in _intents(64, seed=1)]
+    curve = []
+    with _trusted():
+        node = ZKVSNodePrime()
+        started = time.perf_counter()
+        for _ in range(windows):
+            window_started = time.perf_counter_ns()
+            for i in range(per_window):
+                node.execute_mandate(frameworks[i % len(frameworks)], structured=True)
+            curve.append(
+                {
+                    "ledger_size": node._verifiable_ledger.total_appended,
+                    "per_call_us": (time.perf_counter_ns() - window_started) / per_window / 1e3,
+                }
+            )
+        elapsed = time.perf_counter() - started
+        node.close()
+    # How much dearer a mandate gets as the ledger grows (1.0 means flat).
+    growth = curve[-1]["per_call_us"] / curve[0]["per_call_us"]
+    detail["throughput_curve"] = curve
+    return {
+        "mandates_per_s": _metric(per_window * windows / elapsed, "1/s", "higher"),
+        "ledger_growth_ratio": _metric(growth, "x"),
+    }
+
+
+def bench_ingest(sizes: Dict[str, int], detail: Dict[str, Any]) -> Metrics:
+    from src.axiomshards_catalyst import ToSTLinear
+
+    tokens = " ".join(_intents(sizes["ingest_tokens"] // 9 + 1, seed=2)).split()[
+        : sizes["ingest_tokens"]
+    ]
+    best = float("inf")
+    for _ in range(3):
+        catalyst = ToSTLinear()
+        started = time.perf_counter()
+        catalyst.update_many(tokens)
+        best = min(best, time.perf_counter() - started)
+    return {"tost_tokens_per_s": _metric(len(tokens) / best, "1/s", "higher")}
+
+
+def bench_fanout(sizes: Dict[str, int], detail: Dict[str, Any]) -> Metrics:
+    from src.dagger_agents import DaggerAgent
+    from src.praetorian_layers import DaggerLayer, HadrianLayer
+    from src.sovereign_core import ZKVSNodePrime
+
+    class SleepAgent(DaggerAgent):
+        def _perform_task(self, task_params):
+            time.sleep(FANOUT_DELAY_S)
+            return f"{self.name} done"
+
+    tasks = sizes["fanout_tasks"]
+    hadrian = HadrianLayer(ZKVSNodePrime.AXIOMS)
+    real_task = hadrian.orchestrate_task("market dominance verifiable systems data")
+    sleepers = {f"s{i}": SleepAgent(f"s{i}", "bench", {}) for i in range(FANOUT_AGENTS)}
+    sleepy_task = {"sub_tasks": [{"agent_name": name, "params": {}} for name in sleepers]}
+
+    def per_call_us(layer: DaggerLayer, task: Dict[str, Any], agents, count: int) -> float:
+        started = time.perf_counter_ns()
+        for _ in range(count):
+            layer.run_task(task, agents)
+        return (time.perf_counter_ns() - started) / count / 1e3
+
+    inline = DaggerLayer(ZKVSNodePrime.AXIOMS)
+    threaded = DaggerLayer(ZKVSNodePrime.AXIOMS, executor="thread")
+    try:
+        real_inline = per_call_us(inline, real_task, hadrian.dagger_agents, tasks)
+        real_threaded = per_call_us(threaded, real_task, hadrian.dagger_agents, tasks)
+        sleepy_count = max(1, tasks // 10)
+        sleepy_inline = per_call_us(inline, sleepy_task, sleepers, sleepy_count)
+        sleepy_threaded = per_call_us(threaded, sleepy_task, sleepers, sleepy_count)
+    finally:
+        threaded.shutdown()
+    return {
+        "dagger_inline_us": _metric(real_inline, "us"),
+        "dagger_thread_us": _metric(real_threaded, "us"),
+        "dagger_fanout_speedup": _metric(sleepy_inline / sleepy_threaded, "x", "higher"),
+    }
+
+
+def bench_matcher(sizes: Dict[str, int], detail: Dict[str, Any]) -> Metrics:
+    import re
+
+    from src.axiom_lattice import AxiomEnforcement
+    from src.intent_router import PatternMatcher
+    from src.praetorian_layers import HadrianLayer
+
+    rng = random.Random(0)
+    calls = sizes["matcher_calls"]
+    matcher = PatternMatcher(AxiomEnforcement.BANNED_TERMS)
+    # The alternative PatternMatcher does not use: one compiled alternation, longest pattern first.
+    alternation = re.compile(
+        "|".join(map(re.escape, sorted(matcher.patterns, key=len, reverse=True)))
+    )
+    router = HadrianLayer.default_router()
+
+    def per_call_ns(fn: Callable[[str], Any], text: str) -> float:
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter_ns()
+            for _ in range(calls):
+                fn(text)
+            best = min(best, time.perf_counter_ns() - started)
+        return best / calls
+
+    search = per_call_ns(matcher.search, MATCHER_TEXT)
+    regex = per_call_ns(alternation.search, MATCHER_TEXT)
+    route = per_call_ns(router.route, MATCHER_TEXT)
+    detail["matcher_regex_search_ns"] = regex
+
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    rules = PatternMatcher()
+    while len(rules) < MATCHER_RULES:
+        rules.add("".join(rng.choices(letters, k=rng.randint(4, 10))))
+    words = [rng.choice(rules.patterns) for _ in range(MATCHER_LONG_INTENT_CHARS // 4)]
+    intent = " ".join(words)[:MATCHER_LONG_INTENT_CHARS]
+    rule_patterns = rules.patterns
+
+    def per_pattern_scan(text: str) -> FrozenSet[int]:
+        return frozenset([pid for pid, p in enumerate(rule_patterns) if p in text])
+
+    calls = sizes["matcher_rule_calls"]
+    single_pass = per_call_ns(rules.matches, intent)
+    scan = per_call_ns(per_pattern_scan, intent)
+    detail["matcher_rules_scan_us"] = scan / 1e3
+    return {
+        "matcher_search_ns": _metric(search, "ns"),
+        "matcher_route_ns": _metric(route, "ns"),
+        "matcher_speedup_vs_regex": _metric(regex / search, "x", "higher"),
+        "matcher_rules_us": _metric(single_pass / 1e3, "us"),
+        "matcher_single_pass_speedup": _metric(scan / single_pass, "x", "higher"),
+    }
+
+
+def bench_startup_times(sizes: Dict[str, int], detail: Dict[str, Any]) -> Metrics:
+    report = bench_startup.run(runs=sizes["startup_runs"])
+    detail["startup_deferred_loaded"] = report["deferred_loaded"]
+    return {
+        "import_ms": _metric(report["import_ms"], "ms"),
+        "construct_cold_us": _metric(report["construct_cold_us"], "us"),
+        "construct_warm_us": _metric(report["construct_warm_us"], "us"),
+    }
+
+
+SUITES: Dict[str, Callable[[Dict[str, int], Dict[str, Any]], Metrics]] = {
+    "latency": bench_latency,
+    "throughput": bench_throughput,
+    "ingest": bench_ingest,
+    "fanout": bench_fanout,
+    "matcher": bench_matcher,
+    "startup": bench_startup_times,
+}
+
+
+def run(suites: Optional[List[str]] = None, quick: bool = False) -> Dict[str, Any]:
+    size_name = "quick" if quick else "full"
+    sizes = SIZES[size_name]
+    metrics: Metrics = {}
+    detail: Dict[str, Any] = {}
+    for name in suites or list(SUITES):
+        metrics.update(SUITES[name](sizes, detail))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "sizes": size_name,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "metrics": metrics,
+        "detail": detail,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """Metrics present in both reports that got worse by more than their tolerance."""
+    regressions = []
+    for name, now in current["metrics"].items():
+        before = baseline["metrics"].get(name)
+        if before is None or not before["value"]:
+            continue
+        change = (now["value"] - before["value"]) / before["value"]
+        if now["better"] == "higher":
+            change = -change
+        limit = TOLERANCES.get(name, tolerance)
+        if change > limit:
+            regressions.append(
+                {
+                    "metric": name,
+                    "baseline": before["value"],
+                    "current": now["value"],
+                    "worse_by": change,
+                    "tolerance": limit,
+                }
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the mandate pipeline and its subsystems."
+    )
+    parser.add_argument(
+        "--only", type=str, default=None, help=f"Comma-separated subset of: {', '.join(SUITES)}"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Small sizes (smoke runs; not comparable to full runs)"
+    )
+    parser.add_argument(
+        "--save",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        default=None,
+        help="Write the report as a baseline",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        default=None,
+        help="Compare against a baseline",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative slowdown"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+    suites = args.only.split(",") if args.only else None
+    unknown = sorted(set(suites or ()) - set(SUITES))
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    report = run(suites, quick=args.quick)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, metric in report["metrics"].items():
+            print(
+                f"{name:>24}: {metric['value']:14.2f} {metric['unit']:<4} ({metric['better']} is better)"
+            )
+    if not args.compare:
+        return 0
+
+    with open(args.compare, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    if baseline["meta"].get("sizes") != report["meta"]["sizes"]:
+        print(
+            f"warning: baseline used {baseline['meta'].get('sizes')} sizes, this run {report['meta']['sizes']}",
+            file=sys.stderr,
+        )
+    regressions = compare(report, baseline, args.tolerance)
+    for r in regressions:
+        print(
+            f"REGRESSION {r['metric']}: {r['baseline']:.2f} -> {r['current']:.2f} "
+            f"({r['worse_by']:+.0%} worse, tolerance {r['tolerance']:.0%})"
+        )
+    print("OK" if not regressions else f"{len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Startup benchmark: import time of src.sovereign_core in a fresh interpreter plus
+cold and warm ZKVSNodePrime() construction, checked against a budget.
+
+    python -m benchmarks.bench_startup [--runs N] [--json]
+
+Exits with status 1 when a median exceeds its budget or an import-time-deferred
+module (asyncio, concurrent.futures, json, numpy, or the Praetorian layers, Dagger
+agents and data moat) is loaded by import or construction.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Budgets leave headroom over current numbers (~35 ms import, ~0.2 ms construction).
+BUDGETS = {"import_ms": 100.0, "construct_cold_us": 2000.0, "construct_warm_us": 1000.0}
+DEFERRED_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "json",
+    "numpy",
+    "src.praetorian_layers",
+    "src.dagger_agents",
+    "src.data_moat",
+)
+
+# json is imported only after measuring, since it is one of the deferred modules.
+_CHILD = """
+import sys, time
+t0 = time.perf_counter()
+from src.sovereign_core import ZKVSNodePrime
+t1 = time.perf_counter()
+ZKVSNodePrime()
+t2 = time.perf_counter()
+deferred = [m for m in {deferred!r} if m in sys.modules]
+import json
+print(json.dumps({{"import_ms": (t1 - t0) * 1e3, "construct_cold_us": (t2 - t1) * 1e6, "deferred_loaded": deferred}}))
+"""
+
+
+def measure_cold(runs: int) -> Dict[str, Any]:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(deferred=DEFERRED_MODULES)],
+            cwd=PACKAGE_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(out.stdout))
+    return {
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "construct_cold_us": statistics.median(s["construct_cold_us"] for s in samples),
+        "deferred_loaded": sorted({m for s in samples for m in s["deferred_loaded"]}),
+    }
+
+
+def measure_warm(runs: int) -> float:
+    if PACKAGE_ROOT not in sys.path:
+        sys.path.insert(0, PACKAGE_ROOT)
+    from src.sovereign_core import ZKVSNodePrime
+
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        ZKVSNodePrime()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def run(runs: int = 5, warm_runs: int = 200) -> Dict[str, Any]:
+    report = measure_cold(runs)
+    report["construct_warm_us"] = measure_warm(warm_runs)
+    report["budgets"] = dict(BUDGETS)
+    report["over_budget"] = [name for name, limit in BUDGETS.items() if report[name] > limit]
+    report["ok"] = not report["over_budget"] and not report["deferred_loaded"]
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Import and construction time budget for ZKVSNodePrime."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+    report = run(args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, limit in BUDGETS.items():
+            print(f"{name:>18}: {report[name]:10.2f}  (budget {limit:g})")
+        print(f"{'deferred loaded':>18}: {', '.join(report['deferred_loaded']) or 'none'}")
+        print("OK" if report["ok"] else "OVER BUDGET")
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
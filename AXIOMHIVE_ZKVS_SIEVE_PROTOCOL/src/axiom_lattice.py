@@ -1,33 +1,190 @@
+import time
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterator, Optional, Tuple
+
+from src.intent_router import PatternMatcher
+from src.text_pipeline import head_words
+
+
+class AxiomSnapshot(Mapping):
+    """Immutable, versioned axiom weights; new weights are new snapshots, never in-place edits."""
+    __slots__ = ("_values", "version", "fingerprint")
+    def __init__(self, values, version: int = 0):
+        self._values = MappingProxyType(dict(values))
+        self.version = version
+        # Sorted items, computed once; the agent result cache keys on it.
+        self.fingerprint: Tuple[Tuple[str, Any], ...] = tuple(sorted(self._values.items()))
+    def __getitem__(self, key):
+        return self._values[key]
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+    def __len__(self) -> int:
+        return len(self._values)
+    def __reduce__(self):
+        return (AxiomSnapshot, (dict(self._values), self.version))
+    def __repr__(self) -> str:
+        return f"AxiomSnapshot(v{self.version}, {dict(self._values)!r})"
+    def derive(self, updates) -> "AxiomSnapshot":
+        return AxiomSnapshot({**self._values, **dict(updates)}, self.version + 1)
+    def scaled(self, factor: float) -> "AxiomSnapshot":
+        return self.derive({k: v * factor for k, v in self._values.items()})
+    def changed_keys(self, other: Mapping) -> FrozenSet[str]:
+        keys = set(self._values) | set(other)
+        return frozenset(k for k in keys if self._values.get(k) != other.get(k))
+
+class AxiomState(Mapping):
+    """
+    The node's current AxiomSnapshot behind a single pointer. Subsystems hold the state
+    and read through it, so applying new weights is one reference swap, not a rebuild.
+    """
+    __slots__ = ("snapshot",)
+    def __init__(self, snapshot: AxiomSnapshot):
+        self.snapshot = snapshot
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+    @property
+    def fingerprint(self) -> Tuple[Tuple[str, Any], ...]:
+        return self.snapshot.fingerprint
+    def __getitem__(self, key):
+        return self.snapshot._values[key]
+    def get(self, key, default=None):
+        return self.snapshot._values.get(key, default)
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot._values)
+    def __len__(self) -> int:
+        return len(self.snapshot._values)
+    def __repr__(self) -> str:
+        return f"AxiomState({self.snapshot!r})"
+    def swap(self, snapshot: AxiomSnapshot) -> FrozenSet[str]:
+        """Installs `snapshot` and returns the axiom names whose values changed."""
+        changed = self.snapshot.changed_keys(snapshot)
+        self.snapshot = snapshot
+        return changed
+
 class AxiomEnforcement:
-    def __init__(self, axioms):
+    BANNED_TERMS = ("shell_level", "destruction", "harmful_intent")
+    def __init__(self, axioms, banned_terms: Optional[PatternMatcher] = None):
         self._axioms = axioms
+        self.banned_terms = banned_terms if banned_terms is not None else PatternMatcher(self.BANNED_TERMS)
+    def register_banned_term(self, term: str) -> None:
+        self.banned_terms.add(term)
     def validate_ethical_and_safety(self, output: str) -> bool:
-        if any(bad in output for bad in ("shell_level", "destruction", "harmful_intent")):
+        if self.banned_terms.search(output):
             return False
         if self._axioms.get("SOVEREIGNTY") != 1.0:
             return False
         return True
     def densify_output(self, output: str) -> str:
-        words = output.split()
-        return " ".join(words[:10]) + "..." if len(words) > 10 else output
+        return head_words(output, 10)
+
+class LedgerCounters:
+    """Running per-level counters over ledger entries; O(1) per observed entry."""
+    def __init__(self, window_seconds: float = 60.0):
+        self.total = 0
+        self.by_level: Dict[str, int] = {}
+        self.first_timestamp: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+        self.window_seconds = window_seconds
+        self._window: Deque[Tuple[float, str]] = deque()
+        self._window_by_level: Dict[str, int] = {}
+    def observe(self, entry) -> None:
+        timestamp = entry["timestamp"]
+        level = entry.get("level") or "INFO"
+        self.total += 1
+        self.by_level[level] = self.by_level.get(level, 0) + 1
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        self._window.append((timestamp, level))
+        self._window_by_level[level] = self._window_by_level.get(level, 0) + 1
+        self._expire(timestamp)
+    def _expire(self, now: float) -> None:
+        horizon = now - self.window_seconds
+        while self._window and self._window[0][0] < horizon:
+            _, level = self._window.popleft()
+            self._window_by_level[level] -= 1
+    def error_rate(self) -> float:
+        return self.by_level.get("CRITICAL", 0) / self.total if self.total else 0.0
+    def windowed_rates(self, now: Optional[float] = None) -> Dict[str, float]:
+        self._expire(time.time() if now is None else now)
+        in_window = len(self._window)
+        rates = {f"{level}_per_second": count / self.window_seconds for level, count in self._window_by_level.items() if count}
+        rates["events_per_second"] = in_window / self.window_seconds
+        rates["error_rate"] = self._window_by_level.get("CRITICAL", 0) / in_window if in_window else 0.0
+        return rates
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "by_level": dict(self.by_level),
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+        }
 
 class TrustMetricsEngine:
-    def __init__(self, axioms):
+    # Reported until a measured figure exists (uninstrumented node, or before the first mandate finishes).
+    NOMINAL_LATENCY = 0.0008
+    def __init__(
+        self,
+        axioms,
+        incremental: bool = False,
+        counters: Optional[LedgerCounters] = None,
+        latency: Optional[Callable[[], Optional[float]]] = None,
+        source=None,
+    ):
         self._axioms = axioms
         self._trust_threshold = 0.99
-    def evaluate_all_metrics(self, verifiable_ledger):
-        import time
+        self._latency = latency
+        # With a `source` ledger the counters are rescanned from it on first use, so a node
+        # resuming a long log decodes nothing up front. Until then observe() is a no-op:
+        # every observed entry has already been appended to the source.
+        self._source = source if counters is None else None
+        if counters is None and incremental and source is None:
+            counters = LedgerCounters()
+        self._counters = counters
+    @property
+    def counters(self) -> Optional[LedgerCounters]:
+        if self._counters is None and self._source is not None:
+            self._counters = self.rescan(self._source)
+            self._source = None
+        return self._counters
+    @property
+    def incremental(self) -> bool:
+        return self._counters is not None or self._source is not None
+    def observe(self, entry) -> None:
+        if self._counters is not None:
+            self._counters.observe(entry)
+    @staticmethod
+    def rescan(verifiable_ledger) -> LedgerCounters:
+        counters = LedgerCounters()
+        for entry in verifiable_ledger:
+            counters.observe(entry)
+        return counters
+    def latency(self) -> float:
+        measured = self._latency() if self._latency is not None else None
+        return self.NOMINAL_LATENCY if measured is None else measured
+    def evaluate_all_metrics(self, verifiable_ledger=None):
+        # Incremental mode answers from running counters; the ledger argument is only scanned otherwise.
+        counters = self.counters if self.counters is not None else self.rescan(verifiable_ledger or ())
         metrics = {
             "SaliencyMapRobustness": 1.0006,
-            "Uptime": (time.time() - verifiable_ledger[0]["timestamp"]) if verifiable_ledger else 0.0,
-            "ErrorRate": sum(1 for e in verifiable_ledger if e.get("level") == "CRITICAL") / len(verifiable_ledger) if verifiable_ledger else 0.0,
-            "Latency": 0.0008,
+            "Uptime": (time.time() - counters.first_timestamp) if counters.first_timestamp is not None else 0.0,
+            "ErrorRate": counters.error_rate(),
+            "Latency": self.latency(),
             "MembershipInferenceScore": 0.999,
             "GroupFairnessMetrics": 0.995,
             "ExplainabilityScore": 0.98,
             "ModelAccountabilityIndex": float(self._axioms.get("SHARPEN", 1.0)) ** 3
         }
         return metrics
+    def check_consistency(self, verifiable_ledger) -> bool:
+        if self.counters is None:
+            return True
+        return self.counters.snapshot() == self.rescan(verifiable_ledger).snapshot()
     def is_system_trustworthy(self, metrics):
         overall_score = sum(metrics.values()) / float(len(metrics))
         return overall_score >= self._trust_threshold
@@ -2,33 +2,454 @@
 AxiomShards-Catalyst: ToST-linear (Token-Oriented Stream Transformer)
 Performs linear memory/statistics streaming transformation for token-processing tasks.
 Optimizes out quadratic attention and is RAM-proof (no large buffers; O(N)).
+Bounded-memory sketches (KLL quantiles, HyperLogLog cardinality, count-min heavy
+hitters) sit alongside ToSTLinear; each merges exactly and serializes compactly.
 """
-from typing import List, Callable, Any
+import hashlib
+import math
+import random
+import struct
+import zlib
+from array import array
+from operator import mul
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.lazy_import import optional_import
+
+# Optional acceleration for update_many, imported on first use; the pure-Python path is always available.
+np = optional_import("numpy")
+
+_CRC_SCALE = 1.0 / 2**32
+
+
+def stable_feature(sample: Any) -> float:
+    """Deterministic feature in [0, 1): CRC-32 of str(sample), independent of PYTHONHASHSEED."""
+    return zlib.crc32(str(sample).encode()) * _CRC_SCALE
+
 
 class ToSTLinear:
-    def __init__(self, feature_fn: Callable[[Any], float] = None):
-        self.feature_fn = feature_fn or (lambda x: float(hash(str(x))) % 1)
+    def __init__(self, feature_fn: Optional[Callable[[Any], float]] = None):
+        self.feature_fn = feature_fn or stable_feature
         self.stats_sum = 0.0
         self.count = 0
         self.max = float('-inf')
         self.min = float('inf')
+        # Welford running mean / sum of squared deviations.
+        self._mean = 0.0
+        self._m2 = 0.0
 
     def update(self, sample: Any):
         feat = self.feature_fn(sample)
         self.stats_sum += feat
         self.count += 1
+        delta = feat - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (feat - self._mean)
         self.max = max(self.max, feat)
         self.min = min(self.min, feat)
 
+    def _absorb(self, n: int, total: float, mean: float, m2: float, lo: float, hi: float):  # noqa: PLR0913
+        # Chan et al. pairwise combination of (count, mean, M2) moments.
+        if n == 0:
+            return
+        combined = self.count + n
+        delta = mean - self._mean
+        self._mean += delta * n / combined
+        self._m2 += m2 + delta * delta * self.count * n / combined
+        self.count = combined
+        self.stats_sum += total
+        self.max = max(self.max, hi)
+        self.min = min(self.min, lo)
+
+    def update_many(self, samples: Iterable[Any]):
+        """Batch equivalent of calling update() per sample, without per-token Python arithmetic."""
+        if self.feature_fn is stable_feature:
+            # Work on the raw CRC integers: sums of ints and squares are exact, then rescale once.
+            raw = list(map(zlib.crc32, map(str.encode, map(str, samples))))
+            n = len(raw)
+            if not n:
+                return
+            raw_total, squares = sum(raw), sum(map(mul, raw, raw))
+            m2 = (n * squares - raw_total * raw_total) / n * _CRC_SCALE * _CRC_SCALE
+            total = raw_total * _CRC_SCALE
+            self._absorb(n, total, total / n, m2, min(raw) * _CRC_SCALE, max(raw) * _CRC_SCALE)
+            return
+        feats = list(map(self.feature_fn, samples))
+        n = len(feats)
+        if not n:
+            return
+        if np is not None:
+            buf = np.asarray(feats, dtype=float)
+            mean = float(buf.mean())
+            self._absorb(n, float(buf.sum()), mean, float(((buf - mean) ** 2).sum()), float(buf.min()), float(buf.max()))
+            return
+        total = math.fsum(feats)
+        mean = total / n
+        self._absorb(n, total, mean, math.fsum((f - mean) ** 2 for f in feats), min(feats), max(feats))
+
+    def merge(self, other: "ToSTLinear") -> "ToSTLinear":
+        """Folds another instance's statistics into this one, as if its samples had been seen here."""
+        self._absorb(other.count, other.stats_sum, other._mean, other._m2, other.min, other.max)
+        return self
+
     def mean(self) -> float:
         if self.count == 0:
             return 0.0
         return self.stats_sum / self.count
 
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
     def get_stats(self):
         return {
             'mean': self.mean(),
             'count': self.count,
             'max': self.max,
-            'min': self.min
+            'min': self.min,
+            'variance': self.variance(),
         }
+
+
+def hash64(item: Any) -> int:
+    """Deterministic 64-bit hash shared by the cardinality and frequency sketches."""
+    return int.from_bytes(hashlib.blake2b(str(item).encode(), digest_size=8).digest(), "little")
+
+
+class KLLSketch:
+    """KLL quantile sketch (Karnin-Lang-Liberty): O(k) floats for rank error ~1/k."""
+
+    _HEADER = struct.Struct("<IdQQ")
+    MIN_K = 8
+
+    def __init__(self, k: int = 200, c: float = 2.0 / 3.0, seed: int = 0):
+        if k < self.MIN_K:
+            raise ValueError(f"KLLSketch k must be at least {self.MIN_K}.")
+        self.k = k
+        self.c = c
+        self.count = 0
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._compactors: List[List[float]] = []
+        self._size = 0
+        self._max_size = 0
+        self._grow()
+
+    def _grow(self):
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self._compactors) - height - 1
+        return int(math.ceil(self.c**depth * self.k)) + 1
+
+    def update(self, value: float):
+        self._compactors[0].append(float(value))
+        self._size += 1
+        self.count += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def update_many(self, values: Iterable[float]):
+        for value in values:
+            self.update(value)
+
+    def _compress(self):
+        for h in range(len(self._compactors)):
+            level = self._compactors[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 >= len(self._compactors):
+                    self._grow()
+                # Keep every other sorted item (random offset) and promote it with doubled weight.
+                level.sort()
+                keep_last = len(level) % 2
+                tail = level.pop() if keep_last else None
+                self._compactors[h + 1].extend(level[self._rng.randint(0, 1) :: 2])
+                level.clear()
+                if tail is not None:
+                    level.append(tail)
+                self._size = sum(len(c) for c in self._compactors)
+                if self._size < self._max_size:
+                    break
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for h, level in enumerate(other._compactors):
+            self._compactors[h].extend(level)
+        self.count += other.count
+        self._size = sum(len(c) for c in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted(self) -> List[Tuple[float, int]]:
+        return sorted((v, 1 << h) for h, level in enumerate(self._compactors) for v in level)
+
+    def quantiles(self, *qs: float) -> List[float]:
+        """Several quantiles from a single sort of the retained (value, weight) pairs."""
+        if any(not 0.0 <= q <= 1.0 for q in qs):
+            raise ValueError("quantile q must be in [0, 1].")
+        items = self._weighted()
+        if not items:
+            return [float("nan")] * len(qs)
+        total = sum(w for _, w in items)
+        results = []
+        for q in qs:
+            target, running = q * total, 0
+            chosen = items[-1][0]
+            for value, weight in items:
+                running += weight
+                if running >= target:
+                    chosen = value
+                    break
+            results.append(chosen)
+        return results
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles(q)[0]
+
+    def frozen(self) -> "KLLSketch":
+        """Read-only copy of the retained items (for quantiles later); it cannot take updates."""
+        copy = KLLSketch.__new__(KLLSketch)
+        copy.k, copy.c, copy.count = self.k, self.c, self.count
+        copy._compactors = [list(level) for level in self._compactors]
+        return copy
+
+    def to_bytes(self) -> bytes:
+        parts = [self._HEADER.pack(self.k, self.c, self.count, self._seed), struct.pack("<I", len(self._compactors))]
+        for level in self._compactors:
+            parts.append(struct.pack("<I", len(level)))
+            parts.append(array("d", level).tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "KLLSketch":
+        k, c, count, seed = cls._HEADER.unpack_from(data, 0)
+        sketch = cls(k, c, seed)
+        offset = cls._HEADER.size
+        (levels,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        sketch._compactors = []
+        for _ in range(levels):
+            (n,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            sketch._compactors.append(array("d", data[offset : offset + 8 * n]).tolist())
+            offset += 8 * n
+        sketch._max_size = sum(sketch._capacity(h) for h in range(levels))
+        sketch._size = sum(len(level) for level in sketch._compactors)
+        sketch.count = count
+        return sketch
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter: 2**p one-byte registers, ~1.04/sqrt(2**p) relative error."""
+
+    MIN_P, MAX_P = 4, 16
+
+    def __init__(self, p: int = 12):
+        if not self.MIN_P <= p <= self.MAX_P:
+            raise ValueError(f"HyperLogLog precision p must be between {self.MIN_P} and {self.MAX_P}.")
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+        # All-zero registers: each contributes 2**0 to the harmonic sum.
+        self._inverse_sum = float(self.m)
+        self._zeros = self.m
+
+    def _reset_summary(self):
+        # Running harmonic sum and zero count keep estimate() O(1).
+        self._inverse_sum = math.fsum(2.0 ** -r for r in self.registers)
+        self._zeros = self.registers.count(0)
+
+    def add_hash(self, h: int):
+        index = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        old = self.registers[index]
+        if rank > old:
+            self.registers[index] = rank
+            self._inverse_sum += 2.0 ** -rank - 2.0 ** -old
+            if old == 0:
+                self._zeros -= 1
+
+    def add(self, item: Any):
+        self.add_hash(hash64(item))
+
+    def estimate(self) -> float:
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / self._inverse_sum
+        if raw <= 2.5 * m and self._zeros:
+            return m * math.log(m / self._zeros)
+        return raw
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        self._reset_summary()
+        return self
+
+    def to_bytes(self) -> bytes:
+        return bytes((self.p,)) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        sketch = cls(data[0])
+        sketch.registers = bytearray(data[1 : 1 + sketch.m])
+        sketch._reset_summary()
+        return sketch
+
+
+class CountMinSketch:
+    """Count-min frequency sketch with a small candidate set for top-k heavy hitters."""
+
+    _HEADER = struct.Struct("<IIIQ")
+
+    def __init__(self, width: int = 1024, depth: int = 4, top_k: int = 10):
+        if width <= 0 or depth <= 0:
+            raise ValueError("CountMinSketch width and depth must be positive.")
+        self.width = width
+        self.depth = depth
+        self.top_k = top_k
+        self.total = 0
+        self.table = array("Q", bytes(8 * width * depth))
+        self._candidates: Dict[str, int] = {}
+
+    def _cells(self, h: int) -> List[int]:
+        # Kirsch-Mitzenmacher double hashing derives `depth` row hashes from one 64-bit hash.
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, item: Any, count: int = 1, h: Optional[int] = None):
+        cells = self._cells(hash64(item) if h is None else h)
+        table = self.table
+        for cell in cells:
+            table[cell] += count
+        self.total += count
+        if self.top_k:
+            self._offer(str(item), min(table[cell] for cell in cells))
+
+    def _offer(self, key: str, estimate: int):
+        candidates = self._candidates
+        if key in candidates or len(candidates) < self.top_k:
+            candidates[key] = estimate
+            return
+        weakest = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[weakest]:
+            del candidates[weakest]
+            candidates[key] = estimate
+
+    def estimate(self, item: Any) -> int:
+        return min(self.table[cell] for cell in self._cells(hash64(item)))
+
+    def heavy_hitters(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        ranked = sorted(self._candidates.items(), key=lambda kv: (-kv[1], kv[0]))
+        return ranked[: self.top_k if n is None else n]
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge CountMinSketch instances of different shape.")
+        self.table = array("Q", map(sum, zip(self.table, other.table)))
+        self.total += other.total
+        pool = set(self._candidates) | set(other._candidates)
+        self._candidates = {}
+        for key in pool:
+            self._offer(key, self.estimate(key))
+        return self
+
+    def to_bytes(self) -> bytes:
+        keys = [key.encode() for key in self._candidates]
+        parts = [self._HEADER.pack(self.width, self.depth, self.top_k, self.total), self.table.tobytes()]
+        parts.append(struct.pack("<I", len(keys)))
+        parts.extend(struct.pack("<I", len(key)) + key for key in keys)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CountMinSketch":
+        width, depth, top_k, total = cls._HEADER.unpack_from(data, 0)
+        sketch = cls(width, depth, top_k)
+        offset = cls._HEADER.size
+        size = 8 * width * depth
+        sketch.table = array("Q", data[offset : offset + size])
+        sketch.total = total
+        offset += size
+        (n,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        for _ in range(n):
+            (length,) = struct.unpack_from("<I", data, offset)
+            key = data[offset + 4 : offset + 4 + length].decode()
+            offset += 4 + length
+            sketch._candidates[key] = sketch.estimate(key)
+        return sketch
+
+
+class TokenSketches:
+    """Per-node token sketches: length quantiles, distinct tokens and heavy-hitter tokens."""
+
+    def __init__(self, k: int = 200, hll_precision: int = 12, cms_width: int = 1024, cms_depth: int = 4, top_k: int = 10):
+        self.lengths = KLLSketch(k)
+        self.distinct = HyperLogLog(hll_precision)
+        self.frequent = CountMinSketch(cms_width, cms_depth, top_k)
+
+    def update_many(self, tokens: Iterable[str]):
+        for token in tokens:
+            h = hash64(token)
+            self.lengths.update(len(token))
+            self.distinct.add_hash(h)
+            self.frequent.add(token, h=h)
+
+    def merge(self, other: "TokenSketches") -> "TokenSketches":
+        self.lengths.merge(other.lengths)
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        return self
+
+    def to_bytes(self) -> bytes:
+        blobs = [self.lengths.to_bytes(), self.distinct.to_bytes(), self.frequent.to_bytes()]
+        return b"".join(struct.pack("<I", len(blob)) + blob for blob in blobs)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TokenSketches":
+        blobs, offset = [], 0
+        for _ in range(3):
+            (length,) = struct.unpack_from("<I", data, offset)
+            blobs.append(data[offset + 4 : offset + 4 + length])
+            offset += 4 + length
+        sketches = cls.__new__(cls)
+        sketches.lengths = KLLSketch.from_bytes(blobs[0])
+        sketches.distinct = HyperLogLog.from_bytes(blobs[1])
+        sketches.frequent = CountMinSketch.from_bytes(blobs[2])
+        return sketches
+
+    def get_stats(self, include_tokens: bool = False):
+        """
+        Aggregate token statistics. The sketches span every mandate the node has seen, so the
+        heavy-hitter tokens themselves are only listed when `include_tokens` asks for them.
+        """
+        hitters = self.frequent.heavy_hitters(3) if self.lengths.count else []
+        stats = {'len_p50': 0.0, 'len_p99': 0.0, 'distinct': 0, 'top_counts': [count for _, count in hitters]}
+        if self.lengths.count:
+            stats['len_p50'], stats['len_p99'] = self.lengths.quantiles(0.5, 0.99)
+            stats['distinct'] = round(self.distinct.estimate())
+        if include_tokens:
+            stats['heavy_hitters'] = hitters
+        return stats
+
+    def snapshot(self) -> Callable[[], Dict[str, Any]]:
+        """
+        get_stats() as of now, for a result read later. The distinct and top counts are taken
+        here (both cheap); the length quantiles sort a copy of the KLL items only when called.
+        """
+        if not self.lengths.count:
+            empty = self.get_stats()
+            return lambda: dict(empty)
+        lengths = self.lengths.frozen()
+        distinct = round(self.distinct.estimate())
+        top_counts = [count for _, count in self.frequent.heavy_hitters(3)]
+
+        def stats() -> Dict[str, Any]:
+            p50, p99 = lengths.quantiles(0.5, 0.99)
+            return {'len_p50': p50, 'len_p99': p99, 'distinct': distinct, 'top_counts': list(top_counts)}
+
+        return stats
@@ -1,17 +1,122 @@
-import sys
 import json
+import os
+import sys
+from collections import deque
+
+from src.mandate_result import ERROR, MandateResult
 from src.sovereign_core import ZKVSNodePrime
 
-def main():
+# Client mode is used whenever an address is given (flag or environment).
+ADDRESS_ENV = "AXIOMHIVE_ZKVS_ADDRESS"
+
+def read_frameworks(stream):
+    # Yields (framework, None), or (None, error) for a line that is not a JSON object.
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            framework = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield None, f"line {number}: invalid JSON ({e})"
+            continue
+        if not isinstance(framework, dict):
+            yield None, f"line {number}: expected a JSON object, got {type(framework).__name__}"
+            continue
+        yield framework, None
+
+def in_order(records, execute):
+    # `execute` streams one output per framework, in order; errors are slotted back in between.
+    order = deque()
+    def frameworks():
+        for framework, error in records:
+            order.append(error)
+            if error is None:
+                yield framework
+    for output in execute(frameworks()):
+        while order[0] is not None:
+            yield None, order.popleft()
+        order.popleft()
+        yield output, None
+    for error in order:
+        if error is not None:
+            yield None, error
+
+def print_error(error, as_json):
+    result = MandateResult(ERROR, message=error)
+    print(result.to_json() if as_json else result)
+
+def serve(argv):
     import argparse
+
+    from src.node_server import NodeServer
+    parser = argparse.ArgumentParser(prog="cli.py serve", description="Run a persistent ZKVSNodePrime daemon.")
+    parser.add_argument('--listen', type=str, required=True, help='unix:/path/node.sock or host:port')
+    parser.add_argument('--ledger', type=str, default=None, help='Persist the ledger to this LedgerLog path')
+    parser.add_argument('--instrument', action='store_true', help='Record per-stage latency histograms (op "metrics" / "stats")')
+    args = parser.parse_args(argv)
+    server = NodeServer(args.listen, ledger_path=args.ledger, instrument=args.instrument)
+    print(f"Serving ZKVSNodePrime on {args.listen}", file=sys.stderr)
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        server.node.close()
+    except FileExistsError as e:
+        server.node.close()
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+def run_remote(address, records, as_json):
+    from src.node_server import request_lines
+    status = 0
+    def send(frameworks):
+        return request_lines(address, ({"op": "mandate", "framework": f, "structured": as_json} for f in frameworks))
+    for response, error in in_order(records, send):
+        if error is not None:
+            print_error(error, as_json)
+            status = 1
+            continue
+        if not response.get("ok"):
+            print(response.get("error"), file=sys.stderr)
+            status = 1
+            continue
+        result = response["result"]
+        # Re-encode through MandateResult so remote JSONL is byte-for-byte the local to_json().
+        print(MandateResult.from_dict(result).to_json() if as_json else result)
+    return status
+
+def run_local(records, as_json):
+    node = ZKVSNodePrime()
+    status = 0
+    try:
+        for result, error in in_order(records, lambda frameworks: node.execute_mandates(frameworks, structured=True)):
+            if error is not None:
+                print_error(error, as_json)
+                status = 1
+                continue
+            print(result.to_json() if as_json else result)
+    finally:
+        node.close()
+    return status
+
+def main(argv=None):
+    import argparse
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "serve":
+        return serve(argv[1:])
     parser = argparse.ArgumentParser(description="Run AXIOMHIVE ZKVSNodePrime mandate.")
-    parser.add_argument('--intent', type=str, required=True, help='User intent string')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--intent', type=str, help='User intent string')
+    source.add_argument('--batch', action='store_true', help='Read frameworks as JSONL from stdin; print one JSON result per line')
     parser.add_argument('--context', type=str, default='', help='Context for mandate')
-    args = parser.parse_args()
-    framework = {"intent": args.intent, "context": args.context}
-    node = ZKVSNodePrime()
-    result = node.execute_mandate(framework)
-    print(result)
+    parser.add_argument('--connect', type=str, default=os.environ.get(ADDRESS_ENV), help=f'Send mandates to a running `serve` daemon (default: ${ADDRESS_ENV})')
+    parser.add_argument('--json', action='store_true', help='Print structured JSON results instead of the report text')
+    args = parser.parse_args(argv)
+    as_json = args.json or args.batch
+    records = read_frameworks(sys.stdin) if args.batch else [({"intent": args.intent, "context": args.context}, None)]
+    if args.connect:
+        return run_remote(args.connect, records, as_json)
+    return run_local(records, as_json)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
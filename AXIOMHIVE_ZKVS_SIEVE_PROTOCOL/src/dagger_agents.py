@@ -1,3 +1,17 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Tuple
+
+from src.digest import canonical_bytes, sha256_hex
+from src.lazy_import import lazy_import
+from src.profiling import active_hooks, call_hooked, call_hooked_async
+from src.text_pipeline import drop_stopwords, tokens_of
+
+asyncio = lazy_import("asyncio")
+json = lazy_import("json")
+
 class DaggerAgentUtils:
     @staticmethod
     def validate_result_integrity(result):
@@ -8,57 +22,208 @@ class DaggerAgentUtils:
         return True
 
     @staticmethod
-    def densify_text(text: str, density_axiom_value: float) -> str:
+    def densify_text(text: str, density_axiom_value: float, max_chars=None) -> str:
+        # max_chars lets callers that truncate the result stop filtering early.
         if density_axiom_value == 1.0:
-            words = text.split()
-            filtered_words = [w for w in words if len(w) > 2 and w.lower() not in ["a", "an", "the", "is", "are", "and", "or"]]
-            return " ".join(filtered_words)
+            return drop_stopwords(tokens_of(text), max_chars)
         return text
 
+    # Digests of payloads at least this large are computed off the event loop.
+    ASYNC_HASH_OFFLOAD_BYTES = 64 * 1024
+
+    @staticmethod
+    async def sha256_hex_async(data: bytes) -> str:
+        if len(data) >= DaggerAgentUtils.ASYNC_HASH_OFFLOAD_BYTES:
+            return await asyncio.to_thread(lambda: hashlib.sha256(data).hexdigest())
+        return hashlib.sha256(data).hexdigest()
+
     @staticmethod
     def generate_deterministic_hash(data):
-        import hashlib
-        return hashlib.sha256(str(data).encode()).hexdigest()
+        return sha256_hex(data)
+
+class AgentRegistry(MutableMapping):
+    """Name -> DaggerAgent mapping; each agent is constructed on its first lookup."""
+    def __init__(self, factories, axioms, cache=None):
+        self._factories = dict(factories)
+        self._axioms = axioms
+        self._cache = cache
+        self._agents = {}
+        self._lock = threading.Lock()
+    @property
+    def built(self) -> tuple:
+        return tuple(self._agents)
+    def __getitem__(self, name):
+        agent = self._agents.get(name)
+        if agent is None:
+            factory = self._factories[name]
+            with self._lock:
+                agent = self._agents.get(name)
+                if agent is None:
+                    agent = self._agents[name] = factory(self._axioms, self._cache)
+        return agent
+    def __setitem__(self, name, agent):
+        # Ready-made agents are stored as-is; a factory slot keeps the name iterable.
+        with self._lock:
+            self._agents[name] = agent
+            self._factories.setdefault(name, None)
+    def __delitem__(self, name):
+        with self._lock:
+            del self._factories[name]
+            self._agents.pop(name, None)
+    def __iter__(self):
+        return iter(self._factories)
+    def __len__(self):
+        return len(self._factories)
+    def __repr__(self):
+        return f"AgentRegistry(agents={list(self._factories)}, built={list(self._agents)})"
+
+class AgentResultCache:
+    """LRU cache of agent results keyed by (agent name, canonical params, axiom fingerprint)."""
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("AgentResultCache maxsize must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[Tuple[Any, ...], Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+    @staticmethod
+    def canonical_params(params) -> str:
+        return json.dumps(params, sort_keys=True, separators=(",", ":"), default=repr)
+    @staticmethod
+    def axiom_fingerprint(axioms) -> tuple:
+        # Axiom snapshots carry a precomputed fingerprint; plain dicts are sorted per call.
+        fingerprint = getattr(axioms, "fingerprint", None)
+        return fingerprint if fingerprint is not None else tuple(sorted(axioms.items()))
+    def key(self, agent_name, params, axioms) -> tuple:
+        return (agent_name, self.canonical_params(params), self.axiom_fingerprint(axioms))
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(result)
+    def put(self, key, result) -> None:
+        with self._lock:
+            self._entries[key] = dict(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+    def __len__(self) -> int:
+        return len(self._entries)
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
 
 class DaggerAgent:
-    def __init__(self, name, specialization, axioms):
+    # Deterministic agents are pure functions of (params, axioms) and may be served from a result cache.
+    deterministic = False
+    def __init__(self, name, specialization, axioms, cache=None):
         self.name = name
         self.specialization = specialization
         self.status = "idle"
         self._axioms = axioms
+        self.cache = cache
+    def __getstate__(self):
+        # Caches stay with the owning process; agents shipped to a process pool run uncached.
+        state = dict(self.__dict__)
+        state["cache"] = None
+        return state
+    def _cache_key(self, task_params):
+        if self.cache is None or not self.deterministic:
+            return None
+        return self.cache.key(self.name, task_params, self._axioms)
     def execute(self, task_params):
+        hooks = active_hooks()
+        if hooks:
+            return call_hooked(hooks, f"agent:{self.name}", self._execute, task_params)
+        return self._execute(task_params)
+    def _execute(self, task_params):
+        key = self._cache_key(task_params)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        result = self._execute_uncached(task_params)
+        if key is not None:
+            self.cache.put(key, result)
+        return result
+    def _execute_uncached(self, task_params):
         self.status = "executing"
         raw_result = self._perform_task(task_params)
         if not DaggerAgentUtils.validate_result_integrity(raw_result):
             self.status = "idle"
             raise ValueError(f"Dagger Agent {self.name} detected result integrity flaw.")
-        import hashlib
-        result_hash = hashlib.sha256(str(raw_result).encode()).hexdigest()
+        result_hash = sha256_hex(raw_result)
+        self.status = "idle"
+        return {"result": raw_result, "hash": result_hash, "agent": self.name}
+    async def execute_async(self, task_params):
+        hooks = active_hooks()
+        if hooks:
+            return await call_hooked_async(hooks, f"agent:{self.name}", self._execute_async, task_params)
+        return await self._execute_async(task_params)
+    async def _execute_async(self, task_params):
+        key = self._cache_key(task_params)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        result = await self._execute_uncached_async(task_params)
+        if key is not None:
+            self.cache.put(key, result)
+        return result
+    async def _execute_uncached_async(self, task_params):
+        self.status = "executing"
+        raw_result = await self._perform_task_async(task_params)
+        if not DaggerAgentUtils.validate_result_integrity(raw_result):
+            self.status = "idle"
+            raise ValueError(f"Dagger Agent {self.name} detected result integrity flaw.")
+        result_hash = await DaggerAgentUtils.sha256_hex_async(canonical_bytes(raw_result))
         self.status = "idle"
         return {"result": raw_result, "hash": result_hash, "agent": self.name}
     def _perform_task(self, task_params):
         raise NotImplementedError
+    async def _perform_task_async(self, task_params):
+        # Agents with native async I/O override this; the default keeps _perform_task off the loop.
+        return await asyncio.to_thread(self._perform_task, task_params)
 
 class DataSieveAgent(DaggerAgent):
-    def __init__(self, axioms):
-        super().__init__("DataSieveAgent", "data_filtering", axioms)
+    deterministic = True
+    def __init__(self, axioms, cache=None):
+        super().__init__("DataSieveAgent", "data_filtering", axioms, cache)
     def _perform_task(self, task_params):
         data = task_params.get("data", "")
-        filtered_data = DaggerAgentUtils.densify_text(data, float(self._axioms.get("DENSITY", 1.0)))
+        filtered_data = DaggerAgentUtils.densify_text(data, float(self._axioms.get("DENSITY", 1.0)), max_chars=100)
         return f"Data sieved and densified: {filtered_data[:100]}..."
 
 class ZKProofAgent(DaggerAgent):
-    def __init__(self, axioms):
-        super().__init__("ZKProofAgent", "zk_computation", axioms)
+    deterministic = True
+    def __init__(self, axioms, cache=None):
+        super().__init__("ZKProofAgent", "zk_computation", axioms, cache)
     def _perform_task(self, task_params):
-        import hashlib
         input_data = task_params.get("input", "")
         proof = hashlib.sha256(input_data.encode()).hexdigest()
         return f"ZK Proof generated: {proof}"
 
 class MarketAnalysisAgent(DaggerAgent):
-    def __init__(self, axioms):
-        super().__init__("MarketAnalysisAgent", "market_intelligence", axioms)
+    deterministic = True
+    def __init__(self, axioms, cache=None):
+        super().__init__("MarketAnalysisAgent", "market_intelligence", axioms, cache)
     def _perform_task(self, task_params):
         target = task_params.get("target", "general market")
         analysis_result = (
@@ -4,8 +4,6 @@ class DynamicMoatCultivationEngine:
         self._moat_strength = 1.0
         self._model_refinement_count = 0
     def cultivate_moat(self, user_interaction_data):
-        import hashlib
-        _ = hashlib.sha256(str(user_interaction_data).encode()).hexdigest()
         if str(user_interaction_data.get("output", "")).endswith("ABSOLUTE"):
             self._moat_strength = min(2.0, self._moat_strength * 1.001)
             self._model_refinement_count += 1
@@ -0,0 +1,43 @@
+"""
+Digest: canonical payload encoding and the SHA-256 pipeline of a mandate.
+Every payload is hashed exactly once: agents digest their own result, and the
+mandate's ZK digest is chained over those agent digests (in sub-task order)
+rather than over the re-joined output text, which the digests already commit to.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+from src.lazy_import import lazy_import
+
+json = lazy_import("json")
+
+ZK_DOMAIN = b"AXIOMHIVE/ZKVS/zk-chain/v1"
+
+
+def canonical_bytes(payload: Any) -> bytes:
+    """bytes as-is, str as UTF-8, anything else as sorted compact JSON (never `str(dict)`)."""
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode()
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr
+    ).encode()
+
+
+def sha256_hex(payload: Any) -> str:
+    return hashlib.sha256(canonical_bytes(payload)).hexdigest()
+
+
+def chain_digest(digests: Iterable[bytes]) -> bytes:
+    """One incremental hasher over a domain tag and the ordered 32-byte digests."""
+    hasher = hashlib.sha256(ZK_DOMAIN)
+    for digest in digests:
+        hasher.update(digest)
+    return hasher.digest()
+
+
+def result_digests(results: Iterable[Dict[str, Any]]) -> List[bytes]:
+    """Raw digests of agent result records (`{"result", "hash", "agent"}`)."""
+    return [bytes.fromhex(r["hash"]) for r in results]
@@ -0,0 +1,143 @@
+"""
+Intent Router: multi-pattern matching for routing and safety rules.
+PatternMatcher finds every literal pattern in a single Aho-Corasick pass over the
+text once it holds AUTOMATON_MIN_PATTERNS patterns or more. Below that, testing each
+pattern with str's C substring search is faster than the pure-Python walk, so small
+rule sets deliberately fall back to the per-pattern scan. A combined `re`
+alternation loses to both at every size (benchmarks/bench_pipeline.py, "matcher"
+suite). IntentRouter maps matched keywords to Dagger sub-tasks in registration order.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+# Crossover measured by the "matcher" benchmark suite; it barely moves with text length.
+AUTOMATON_MIN_PATTERNS = 192
+
+Params = Union[Dict[str, Any], Callable[[str], Dict[str, Any]]]
+
+
+class PatternMatcher:
+    """Case-sensitive substring matcher; semantics equal `pattern in text` for every pattern.
+
+    The automaton is compiled lazily on the first large-set lookup after an add().
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._patterns: Tuple[str, ...] = ()
+        self._index: Dict[str, int] = {}
+        self._automaton: Optional[Tuple[List[Dict[str, int]], List[FrozenSet[int]]]] = None
+        self._lock = threading.Lock()
+        for pattern in patterns:
+            self.add(pattern)
+
+    @property
+    def patterns(self) -> Tuple[str, ...]:
+        return self._patterns
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: str) -> int:
+        if not pattern:
+            raise ValueError("PatternMatcher patterns must be non-empty.")
+        with self._lock:
+            if pattern in self._index:
+                return self._index[pattern]
+            self._index[pattern] = len(self._patterns)
+            # Readers scan whichever tuple they picked up; it is replaced, never mutated.
+            self._patterns = self._patterns + (pattern,)
+            self._automaton = None
+            return self._index[pattern]
+
+    def _compile(self) -> Tuple[List[Dict[str, int]], List[FrozenSet[int]]]:
+        with self._lock:
+            if self._automaton is not None:
+                return self._automaton
+            goto: List[Dict[str, int]] = [{}]
+            outputs: List[set] = [set()]
+            for pid, pattern in enumerate(self._patterns):
+                state = 0
+                for ch in pattern:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        outputs.append(set())
+                    state = nxt
+                outputs[state].add(pid)
+            # BFS over the trie turns goto + failure links into a full DFA transition table.
+            fail = [0] * len(goto)
+            delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+            queue = deque(goto[0].values())
+            while queue:
+                state = queue.popleft()
+                outputs[state] |= outputs[fail[state]]
+                delta[state] = dict(delta[fail[state]])
+                for ch, nxt in goto[state].items():
+                    fail[nxt] = delta[fail[state]].get(ch, 0)
+                    delta[state][ch] = nxt
+                    queue.append(nxt)
+            self._automaton = (delta, [frozenset(o) for o in outputs])
+            return self._automaton
+
+    def matches(self, text: str) -> FrozenSet[int]:
+        """Ids of every pattern occurring in text."""
+        patterns = self._patterns
+        if len(patterns) < AUTOMATON_MIN_PATTERNS:
+            return frozenset([pid for pid, pattern in enumerate(patterns) if pattern in text])
+        delta, outputs = self._compile()
+        state, hits = 0, set()
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            hits.add(state)
+        return frozenset().union(*[outputs[state] for state in hits])
+
+    def search(self, text: str) -> bool:
+        """True as soon as any pattern occurs in text."""
+        patterns = self._patterns
+        if len(patterns) < AUTOMATON_MIN_PATTERNS:
+            return any(pattern in text for pattern in patterns)
+        delta, outputs = self._compile()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                return True
+        return False
+
+
+class IntentRouter:
+    """Keyword -> sub-task rule table; one PatternMatcher.matches call routes an intent."""
+
+    def __init__(self) -> None:
+        self._matcher = PatternMatcher()
+        self._routes: List[Tuple[int, str, str, Params]] = []
+
+    def register_route(
+        self, keyword: str, agent_name: str, action: str, params: Optional[Params] = None
+    ) -> None:
+        """`params` is a dict (copied per route) or a callable receiving the intent."""
+        self._routes.append((self._matcher.add(keyword), agent_name, action, params or {}))
+
+    @property
+    def routes(self) -> Tuple[Tuple[str, str, str], ...]:
+        return tuple(
+            (self._matcher.patterns[pid], agent, action) for pid, agent, action, _ in self._routes
+        )
+
+    def route(self, intent: str) -> List[Dict[str, Any]]:
+        matched = self._matcher.matches(intent)
+        sub_tasks = []
+        for pid, agent_name, action, params in self._routes:
+            if pid in matched:
+                sub_tasks.append(
+                    {
+                        "agent_name": agent_name,
+                        "action": action,
+                        "params": params(intent) if callable(params) else dict(params),
+                    }
+                )
+        return sub_tasks
@@ -0,0 +1,47 @@
+"""
+Lazy Import: defers heavy standard-library and optional modules until first use.
+`lazy_import("asyncio")` returns a stand-in module whose first attribute access
+performs the real import (under the interpreter's import lock). Lookups always go
+to the real module, so monkeypatching it keeps working. Sync-only callers never
+pay for asyncio, concurrent.futures, json or NumPy at import time.
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Any, Optional
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in; attribute reads resolve against the real module, imported on demand."""
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self.__dict__.get("_module")
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_module"] = module
+        return getattr(module, attr)
+
+    @property
+    def loaded(self) -> bool:
+        return "_module" in self.__dict__
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """The module itself when it is already imported, otherwise a LazyModule."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def optional_import(name: str) -> Optional[types.ModuleType]:
+    """lazy_import for optional dependencies: None when the module is not installed."""
+    if name not in sys.modules and importlib.util.find_spec(name) is None:
+        return None
+    return lazy_import(name)
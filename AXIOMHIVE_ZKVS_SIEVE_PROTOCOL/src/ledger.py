@@ -0,0 +1,374 @@
+"""
+Verifiable Ledger: bounded, segmented event storage for ZKVSNodePrime.
+Recent events live in a hot tail of compact __slots__ records; full tails are sealed
+into immutable array-backed segments, and a pluggable retention policy evicts the
+oldest segments. The ledger is a read-only Sequence over the retained events.
+Every event digest is also a leaf of an incremental Merkle tree, so the ledger
+exposes a root plus inclusion/consistency proofs for retained events; evicting
+a segment prunes the tree nodes only its events needed.
+With a LedgerLog store attached, events are persisted as they are appended and
+sealed segments become lazy views over the memory-mapped log.
+"""
+
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.ledger_log import LedgerLog
+from src.merkle import MerkleAccumulator
+
+LEVELS: List[str] = ["INFO", "WARNING", "ERROR", "CRITICAL"]
+# Segments store level codes one byte per event.
+MAX_LEVELS = 256
+_LEVEL_CODES: Dict[str, int] = {level: code for code, level in enumerate(LEVELS)}
+
+
+def level_code(level: str) -> int:
+    code = _LEVEL_CODES.get(level)
+    if code is None:
+        if len(LEVELS) >= MAX_LEVELS:
+            raise ValueError(f"Ledger level table exhausted; cannot register '{level}'.")
+        code = len(LEVELS)
+        LEVELS.append(level)
+        _LEVEL_CODES[level] = code
+    return code
+
+
+class LedgerEvent:
+    """One ledger entry; reads like the legacy dict (`entry["level"]`, `entry.get(...)`)."""
+
+    __slots__ = ("timestamp", "message", "hash", "level")
+    FIELDS: Tuple[str, ...] = ("timestamp", "message", "hash", "level")
+
+    def __init__(self, timestamp: float, message: str, hash: str, level: str = "INFO"):
+        self.timestamp = timestamp
+        self.message = message
+        self.hash = hash
+        self.level = level
+
+    @classmethod
+    def from_entry(cls, entry: Union["LedgerEvent", Mapping]) -> "LedgerEvent":
+        if isinstance(entry, LedgerEvent):
+            return entry
+        return cls(entry["timestamp"], entry["message"], entry["hash"], entry.get("level", "INFO"))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "message": self.message,
+            "hash": self.hash,
+            "level": self.level,
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return 8 + 1 + len(self.hash) // 2 + len(self.message.encode())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LedgerEvent):
+            return all(getattr(self, f) == getattr(other, f) for f in self.FIELDS)
+        if isinstance(other, Mapping):
+            return self.as_dict() == dict(other)
+        return NotImplemented
+
+    # Mutable and compared by value, like the dicts it stands in for.
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LedgerEvent({self.as_dict()!r})"
+
+
+class LedgerSegment:
+    """Immutable run of sealed events: timestamps in array('d'), level codes and raw digests in bytes."""
+
+    __slots__ = ("start", "timestamps", "levels", "hashes", "messages", "nbytes")
+
+    def __init__(self, start: int, events: Sequence[LedgerEvent]):
+        self.start = start
+        self.timestamps = array("d", (e.timestamp for e in events))
+        self.levels = bytes(level_code(e.level) for e in events)
+        self.hashes = b"".join(bytes.fromhex(e.hash) for e in events)
+        self.messages: Tuple[str, ...] = tuple(e.message for e in events)
+        self.nbytes = (
+            self.timestamps.itemsize * len(self.timestamps)
+            + len(self.levels)
+            + len(self.hashes)
+            + sum(len(m.encode()) for m in self.messages)
+        )
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    @property
+    def first_timestamp(self) -> float:
+        return self.timestamps[0]
+
+    @property
+    def last_timestamp(self) -> float:
+        return self.timestamps[-1]
+
+    def digest(self, i: int) -> bytes:
+        return self.hashes[32 * i : 32 * (i + 1)]
+
+    def __getitem__(self, i: int) -> LedgerEvent:
+        return LedgerEvent(
+            self.timestamps[i], self.messages[i], self.digest(i).hex(), LEVELS[self.levels[i]]
+        )
+
+    def __iter__(self) -> Iterator[LedgerEvent]:
+        for i in range(len(self.messages)):
+            yield self[i]
+
+
+class LogSegment:
+    """Sealed run of events stored in a LedgerLog; records are decoded only when read."""
+
+    __slots__ = ("start", "stop", "nbytes", "_log")
+
+    def __init__(self, log: LedgerLog, start: int, stop: int):
+        self.start = start
+        self.stop = stop
+        self.nbytes = log.span_bytes(start, stop)
+        self._log = log
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @property
+    def first_timestamp(self) -> float:
+        return self._log.timestamp(self.start)
+
+    @property
+    def last_timestamp(self) -> float:
+        return self._log.timestamp(self.stop - 1)
+
+    def digest(self, i: int) -> bytes:
+        return self._log.digest(self.start + i)
+
+    def __getitem__(self, i: int) -> LedgerEvent:
+        timestamp, digest, level, message = self._log.read(self.start + i)
+        return LedgerEvent(timestamp, message, digest.hex(), level)
+
+    def __iter__(self) -> Iterator[LedgerEvent]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+Segment = Union[LedgerSegment, LogSegment]
+
+
+class RetentionPolicy:
+    """Decides whether the oldest sealed segment may be evicted; the default keeps everything."""
+
+    def should_evict(self, oldest: Segment, ledger: "VerifiableLedger") -> bool:
+        return False
+
+
+class CountRetention(RetentionPolicy):
+    def __init__(self, max_events: int):
+        if max_events < 0:
+            raise ValueError("max_events must be non-negative.")
+        self.max_events = max_events
+
+    def should_evict(self, oldest: Segment, ledger: "VerifiableLedger") -> bool:
+        return len(ledger) - len(oldest) >= self.max_events
+
+
+class AgeRetention(RetentionPolicy):
+    def __init__(self, max_age_seconds: float, clock=time.time):
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+
+    def should_evict(self, oldest: Segment, ledger: "VerifiableLedger") -> bool:
+        return oldest.last_timestamp < self._clock() - self.max_age_seconds
+
+
+class ByteRetention(RetentionPolicy):
+    def __init__(self, max_bytes: int):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self.max_bytes = max_bytes
+
+    def should_evict(self, oldest: Segment, ledger: "VerifiableLedger") -> bool:
+        return ledger.nbytes - oldest.nbytes >= self.max_bytes
+
+
+class CompositeRetention(RetentionPolicy):
+    """Evicts as soon as any member policy asks for it."""
+
+    def __init__(self, *policies: RetentionPolicy):
+        self.policies = policies
+
+    def should_evict(self, oldest: Segment, ledger: "VerifiableLedger") -> bool:
+        return any(p.should_evict(oldest, ledger) for p in self.policies)
+
+
+class VerifiableLedger(Sequence):
+    """
+    Append-only ledger exposed as a Sequence over retained events (index 0 is the
+    oldest retained event). `first_sequence` is the absolute sequence number of
+    index 0, i.e. how many events retention has evicted so far. Passing a
+    LedgerLog `store` persists every append and resumes from the events it holds.
+    """
+
+    DEFAULT_SEGMENT_SIZE = 1024
+
+    def __init__(
+        self,
+        retention: Optional[RetentionPolicy] = None,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        store: Optional[LedgerLog] = None,
+    ):
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive.")
+        self.retention = retention or RetentionPolicy()
+        self.segment_size = segment_size
+        self.store = store
+        self._segments: List[Segment] = []
+        self._segment_starts: List[int] = []
+        self._sealed_bytes = 0
+        self._hot: List[LedgerEvent] = []
+        self._hot_bytes = 0
+        self._hot_start = 0
+        self.first_sequence = 0
+        self.merkle = MerkleAccumulator()
+        if store is not None and len(store):
+            self._resume(store)
+
+    def _resume(self, store: LedgerLog) -> None:
+        # Only digests are touched up front (to rebuild the tree); bodies stay in the log.
+        self.merkle.extend(store.iter_digests())
+        for start in range(0, len(store), self.segment_size):
+            self._add_segment(LogSegment(store, start, min(start + self.segment_size, len(store))))
+        self._hot_start = len(store)
+        self.enforce_retention()
+
+    def _add_segment(self, segment: Segment) -> None:
+        self._segments.append(segment)
+        self._segment_starts.append(segment.start)
+        self._sealed_bytes += segment.nbytes
+
+    @property
+    def total_appended(self) -> int:
+        return self._hot_start + len(self._hot)
+
+    @property
+    def nbytes(self) -> int:
+        return self._sealed_bytes + self._hot_bytes
+
+    @property
+    def root(self) -> str:
+        return self.merkle.root().hex()
+
+    def root_at(self, size: int) -> str:
+        return self.merkle.root(size).hex()
+
+    def inclusion_proof(self, sequence: int, size: Optional[int] = None) -> List[bytes]:
+        return self.merkle.inclusion_proof(sequence, self.total_appended if size is None else size)
+
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> List[bytes]:
+        return self.merkle.consistency_proof(
+            old_size, self.total_appended if new_size is None else new_size
+        )
+
+    @property
+    def segments(self) -> Tuple[Segment, ...]:
+        return tuple(self._segments)
+
+    def append(self, entry: Union[LedgerEvent, Mapping]) -> LedgerEvent:
+        event = LedgerEvent.from_entry(entry)
+        digest = bytes.fromhex(event.hash)
+        self.merkle.append(digest)
+        if self.store is not None:
+            self.store.append(event.timestamp, digest, event.level, event.message)
+        self._hot.append(event)
+        self._hot_bytes += event.nbytes
+        if len(self._hot) >= self.segment_size:
+            self.seal()
+        return event
+
+    def extend(self, entries: Iterable[Union[LedgerEvent, Mapping]]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def seal(self) -> Optional[Segment]:
+        if not self._hot:
+            return None
+        stop = self._hot_start + len(self._hot)
+        segment: Segment
+        if self.store is not None:
+            segment = LogSegment(self.store, self._hot_start, stop)
+        else:
+            segment = LedgerSegment(self._hot_start, self._hot)
+        self._add_segment(segment)
+        self._hot_start = stop
+        self._hot = []
+        self._hot_bytes = 0
+        self.enforce_retention()
+        return segment
+
+    def enforce_retention(self) -> int:
+        evicted = 0
+        while self._segments and self.retention.should_evict(self._segments[0], self):
+            segment = self._segments.pop(0)
+            self._segment_starts.pop(0)
+            self._sealed_bytes -= segment.nbytes
+            self.first_sequence = segment.start + len(segment)
+            evicted += len(segment)
+        if evicted:
+            self.merkle.prune(self.first_sequence)
+        return evicted
+
+    def event_at(self, sequence: int) -> LedgerEvent:
+        """Random access by absolute sequence number."""
+        if sequence < self.first_sequence or sequence >= self.total_appended:
+            raise IndexError(f"Ledger sequence {sequence} is not retained.")
+        if sequence >= self._hot_start:
+            return self._hot[sequence - self._hot_start]
+        pos = bisect_right(self._segment_starts, sequence) - 1
+        segment = self._segments[pos]
+        return segment[sequence - segment.start]
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
+
+    def __len__(self) -> int:
+        return self.total_appended - self.first_sequence
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("ledger index out of range")
+        return self.event_at(self.first_sequence + index)
+
+    def __iter__(self) -> Iterator[LedgerEvent]:
+        for segment in self._segments:
+            yield from segment
+        yield from list(self._hot)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"VerifiableLedger(retained={len(self)}, first_sequence={self.first_sequence}, "
+            f"segments={len(self._segments)}, nbytes={self.nbytes})"
+        )
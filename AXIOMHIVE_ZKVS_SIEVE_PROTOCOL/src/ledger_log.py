@@ -0,0 +1,221 @@
+"""
+Ledger Log: append-only, length-prefixed on-disk backend for VerifiableLedger.
+Records are `<u32 payload_len><u32 crc32>` + payload, payload being
+`<f64 timestamp><32-byte digest><u8 level_len><level><message>`. Writes are
+group-committed (one fsync per window, and a timer commits a window left
+pending), existing logs are scanned and read through mmap, and a torn or
+corrupt tail is truncated on open.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+from typing import Iterator, Optional
+
+MAGIC = b"AXLEDG01"
+_HEADER = struct.Struct("<II")
+_STAMP = struct.Struct("<d")
+_DIGEST_SIZE = 32
+_MAX_LEVEL_BYTES = 255  # the level length is a u8
+_DIGEST_OFFSET = _STAMP.size
+_LEVEL_OFFSET = _DIGEST_OFFSET + _DIGEST_SIZE
+
+
+class LedgerLogError(Exception):
+    pass
+
+
+class LedgerLog:
+    def __init__(
+        self,
+        path: str,
+        commit_interval: float = 0.05,
+        commit_records: int = 512,
+        fsync: bool = True,
+    ):
+        self.path = path
+        self.commit_interval = commit_interval
+        self.commit_records = commit_records
+        self.fsync = fsync
+        self.recovered_bytes = 0
+        self.syncs = 0
+        self._offsets = array("Q")
+        self._map: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._end = self._open_existing()
+        self._fh = open(path, "ab")  # noqa: SIM115 - held open for the log's lifetime
+        if self._end == 0:
+            self._fh.write(MAGIC)
+            self._end = len(MAGIC)
+            self.sync()
+
+    def _open_existing(self) -> int:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return 0
+        with open(self.path, "r+b") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < len(MAGIC) or fh.read(len(MAGIC)) != MAGIC:
+                raise LedgerLogError(f"{self.path} is not a ledger log.")
+            end = len(MAGIC)
+            if size > end:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    end = self._scan(view, size)
+            if end < size:
+                # Torn final record (crash mid-write): drop the partial tail.
+                self.recovered_bytes = size - end
+                fh.truncate(end)
+                fh.flush()
+                os.fsync(fh.fileno())
+        return end
+
+    def _scan(self, view: mmap.mmap, size: int) -> int:
+        offset = len(MAGIC)
+        buf = memoryview(view)
+        try:
+            while offset + _HEADER.size <= size:
+                length, crc = _HEADER.unpack_from(view, offset)
+                body = offset + _HEADER.size
+                if length < _LEVEL_OFFSET + 1 or body + length > size:
+                    break
+                if zlib.crc32(buf[body : body + length]) != crc:
+                    break
+                self._offsets.append(offset)
+                offset = body + length
+        finally:
+            buf.release()
+        return offset
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __enter__(self) -> "LedgerLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def encode(timestamp: float, digest: bytes, level: str, message: str) -> bytes:
+        level_raw = level.encode()
+        if len(digest) != _DIGEST_SIZE or len(level_raw) > _MAX_LEVEL_BYTES:
+            raise LedgerLogError(
+                "Ledger records need a 32-byte digest and a level under 256 bytes."
+            )
+        payload = b"".join(
+            (_STAMP.pack(timestamp), digest, bytes((len(level_raw),)), level_raw, message.encode())
+        )
+        return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def append(self, timestamp: float, digest: bytes, level: str, message: str) -> int:
+        record = self.encode(timestamp, digest, level, message)
+        with self._lock:
+            self._fh.write(record)
+            self._offsets.append(self._end)
+            self._end += len(record)
+            self._pending += 1
+            elapsed = time.monotonic() - self._last_commit
+            if self._pending >= self.commit_records or elapsed >= self.commit_interval:
+                self._commit()
+            elif self._timer is None:
+                # No further append may come, so a timer bounds how long this window stays open.
+                self._timer = threading.Timer(self.commit_interval - elapsed, self._commit_due)
+                self._timer.daemon = True
+                self._timer.start()
+            return len(self._offsets) - 1
+
+    def sync(self) -> None:
+        """Group commit: one flush + fsync covers every record appended since the last one."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+            self.syncs += 1
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def _commit_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._pending and not self._fh.closed:
+                self._commit()
+
+    def _view(self, end: int) -> mmap.mmap:
+        if self._map is None or end > self._mapped_size:
+            self._fh.flush()
+            if self._map is not None:
+                self._map.close()
+            with open(self.path, "rb") as fh:
+                self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = len(self._map)
+        return self._map
+
+    def _record(self, seq: int):
+        offset = self._offsets[seq]
+        view = self._view(offset + _HEADER.size)
+        length, _ = _HEADER.unpack_from(view, offset)
+        body = offset + _HEADER.size
+        return self._view(body + length), body, length
+
+    def timestamp(self, seq: int) -> float:
+        view, body, _ = self._record(seq)
+        return _STAMP.unpack_from(view, body)[0]
+
+    def digest(self, seq: int) -> bytes:
+        view, body, _ = self._record(seq)
+        return view[body + _DIGEST_OFFSET : body + _LEVEL_OFFSET]
+
+    def level(self, seq: int) -> str:
+        view, body, _ = self._record(seq)
+        level_len = view[body + _LEVEL_OFFSET]
+        return view[body + _LEVEL_OFFSET + 1 : body + _LEVEL_OFFSET + 1 + level_len].decode()
+
+    def read(self, seq: int):
+        """Decodes one record into (timestamp, digest, level, message)."""
+        view, body, length = self._record(seq)
+        level_len = view[body + _LEVEL_OFFSET]
+        level_end = body + _LEVEL_OFFSET + 1 + level_len
+        return (
+            _STAMP.unpack_from(view, body)[0],
+            view[body + _DIGEST_OFFSET : body + _LEVEL_OFFSET],
+            view[body + _LEVEL_OFFSET + 1 : level_end].decode(),
+            view[level_end : body + length].decode(),
+        )
+
+    def span_bytes(self, start: int, stop: int) -> int:
+        if start >= stop:
+            return 0
+        end = self._offsets[stop] if stop < len(self._offsets) else self._end
+        return end - self._offsets[start]
+
+    def iter_digests(self, start: int = 0, stop: Optional[int] = None) -> Iterator[bytes]:
+        stop = len(self._offsets) if stop is None else stop
+        if start >= stop:
+            return
+        view = self._view(self._end)
+        for seq in range(start, stop):
+            body = self._offsets[seq] + _HEADER.size
+            yield view[body + _DIGEST_OFFSET : body + _LEVEL_OFFSET]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh.closed:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._commit()
+            self._fh.close()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,259 @@
+"""
+Merkle Accumulator: incremental RFC 6962 Merkle tree over ledger event digests.
+Appends are O(1) amortized; the tree keeps every complete aligned subtree root
+(about 2 digests per leaf), so roots, inclusion proofs and consistency proofs
+for any historical size are computed in O(log n) node lookups. prune(before)
+drops the nodes only leaves older than `before` need, leaving the right-edge
+frontier plus about 2 digests per newer leaf; proofs then start at `before`.
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+DIGEST_SIZE = 32
+EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+
+def leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def _split(size: int) -> int:
+    """Largest power of two strictly smaller than size (size >= 2)."""
+    return 1 << ((size - 1).bit_length() - 1)
+
+
+class MerkleAccumulator:
+    def __init__(self, leaves: Iterable[bytes] = ()):
+        # _levels[h] holds, back to back, the roots of the complete aligned subtrees of 2**h leaves.
+        self._levels: List[bytearray] = [bytearray()]
+        # _offsets[h] counts the nodes pruned from the front of _levels[h].
+        self._offsets: List[int] = [0]
+        self._size = 0
+        self._pruned = 0
+        for leaf in leaves:
+            self.append(leaf)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def pruned(self) -> int:
+        """Leaves before this index have no proofs, and sizes below it no roots."""
+        return self._pruned
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(level) for level in self._levels)
+
+    def append(self, data: bytes) -> int:
+        """Adds one leaf (the raw event digest) and returns its index."""
+        index = self._size
+        self._levels[0] += leaf_hash(data)
+        self._size += 1
+        height, count = 0, self._size
+        while count % 2 == 0:
+            combined = node_hash(self._node(height, count - 2), self._node(height, count - 1))
+            if height + 1 == len(self._levels):
+                self._levels.append(bytearray())
+                self._offsets.append(0)
+            self._levels[height + 1] += combined
+            height, count = height + 1, count // 2
+        return index
+
+    def extend(self, leaves: Iterable[bytes]) -> None:
+        for leaf in leaves:
+            self.append(leaf)
+
+    def prune(self, before: int) -> None:
+        """
+        Forgets what only leaves older than `before` need. At each height the pair
+        holding the node of leaf `before` is kept: its left half is a sibling on
+        newer paths, and every root for a size >= `before` is built from nodes at
+        or after it.
+        """
+        before = min(before, self._size)
+        if before <= self._pruned:
+            return
+        self._pruned = before
+        for height, level in enumerate(self._levels):
+            keep_from = (before >> height) & ~1
+            drop = keep_from - self._offsets[height]
+            if drop > 0:
+                del level[: drop * DIGEST_SIZE]
+                self._offsets[height] = keep_from
+
+    def _node(self, height: int, index: int) -> bytes:
+        offset = (index - self._offsets[height]) * DIGEST_SIZE
+        if offset < 0:
+            raise ValueError(f"Merkle node {index} at height {height} was pruned.")
+        return bytes(self._levels[height][offset : offset + DIGEST_SIZE])
+
+    def _subtree(self, start: int, size: int) -> bytes:
+        if size & (size - 1) == 0 and start % size == 0:
+            return self._node(size.bit_length() - 1, start // size)
+        k = _split(size)
+        return node_hash(self._subtree(start, k), self._subtree(start + k, size - k))
+
+    def leaf(self, index: int) -> bytes:
+        """The stored leaf node hash (not the raw event digest)."""
+        if not self._pruned <= index < self._size:
+            raise IndexError(
+                f"Leaf {index} outside tree of size {self._size} (pruned before {self._pruned})."
+            )
+        return self._node(0, index)
+
+    def root(self, size: int = -1) -> bytes:
+        size = self._size if size < 0 else size
+        if size > self._size:
+            raise ValueError(f"Tree has only {self._size} leaves; cannot compute root for {size}.")
+        if 0 < size < self._pruned:
+            raise ValueError(
+                f"Root for size {size} was pruned (tree pruned before {self._pruned})."
+            )
+        return self._subtree(0, size) if size else EMPTY_ROOT
+
+    def inclusion_proof(self, index: int, size: int = -1) -> List[bytes]:
+        size = self._size if size < 0 else size
+        if not self._pruned <= index < size <= self._size:
+            raise ValueError(f"No inclusion proof for leaf {index} in tree of size {size}.")
+        path: List[bytes] = []
+        start = 0
+        # Walk top-down, collecting siblings; the proof is ordered leaf-to-root.
+        while size > 1:
+            k = _split(size)
+            if index < k:
+                path.append(self._subtree(start + k, size - k))
+                size = k
+            else:
+                path.append(self._subtree(start, k))
+                start, index, size = start + k, index - k, size - k
+        path.reverse()
+        return path
+
+    def consistency_proof(self, old_size: int, new_size: int = -1) -> List[bytes]:
+        new_size = self._size if new_size < 0 else new_size
+        if not 0 <= old_size <= new_size <= self._size:
+            raise ValueError(f"No consistency proof from size {old_size} to {new_size}.")
+        if old_size in (0, new_size):
+            return []
+        if old_size < self._pruned:
+            raise ValueError(f"No consistency proof from pruned size {old_size}.")
+        path: List[bytes] = []
+        start, m, size, complete = 0, old_size, new_size, True
+        while m != size:
+            k = _split(size)
+            if m <= k:
+                path.append(self._subtree(start + k, size - k))
+                size = k
+            else:
+                path.append(self._subtree(start, k))
+                start, m, size, complete = start + k, m - k, size - k, False
+        if not complete:
+            path.append(self._subtree(start, size))
+        path.reverse()
+        return path
+
+
+def verify_inclusion(
+    data: bytes, index: int, size: int, proof: Sequence[bytes], root: bytes
+) -> bool:
+    """Checks that raw event digest `data` is leaf `index` of the tree of `size` leaves with `root`."""
+    if not 0 <= index < size:
+        return False
+    fn, sn, r = index, size - 1, leaf_hash(data)
+    for p in proof:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn, sn = fn >> 1, sn >> 1
+        else:
+            r = node_hash(r, p)
+        fn, sn = fn >> 1, sn >> 1
+    return sn == 0 and r == root
+
+
+def verify_consistency(
+    old_size: int, new_size: int, old_root: bytes, new_root: bytes, proof: Sequence[bytes]
+) -> bool:
+    """RFC 9162 section 2.1.4.2: the tree of `new_size` leaves extends the tree of `old_size` leaves."""
+    if old_size == new_size:
+        return old_root == new_root and not proof
+    if not 0 <= old_size < new_size:
+        return False
+    if old_size == 0:
+        return not proof and old_root == EMPTY_ROOT
+    if not proof:
+        return False
+    path = list(proof)
+    if old_size & (old_size - 1) == 0:
+        path.insert(0, old_root)
+    fn, sn = old_size - 1, new_size - 1
+    while fn & 1:
+        fn, sn = fn >> 1, sn >> 1
+    fr = sr = path[0]
+    for c in path[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr, sr = node_hash(c, fr), node_hash(c, sr)
+            while not fn & 1 and fn != 0:
+                fn, sn = fn >> 1, sn >> 1
+        else:
+            sr = node_hash(sr, c)
+        fn, sn = fn >> 1, sn >> 1
+    return sn == 0 and fr == old_root and sr == new_root
+
+
+def verify_inclusion_batch(
+    items: Iterable[Tuple[bytes, int, Sequence[bytes]]], size: int, root: bytes
+) -> List[bool]:
+    """
+    Verifies many (data, index, proof) triples against one root. Every proof is
+    walked all the way up and compared with the root; hashes on already verified
+    paths are memoised by (height, position), so a step whose node and sibling
+    both match a trusted step reuses its parent and shared upper levels are
+    hashed only once.
+    """
+    trusted: Dict[Tuple[int, int], Tuple[bytes, bytes, bytes]] = {}
+    results: List[bool] = []
+    for data, index, proof in items:
+        if not 0 <= index < size:
+            results.append(False)
+            continue
+        fn, sn, height, r = index, size - 1, 0, leaf_hash(data)
+        steps: List[Tuple[Tuple[int, int], Tuple[bytes, bytes, bytes]]] = []
+        valid = True
+        for p in proof:
+            if sn == 0:
+                valid = False
+                break
+            key = (height, fn)
+            known = trusted.get(key)
+            if known is not None and known[0] == r and known[1] == p:
+                parent = known[2]
+            else:
+                parent = node_hash(p, r) if fn & 1 or fn == sn else node_hash(r, p)
+                steps.append((key, (r, p, parent)))
+            if fn & 1 or fn == sn:
+                while not fn & 1 and fn != 0:
+                    fn, sn, height = fn >> 1, sn >> 1, height + 1
+            r = parent
+            fn, sn, height = fn >> 1, sn >> 1, height + 1
+        verdict = valid and sn == 0 and r == root
+        if verdict:
+            trusted.update(steps)
+        results.append(verdict)
+    return results
@@ -0,0 +1,225 @@
+"""
+Metrics: per-stage latency instrumentation for the mandate pipeline.
+Each mandate gets a Stopwatch; `lap(stage)` charges the time since the previous lap
+to that stage's fixed-bucket histogram (perf_counter_ns, no allocation per sample).
+Agents, whole mandates, retries and outcomes are recorded alongside. A node built
+without instrumentation holds NULL_METRICS, whose every method is a no-op, so the
+disabled cost is one attribute lookup and call per stage.
+"""
+
+import bisect
+import time
+from typing import Dict, List, Optional, Sequence, Union
+
+STAGES = (
+    "intake",
+    "cerebrum",
+    "hadrian",
+    "dagger",
+    "safety",
+    "zk_proof",
+    "trust",
+    "moat",
+    "complexity",
+    "impact",
+)
+
+# Upper bounds (ns) of the histogram buckets, 10us to 10s; anything slower lands in +Inf.
+BUCKETS_NS = tuple(int(scale * 10**exp) for exp in range(4, 10) for scale in (1, 2.5, 5)) + (
+    10**10,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; counts are per bucket, cumulated only on export."""
+
+    __slots__ = ("bounds", "counts", "count", "sum_ns", "max_ns")
+
+    def __init__(self, bounds: Sequence[int] = BUCKETS_NS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def observe(self, ns: int) -> None:
+        self.counts[bisect.bisect_left(self.bounds, ns)] += 1
+        self.count += 1
+        self.sum_ns += ns
+        self.max_ns = max(ns, self.max_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        return self.sum_ns / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound (ns) of the bucket holding the q-quantile; max_ns for the +Inf bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank and bucket:
+                return float(self.bounds[index]) if index < len(self.bounds) else float(self.max_ns)
+        return float(self.max_ns)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ns / 1e6,
+            "p50_ms": self.quantile(0.5) / 1e6,
+            "p99_ms": self.quantile(0.99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+    def prometheus(self, name: str, labels: str = "") -> List[str]:
+        sep = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, bucket in zip(self.bounds, self.counts):
+            cumulative += bucket
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{bound / 1e9:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.sum_ns / 1e9:.9f}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class Stopwatch:
+    """Times one mandate; every lap goes to the named stage."""
+
+    __slots__ = ("_metrics", "_last", "started")
+
+    def __init__(self, metrics: "PipelineMetrics"):
+        self._metrics = metrics
+        self.started = self._last = time.perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter_ns()
+        self._metrics.stages[stage].observe(now - self._last)
+        self._last = now
+
+    def restart_lap(self) -> None:
+        """Drops the time since the last lap (a failed stage and the reboot after it)."""
+        self._last = time.perf_counter_ns()
+
+    def finish(self, status: str) -> None:
+        self._metrics.mandate.observe(time.perf_counter_ns() - self.started)
+        self._metrics.count(f"mandates_{status.lower()}")
+
+
+class PipelineMetrics:
+    enabled = True
+
+    def __init__(self, bounds: Sequence[int] = BUCKETS_NS):
+        self._bounds = bounds
+        self.stages = {stage: Histogram(bounds) for stage in STAGES}
+        self.agents: Dict[str, Histogram] = {}
+        self.mandate = Histogram(bounds)
+        self.counters: Dict[str, int] = {"retries": 0}
+
+    def stopwatch(self) -> Stopwatch:
+        return Stopwatch(self)
+
+    @staticmethod
+    def clock() -> int:
+        return time.perf_counter_ns()
+
+    def observe_agent(self, agent_name: str, started: int, finished: Optional[int] = None) -> None:
+        histogram = self.agents.get(agent_name)
+        if histogram is None:
+            histogram = self.agents[agent_name] = Histogram(self._bounds)
+        histogram.observe((time.perf_counter_ns() if finished is None else finished) - started)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def latency_seconds(self) -> Optional[float]:
+        """Mean end-to-end mandate latency so far; None before the first mandate finishes."""
+        return self.mandate.mean_ns / 1e9 if self.mandate.count else None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "enabled": True,
+            "mandate": self.mandate.summary(),
+            "stages": {stage: histogram.summary() for stage, histogram in self.stages.items()},
+            "agents": {agent: histogram.summary() for agent, histogram in self.agents.items()},
+            "counters": dict(self.counters),
+        }
+
+    def prometheus(self, extra: Optional[Dict[str, float]] = None, prefix: str = "zkvs") -> str:
+        """Prometheus text exposition; `extra` adds scalar series (`*_total` as counters, else gauges)."""
+        lines = [f"# TYPE {prefix}_mandate_seconds histogram"]
+        lines += self.mandate.prometheus(f"{prefix}_mandate_seconds")
+        lines.append(f"# TYPE {prefix}_stage_seconds histogram")
+        for stage, histogram in self.stages.items():
+            lines += histogram.prometheus(f"{prefix}_stage_seconds", f'stage="{stage}"')
+        if self.agents:
+            lines.append(f"# TYPE {prefix}_agent_seconds histogram")
+            for agent, histogram in self.agents.items():
+                lines += histogram.prometheus(f"{prefix}_agent_seconds", f'agent="{agent}"')
+        lines += _scalar_lines(
+            {f"{name}_total": value for name, value in self.counters.items()}, prefix
+        )
+        lines += _scalar_lines(extra or {}, prefix)
+        return "\n".join(lines) + "\n"
+
+
+def _scalar_lines(values: Dict[str, float], prefix: str) -> List[str]:
+    lines = []
+    for name, value in values.items():
+        kind = "counter" if name.endswith("_total") else "gauge"
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        lines.append(f"{prefix}_{name} {value:g}")
+    return lines
+
+
+class _NullStopwatch:
+    __slots__ = ()
+
+    def lap(self, stage: str) -> None:
+        pass
+
+    def restart_lap(self) -> None:
+        pass
+
+    def finish(self, status: str) -> None:
+        pass
+
+
+class NullMetrics:
+    """Instrumentation switched off: same interface, nothing measured or stored."""
+
+    enabled = False
+    _STOPWATCH = _NullStopwatch()
+
+    def stopwatch(self) -> _NullStopwatch:
+        return self._STOPWATCH
+
+    @staticmethod
+    def clock() -> int:
+        return 0
+
+    def observe_agent(self, agent_name: str, started: int, finished: Optional[int] = None) -> None:
+        pass
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def latency_seconds(self) -> Optional[float]:
+        return None
+
+    def stats(self) -> Dict[str, object]:
+        return {"enabled": False}
+
+    def prometheus(self, extra: Optional[Dict[str, float]] = None, prefix: str = "zkvs") -> str:
+        lines = _scalar_lines(extra or {}, prefix)
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+NULL_METRICS = NullMetrics()
+
+# What a node holds: a PipelineMetrics when instrumented, otherwise NULL_METRICS.
+Metrics = Union[PipelineMetrics, NullMetrics]
@@ -0,0 +1,305 @@
+"""
+Node Pool: multi-process front end over sharded ZKVSNodePrime instances.
+Each worker process owns one node (its own ledger, catalyst, sketches and moat),
+so every worker's ledger stays independently verifiable. Mandates are routed by
+the intent key that prefixes the task_id Hadrian will assign them, which keeps
+identical intents on the same worker. Per-worker state is merged into a global view on demand.
+A worker that dies fails its outstanding requests, and every blocking wait has a timeout.
+"""
+
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from multiprocessing.connection import wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.axiomshards_catalyst import TokenSketches, ToSTLinear
+from src.mandate_result import MandateResult
+from src.merkle import MerkleAccumulator
+from src.praetorian_layers import CerebrumLayer
+from src.sovereign_core import ZKVSNodePrime
+from src.task_registry import TaskRegistry
+
+
+class NodePoolError(Exception):
+    pass
+
+
+def _worker_state(index: int, node: ZKVSNodePrime) -> Dict[str, Any]:
+    ledger = node._verifiable_ledger
+    moat = node._data_moat_engine
+    return {
+        "worker": index,
+        "pid": os.getpid(),
+        "ledger_root": ledger.root,
+        "ledger_size": ledger.total_appended,
+        "catalyst": node._axiomshards,
+        "token_sketches": node._token_sketches.to_bytes(),
+        "moat_strength": moat._moat_strength,
+        "moat_refinements": moat._model_refinement_count,
+        "active_tasks": len(node._hadrian.active_tasks),
+    }
+
+
+def _worker_main(index: int, node_kwargs: Dict[str, Any], requests, responses) -> None:
+    node = ZKVSNodePrime(**node_kwargs)
+    try:
+        while True:
+            message = requests.get()
+            if message is None:
+                break
+            request_id, op, payload = message
+            try:
+                if op == "mandates":
+                    value: Any = [
+                        r.to_bytes() for r in node.execute_mandates(payload, structured=True)
+                    ]
+                elif op == "state":
+                    value = _worker_state(index, node)
+                else:
+                    raise NodePoolError(f"Unknown pool operation '{op}'.")
+                responses.put((request_id, True, value))
+            except Exception as e:
+                responses.put((request_id, False, f"{type(e).__name__}: {e}"))
+    finally:
+        node.close()
+
+
+class NodePool:
+    """
+    `workers` processes, each running its own ZKVSNodePrime built from `node_kwargs`.
+    With `ledger_dir`, worker i persists its ledger to `<ledger_dir>/worker-<i>.log`.
+    Blocking calls wait at most `timeout` seconds (None waits indefinitely). A worker
+    that exits is not respawned: its pending requests and any later ones routed to it
+    fail with NodePoolError.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        node_kwargs: Optional[Dict[str, Any]] = None,
+        ledger_dir: Optional[str] = None,
+        start_method: Optional[str] = None,
+        timeout: Optional[float] = 300.0,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers <= 0:
+            raise ValueError("workers must be positive.")
+        self._cerebrum = CerebrumLayer(ZKVSNodePrime.AXIOMS)
+        self._ids = itertools.count()
+        self.timeout = timeout
+        self._futures: Dict[int, Tuple[int, Future]] = {}
+        self._dead: Set[int] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        # typeshed's BaseContext (returned for a plain str method) does not declare Process.
+        ctx: Any = multiprocessing.get_context(start_method)
+        self._responses = ctx.Queue()
+        self._requests = []
+        self._processes = []
+        for index in range(self.workers):
+            kwargs = dict(node_kwargs or {})
+            if ledger_dir is not None:
+                kwargs["ledger_path"] = os.path.join(ledger_dir, f"worker-{index}.log")
+            requests = ctx.Queue()
+            process = ctx.Process(
+                target=_worker_main,
+                args=(index, kwargs, requests, self._responses),
+                name=f"zkvs-node-{index}",
+                daemon=True,
+            )
+            process.start()
+            self._requests.append(requests)
+            self._processes.append(process)
+        # Started after the workers so no thread exists in the parent when they fork.
+        self._collector = threading.Thread(
+            target=self._collect, name="zkvs-pool-collector", daemon=True
+        )
+        self._collector.start()
+        self._monitor = threading.Thread(
+            target=self._watch_workers, name="zkvs-pool-monitor", daemon=True
+        )
+        self._monitor.start()
+
+    def __enter__(self) -> "NodePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def intent_key(self, framework: Dict[str, Any]) -> str:
+        """The intent key prefixing every task_id Hadrian assigns this framework."""
+        return TaskRegistry.intent_key(
+            self._cerebrum.process_intent(str(framework.get("intent", "")))
+        )
+
+    def shard_for(self, framework: Dict[str, Any]) -> int:
+        return int(self.intent_key(framework), 16) % self.workers
+
+    def _collect(self) -> None:
+        while True:
+            message = self._responses.get()
+            if message is None:
+                return
+            request_id, ok, value = message
+            with self._lock:
+                entry = self._futures.pop(request_id, None)
+            if entry is None:
+                continue
+            future = entry[1]
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(NodePoolError(value))
+
+    def _watch_workers(self) -> None:
+        """Blocks on the worker sentinels; a worker exiting before close() fails its requests."""
+        sentinels = {process.sentinel: index for index, process in enumerate(self._processes)}
+        while sentinels:
+            for sentinel in wait(list(sentinels)):
+                index = sentinels.pop(sentinel)
+                if self._closed:
+                    continue
+                with self._lock:
+                    self._dead.add(index)
+                    lost = [rid for rid, (worker, _) in self._futures.items() if worker == index]
+                    futures = [self._futures.pop(rid)[1] for rid in lost]
+                exitcode = self._processes[index].exitcode
+                for future in futures:
+                    future.set_exception(
+                        NodePoolError(f"Worker {index} exited (code {exitcode}) before replying.")
+                    )
+
+    def _call(self, worker: int, op: str, payload: Any = None) -> Future:
+        if self._closed:
+            raise NodePoolError("NodePool is closed.")
+        future: Future = Future()
+        request_id = next(self._ids)
+        with self._lock:
+            if worker in self._dead:
+                raise NodePoolError(f"Worker {worker} has exited.")
+            self._futures[request_id] = (worker, future)
+        self._requests[worker].put((request_id, op, payload))
+        return future
+
+    def _wait(self, future: Future, timeout: Optional[float]) -> Any:
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            raise NodePoolError(f"No reply from the pool within {timeout}s.") from None
+
+    def submit(self, framework: Dict[str, Any]) -> Future:
+        """Future resolving to the mandate's MandateResult."""
+        outer: Future = Future()
+
+        def unwrap(inner: Future) -> None:
+            if inner.exception() is not None:
+                outer.set_exception(inner.exception())
+            else:
+                outer.set_result(MandateResult.from_bytes(inner.result()[0]))
+
+        self._call(self.shard_for(framework), "mandates", [framework]).add_done_callback(unwrap)
+        return outer
+
+    def execute_mandate(
+        self,
+        framework: Dict[str, Any],
+        *,
+        structured: bool = False,
+        timeout: Optional[float] = None,
+    ):
+        result = self._wait(self.submit(framework), self.timeout if timeout is None else timeout)
+        return result if structured else str(result)
+
+    def execute_mandates(
+        self,
+        frameworks: Iterable[Dict[str, Any]],
+        *,
+        batch_size: int = 64,
+        structured: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Streams results in input order. Frameworks are taken `batch_size` per worker at a
+        time; each worker receives its shard of the window as one batch, so all workers
+        run concurrently and each uses the node's batched execute_mandates path.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+        stream = iter(frameworks)
+        while True:
+            window = list(itertools.islice(stream, batch_size * self.workers))
+            if not window:
+                return
+            shards: Dict[int, List[int]] = {}
+            for position, framework in enumerate(window):
+                shards.setdefault(self.shard_for(framework), []).append(position)
+            calls = [
+                (positions, self._call(worker, "mandates", [window[p] for p in positions]))
+                for worker, positions in shards.items()
+            ]
+            ordered: List[Optional[MandateResult]] = [None] * len(window)
+            for positions, future in calls:
+                for position, raw in zip(positions, self._wait(future, self.timeout)):
+                    ordered[position] = MandateResult.from_bytes(raw)
+            for result in ordered:
+                yield result if structured else str(result)
+
+    def worker_states(self) -> List[Dict[str, Any]]:
+        return [
+            self._wait(f, self.timeout)
+            for f in [self._call(worker, "state") for worker in range(self.workers)]
+        ]
+
+    def global_view(self) -> Dict[str, Any]:
+        """
+        Merged state of every worker. `pool_root` is a Merkle root over the workers'
+        ledger roots (leaf i = worker i), so each worker ledger remains provable on its own.
+        """
+        states = self.worker_states()
+        roots = MerkleAccumulator()
+        catalyst = ToSTLinear()
+        sketches = TokenSketches()
+        strength = 1.0
+        for state in states:
+            roots.append(bytes.fromhex(state["ledger_root"]))
+            catalyst.merge(state["catalyst"])
+            sketches.merge(TokenSketches.from_bytes(state["token_sketches"]))
+            # Each refinement multiplies strength by 1.001, so the product is what one node would hold.
+            strength *= state["moat_strength"]
+        return {
+            "workers": [
+                {
+                    k: state[k]
+                    for k in ("worker", "pid", "ledger_root", "ledger_size", "active_tasks")
+                }
+                for state in states
+            ],
+            "pool_root": roots.root().hex(),
+            "ledger_size": sum(state["ledger_size"] for state in states),
+            "catalyst": catalyst.get_stats(),
+            "token_sketches": sketches.get_stats(),
+            "moat_strength": min(2.0, strength),
+            "moat_refinements": sum(state["moat_refinements"] for state in states),
+            "active_tasks": sum(state["active_tasks"] for state in states),
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for requests in self._requests:
+            requests.put(None)
+        for process in self._processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        self._responses.put(None)
+        self._collector.join(timeout=10)
+        self._monitor.join(timeout=10)
+        with self._lock:
+            pending, self._futures = self._futures, {}
+        for _, future in pending.values():
+            future.set_exception(NodePoolError("NodePool closed before the request completed."))
@@ -0,0 +1,204 @@
+"""
+Node Server: a persistent ZKVSNodePrime behind a line-delimited JSON socket protocol.
+One JSON object per line in each direction:
+    {"op": "mandate", "framework": {...}, "structured": false, "id": ...}
+    {"op": "ping"} | {"op": "stats"} | {"op": "metrics"} | {"op": "shutdown"}
+A line without "op" is taken as a bare framework; "metrics" answers with the node's
+Prometheus text (latency histograms need a node started with instrument=True). Responses echo "id" and carry
+{"ok": true, "result": ...} or {"ok": false, "error": "..."}, in request order.
+Addresses are "unix:/path/node.sock" (or any path) or "tcp:host:port" / "host:port".
+A unix address is only ever unlinked if it is a socket; any other file there is an error.
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import stat
+import threading
+import time
+from typing import Any, Dict, Generator, Iterable, Optional, Tuple, Union
+
+from src.mandate_result import json_safe
+from src.sovereign_core import ZKVSNodePrime
+
+# Long intents must fit on one protocol line.
+LINE_LIMIT = 16 * 1024 * 1024
+
+Address = Tuple[str, Union[str, Tuple[str, int]]]
+
+
+def parse_address(spec: str) -> Address:
+    if spec.startswith("unix:"):
+        return "unix", spec[len("unix:") :]
+    if spec.startswith("tcp:"):
+        spec = spec[len("tcp:") :]
+    elif "/" in spec or spec.endswith(".sock"):
+        return "unix", spec
+    host, sep, port = spec.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Unrecognised node address '{spec}'; expected unix:/path or host:port.")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return (
+        json.dumps(
+            json_safe(message), separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode()
+        + b"\n"
+    )
+
+
+def _is_socket(path: str) -> bool:
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+class NodeServer:
+    """Serves one node; concurrent connections share it through the node's async mandate path."""
+
+    def __init__(self, address: str, node: Optional[ZKVSNodePrime] = None, **node_kwargs):
+        self.address = parse_address(address)
+        self.node = node if node is not None else ZKVSNodePrime(**node_kwargs)
+        self.ready = threading.Event()
+        self.mandates = 0
+        self._started = time.monotonic()
+        self._stop: Optional[asyncio.Event] = None
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Any:
+        op = request.get("op", "mandate")
+        if "op" not in request:
+            request = {"framework": request}
+        if op == "mandate":
+            result = await self.node.execute_mandate_async(
+                request.get("framework") or {}, structured=True
+            )
+            self.mandates += 1
+            return result.to_dict() if request.get("structured") else str(result)
+        if op == "ping":
+            return "pong"
+        if op == "stats":
+            ledger = self.node._verifiable_ledger
+            return {
+                "mandates": self.mandates,
+                "uptime": time.monotonic() - self._started,
+                "ledger_root": ledger.root,
+                "ledger_size": ledger.total_appended,
+                "catalyst": self.node._axiomshards.get_stats(),
+                "pipeline": self.node.stats(),
+            }
+        if op == "metrics":
+            return self.node.prometheus_metrics()
+        if op == "shutdown":
+            assert self._stop is not None, "shutdown is only dispatched while serving"
+            self._stop.set()
+            return "bye"
+        raise ValueError(f"Unknown op '{op}'.")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while not reader.at_eof():
+                try:
+                    line = await reader.readline()
+                except ValueError as e:
+                    # Over-long line: the stream cannot be resynchronised, so report and hang up.
+                    writer.write(_encode({"ok": False, "error": f"{type(e).__name__}: {e}"}))
+                    break
+                if not line.strip():
+                    continue
+                response: Dict[str, Any] = {}
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Requests must be JSON objects.")
+                    if "id" in request:
+                        response["id"] = request["id"]
+                    response.update(ok=True, result=await self._dispatch(request))
+                except Exception as e:
+                    response.update(ok=False, error=f"{type(e).__name__}: {e}")
+                writer.write(_encode(response))
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_forever(self) -> None:
+        self._stop = asyncio.Event()
+        _, target = self.address
+        if isinstance(target, str):
+            if _is_socket(target):
+                os.unlink(target)  # stale socket from a previous run
+            elif os.path.lexists(target):
+                raise FileExistsError(
+                    f"Refusing to listen on '{target}': it exists and is not a socket."
+                )
+            server = await asyncio.start_unix_server(self._handle, path=target, limit=LINE_LIMIT)
+        else:
+            host, port = target
+            server = await asyncio.start_server(self._handle, host, port, limit=LINE_LIMIT)
+        self.ready.set()
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            self.node.close()
+            if isinstance(target, str) and _is_socket(target):
+                os.unlink(target)
+
+    def run(self) -> None:
+        asyncio.run(self.serve_forever())
+
+
+def _connect(address: str) -> socket.socket:
+    kind, target = parse_address(address)
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.connect(target)
+    return sock
+
+
+def request_lines(
+    address: str, requests: Iterable[Dict[str, Any]]
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Streams requests to a running NodeServer and yields its responses in order.
+    Requests are written from a helper thread so large batches never deadlock on full buffers.
+    """
+    sock = _connect(address)
+
+    def pump() -> None:
+        try:
+            for message in requests:
+                sock.sendall(_encode(message))
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass  # the reader side went away first
+
+    writer = threading.Thread(target=pump, name="zkvs-client-writer", daemon=True)
+    writer.start()
+    try:
+        with sock.makefile("rb") as stream:
+            for line in stream:
+                yield json.loads(line)
+    finally:
+        with contextlib.suppress(OSError):
+            sock.shutdown(socket.SHUT_RDWR)
+        writer.join()
+        sock.close()
+
+
+def request(address: str, message: Dict[str, Any]) -> Dict[str, Any]:
+    responses = request_lines(address, [message])
+    try:
+        return next(responses)
+    except StopIteration:
+        raise ConnectionError("Node server closed the connection without replying.") from None
+    finally:
+        responses.close()
@@ -1,56 +1,223 @@
+import contextvars
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from src.dagger_agents import AgentRegistry, DataSieveAgent, MarketAnalysisAgent, ZKProofAgent
+from src.digest import result_digests, sha256_hex
+from src.intent_router import IntentRouter
+from src.lazy_import import lazy_import
+from src.metrics import NULL_METRICS
+from src.profiling import active_hooks, call_hooked, call_hooked_async
+from src.task_registry import DONE, EXECUTING, FAILED, TaskRegistry
+from src.text_pipeline import TokenView, strip_noise, tokens_of
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Executors and the event loop are only touched when a mandate actually uses them.
+asyncio = lazy_import("asyncio")
+futures = lazy_import("concurrent.futures")
+
 class CerebrumLayer:
     def __init__(self, axioms):
         self._axioms = axioms
     def process_intent(self, raw_intent: str) -> str:
-        sharpened_intent = raw_intent.replace("fluff", "").replace("noise", "").strip()
+        return self.process_view(TokenView(raw_intent, tokens_of(raw_intent))).text
+    def process_view(self, intent: TokenView) -> TokenView:
+        # NOISE=-inf filters token-wise off the shared split; otherwise internal whitespace is kept verbatim.
         if self._axioms.get("NOISE") == float("-inf"):
-            filtered_intent = " ".join([w for w in sharpened_intent.split() if len(w) > 2])
-        else:
-            filtered_intent = sharpened_intent
-        return filtered_intent
+            return TokenView.from_tokens(strip_noise(intent.tokens))
+        return TokenView(intent.text.replace("fluff", "").replace("noise", "").strip())
+
+def _sieve_params(intent):
+    return {"data": intent}
 
 class HadrianLayer:
-    def __init__(self, axioms):
-        from src.dagger_agents import DataSieveAgent, ZKProofAgent, MarketAnalysisAgent
+    AGENT_FACTORIES = {
+        "data_sieve_agent": DataSieveAgent,
+        "zk_proof_agent": ZKProofAgent,
+        "market_analysis_agent": MarketAnalysisAgent,
+    }
+    def __init__(self, axioms, result_cache=None, router: Optional[IntentRouter] = None, tasks: Optional[TaskRegistry] = None):
         self._axioms = axioms
-        self.dagger_agents = {
-            "data_sieve_agent": DataSieveAgent(axioms),
-            "zk_proof_agent": ZKProofAgent(axioms),
-            "market_analysis_agent": MarketAnalysisAgent(axioms),
-        }
-        self.active_tasks = {}
+        # Agents are built on first route, so a reboot or an idle node constructs none.
+        self.dagger_agents = AgentRegistry(self.AGENT_FACTORIES, axioms, result_cache)
+        self.router = router if router is not None else self.default_router()
+        # Bounded: old tasks expire or are evicted LRU-first instead of piling up for the node's lifetime.
+        self.active_tasks = tasks if tasks is not None else TaskRegistry()
+    @staticmethod
+    def default_router() -> IntentRouter:
+        router = IntentRouter()
+        router.register_route("market dominance", "market_analysis_agent", "analyze_market_signals", {"target": "dominance"})
+        router.register_route("verifiable systems", "zk_proof_agent", "prepare_zk_proof_template", {"protocol": "PlonK-over-HyperPlonK"})
+        router.register_route("data", "data_sieve_agent", "sieve_data", _sieve_params)
+        return router
+    def register_route(self, keyword, agent_name, action, params=None):
+        self.router.register_route(keyword, agent_name, action, params)
     def orchestrate_task(self, intent: str):
-        import hashlib
-        task_id = hashlib.sha256(intent.encode()).hexdigest()[:8]
-        sub_tasks = []
-        if "market dominance" in intent:
-            sub_tasks.append({"agent_name": "market_analysis_agent", "action": "analyze_market_signals", "params": {"target": "dominance"}})
-        if "verifiable systems" in intent:
-            sub_tasks.append({"agent_name": "zk_proof_agent", "action": "prepare_zk_proof_template", "params": {"protocol": "PlonK-over-HyperPlonK"}})
-        if "data" in intent:
-            sub_tasks.append({"agent_name": "data_sieve_agent", "action": "sieve_data", "params": {"data": intent}})
-        self.active_tasks[task_id] = {"intent": intent, "assigned_tasks": sub_tasks, "status": "orchestrated"}
-        return {"task_id": task_id, "sub_tasks": sub_tasks}
+        sub_tasks = self.router.route(intent)
+        record = self.active_tasks.create(intent, sub_tasks)
+        return {"task_id": record.task_id, "sub_tasks": sub_tasks}
+
+def resolve_executor(executor=None, max_workers: Optional[int] = None) -> "Optional[Executor]":
+    # None/"inline" runs sub-tasks on the caller's thread; an Executor instance is used as-is.
+    if executor is None or executor == "inline":
+        return None
+    if isinstance(executor, futures.Executor):
+        return executor
+    if executor == "thread":
+        return futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dagger")
+    if executor == "process":
+        return futures.ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown Dagger executor '{executor}'; expected inline, thread, process or an Executor.")
+
+def _run_agent(agent, params):
+    return agent.execute(params)
 
 class DaggerLayer:
-    def __init__(self, axioms):
+    def __init__(
+        self,
+        axioms,
+        executor=None,
+        agent_timeout: Union[None, float, Dict[str, float]] = None,
+        tasks: Optional[TaskRegistry] = None,
+        metrics=NULL_METRICS,
+    ):
         self._axioms = axioms
-    def execute_task(self, segmented_task, agents):
-        import hashlib
+        self._owns_executor = isinstance(executor, str) and executor != "inline"
+        self.executor = resolve_executor(executor)
+        # A timed-out agent's result is replaced by an error entry, but the agent is never
+        # interrupted: a pooled agent that already started runs to completion in its worker,
+        # and an inline agent is only judged once it returns.
+        self.agent_timeout = agent_timeout
+        # Hadrian's registry; run_task moves each task through executing -> done | failed.
+        self.tasks = tasks
+        # Per-agent wall time as seen from here (queueing and IPC included for pooled executors).
+        self.metrics = metrics
+    def _track(self, segmented_task, status, error=None):
+        if self.tasks is not None and "task_id" in segmented_task:
+            self.tasks.transition(segmented_task["task_id"], status, error)
+    def _settle(self, segmented_task, results):
+        errors = [r["result"] for r in results if r.get("error")]
+        self._track(segmented_task, FAILED if errors else DONE, errors[0] if errors else None)
+    def _timeout_for(self, agent_name):
+        if isinstance(self.agent_timeout, dict):
+            return self.agent_timeout.get(agent_name)
+        return self.agent_timeout
+    @staticmethod
+    def _fallback(agent_name, content):
+        return {"result": content, "hash": sha256_hex(content), "agent": agent_name, "error": True}
+    def _run_inline(self, sub_tasks, agents):
         results = []
-        for sub_task in segmented_task.get("sub_tasks", []):
+        for sub_task in sub_tasks:
             agent_name = sub_task.get("agent_name", "")
             params = sub_task.get("params", {})
             agent = agents.get(agent_name)
             if agent is None:
-                content = f"Agent '{agent_name}' unavailable; skipped. (FLAW=0)"
-                results.append({"result": content, "hash": hashlib.sha256(content.encode()).hexdigest(), "agent": agent_name})
+                results.append(self._fallback(agent_name, f"Agent '{agent_name}' unavailable; skipped. (FLAW=0)"))
                 continue
+            timeout = self._timeout_for(agent_name)
+            started = self.metrics.clock()
+            began = time.monotonic()
             try:
                 out = agent.execute(params)
+                if timeout is not None and time.monotonic() - began > timeout:
+                    out = self._fallback(agent_name, f"{agent_name} execution error: timed out after {timeout}s")
                 results.append(out)
             except Exception as exec_err:
-                content = f"{agent_name} execution error: {exec_err}"
-                results.append({"result": content, "hash": hashlib.sha256(content.encode()).hexdigest(), "agent": agent_name})
+                results.append(self._fallback(agent_name, f"{agent_name} execution error: {exec_err}"))
+            self.metrics.observe_agent(agent_name, started)
+        return results
+    def _run_concurrent(self, sub_tasks, agents):
+        # Fan every available agent out first, then collect in sub-task order.
+        # Worker threads start from an empty context, so sampled profiling hooks are carried over explicitly.
+        carry_hooks = bool(active_hooks()) and isinstance(self.executor, futures.ThreadPoolExecutor)
+        pending = []
+        for sub_task in sub_tasks:
+            agent_name = sub_task.get("agent_name", "")
+            agent = agents.get(agent_name)
+            if agent is None:
+                future = None
+            elif carry_hooks:
+                future = self.executor.submit(contextvars.copy_context().run, _run_agent, agent, sub_task.get("params", {}))
+            else:
+                future = self.executor.submit(_run_agent, agent, sub_task.get("params", {}))
+            pending.append((agent_name, future, time.monotonic(), self.metrics.clock()))
+        results = []
+        for agent_name, future, submitted, started in pending:
+            if future is None:
+                results.append(self._fallback(agent_name, f"Agent '{agent_name}' unavailable; skipped. (FLAW=0)"))
+                continue
+            timeout = self._timeout_for(agent_name)
+            try:
+                remaining = None if timeout is None else max(0.0, submitted + timeout - time.monotonic())
+                results.append(future.result(timeout=remaining))
+            except futures.TimeoutError:
+                # Only stops an agent that has not started yet; a running one finishes in its worker.
+                future.cancel()
+                results.append(self._fallback(agent_name, f"{agent_name} execution error: timed out after {timeout}s"))
+            except Exception as exec_err:
+                results.append(self._fallback(agent_name, f"{agent_name} execution error: {exec_err}"))
+            # Collected in order, so an agent that finished early is charged until it is collected.
+            self.metrics.observe_agent(agent_name, started)
+        return results
+    @staticmethod
+    def _combine(results) -> Tuple[str, List[bytes]]:
+        # The agents' own digests travel with the joined output so nothing downstream rehashes it.
         final_output_content = " ".join([r["result"] for r in results]) if results else "Flawless execution by Dagger agents. (FLAW=0)"
-        return final_output_content
+        return final_output_content, result_digests(results)
+    def run_task(self, segmented_task, agents) -> Tuple[str, List[bytes]]:
+        hooks = active_hooks()
+        if hooks:
+            return call_hooked(hooks, "dagger", self._run_task, segmented_task, agents)
+        return self._run_task(segmented_task, agents)
+    def _run_task(self, segmented_task, agents) -> Tuple[str, List[bytes]]:
+        sub_tasks = segmented_task.get("sub_tasks", [])
+        self._track(segmented_task, EXECUTING)
+        try:
+            if self.executor is None or (len(sub_tasks) <= 1 and self.agent_timeout is None):
+                results = self._run_inline(sub_tasks, agents)
+            else:
+                results = self._run_concurrent(sub_tasks, agents)
+        except BaseException as exc:
+            self._track(segmented_task, FAILED, repr(exc))
+            raise
+        self._settle(segmented_task, results)
+        return self._combine(results)
+    def execute_task(self, segmented_task, agents):
+        return self.run_task(segmented_task, agents)[0]
+    async def _run_agent_async(self, sub_task, agents):
+        agent_name = sub_task.get("agent_name", "")
+        agent = agents.get(agent_name)
+        if agent is None:
+            return self._fallback(agent_name, f"Agent '{agent_name}' unavailable; skipped. (FLAW=0)")
+        timeout = self._timeout_for(agent_name)
+        started = self.metrics.clock()
+        try:
+            return await asyncio.wait_for(agent.execute_async(sub_task.get("params", {})), timeout)
+        except asyncio.TimeoutError:
+            return self._fallback(agent_name, f"{agent_name} execution error: timed out after {timeout}s")
+        except Exception as exec_err:
+            return self._fallback(agent_name, f"{agent_name} execution error: {exec_err}")
+        finally:
+            self.metrics.observe_agent(agent_name, started)
+    async def run_task_async(self, segmented_task, agents) -> Tuple[str, List[bytes]]:
+        hooks = active_hooks()
+        if hooks:
+            return await call_hooked_async(hooks, "dagger", self._run_task_async, segmented_task, agents)
+        return await self._run_task_async(segmented_task, agents)
+    async def _run_task_async(self, segmented_task, agents) -> Tuple[str, List[bytes]]:
+        sub_tasks = segmented_task.get("sub_tasks", [])
+        self._track(segmented_task, EXECUTING)
+        try:
+            results = await asyncio.gather(*(self._run_agent_async(sub_task, agents) for sub_task in sub_tasks))
+        except BaseException as exc:
+            self._track(segmented_task, FAILED, repr(exc))
+            raise
+        self._settle(segmented_task, results)
+        return self._combine(results)
+    async def execute_task_async(self, segmented_task, agents):
+        return (await self.run_task_async(segmented_task, agents))[0]
+    def shutdown(self):
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
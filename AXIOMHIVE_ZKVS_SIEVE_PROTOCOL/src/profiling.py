@@ -0,0 +1,246 @@
+"""
+Profiling: pluggable before/after hooks around mandates, the Dagger layer and agents.
+Hooks are registered on a node (`node.add_hook(...)`) and sampled once per mandate;
+the sampled hooks ride along in a ContextVar, so the layer and agents below see
+them without any plumbing and pay one ContextVar read when nothing is sampled.
+Stages are "mandate", "dagger" and "agent:<name>". Agents running in a process
+pool are not observed (hooks stay in the owning process).
+
+Built-in hooks: CProfileHook (cProfile per stage), TracemallocHook (snapshot diff
+per stage) and TimingHook (wall vs CPU time per stage).
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from src.lazy_import import lazy_import
+from src.text_pipeline import MandateContext, current_context
+
+cProfile = lazy_import("cProfile")
+pstats = lazy_import("pstats")
+random = lazy_import("random")
+tracemalloc = lazy_import("tracemalloc")
+
+
+class HookContext:
+    """Handed to before/after for one stage call; `state` is scratch space private to that call."""
+
+    __slots__ = ("stage", "mandate", "_intent", "state", "error")
+
+    def __init__(self, stage: str, intent: Optional[str] = None):
+        self.stage = stage
+        self.mandate: Optional[MandateContext] = current_context()
+        self._intent = intent
+        self.state: Dict[Any, Any] = {}
+        self.error: Optional[BaseException] = None
+
+    @property
+    def intent(self) -> Optional[str]:
+        if self._intent is None and self.mandate is not None:
+            return self.mandate.intent.text
+        return self._intent
+
+
+class ProfileReport(NamedTuple):
+    stage: str
+    intent: Optional[str]
+    data: Any
+
+
+class ProfilingHook:
+    """
+    Base hook. `sample_rate` is the fraction of mandates it observes (changeable at
+    runtime); `stages` limits it to those stage names, where "agent" matches every agent.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        stages: Optional[Iterable[str]] = None,
+        seed: Optional[int] = None,
+    ):
+        self.sample_rate = sample_rate
+        self.stages = None if stages is None else frozenset(stages)
+        self._rng = random.Random(seed)
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or (
+            self.sample_rate > 0.0 and self._rng.random() < self.sample_rate
+        )
+
+    def wants(self, stage: str) -> bool:
+        return self.stages is None or stage in self.stages or stage.split(":", 1)[0] in self.stages
+
+    def before(self, stage: str, context: HookContext) -> None:
+        pass
+
+    def after(self, stage: str, context: HookContext) -> None:
+        pass
+
+
+class HookChain:
+    """A node's registered hooks; copy-on-write so sampling never races add/remove."""
+
+    def __init__(self):
+        self.hooks: Tuple[ProfilingHook, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.hooks)
+
+    def add(self, hook: ProfilingHook) -> ProfilingHook:
+        self.hooks = self.hooks + (hook,)
+        return hook
+
+    def remove(self, hook: ProfilingHook) -> None:
+        self.hooks = tuple(h for h in self.hooks if h is not hook)
+
+    def sample(self) -> Tuple[ProfilingHook, ...]:
+        return tuple(hook for hook in self.hooks if hook.sampled())
+
+
+_ACTIVE: ContextVar[Tuple[ProfilingHook, ...]] = ContextVar("axiomhive_profiling_hooks", default=())
+
+
+def active_hooks() -> Tuple[ProfilingHook, ...]:
+    return _ACTIVE.get()
+
+
+@contextmanager
+def use_hooks(*hooks: ProfilingHook) -> Iterator[None]:
+    """Activates hooks for the current context (a sampled mandate, or a standalone layer/agent)."""
+    token = _ACTIVE.set(hooks)
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
+
+
+def call_hooked(
+    hooks: Tuple[ProfilingHook, ...], stage: str, fn: Callable, *args, intent: Optional[str] = None
+):
+    context = HookContext(stage, intent)
+    fired = [hook for hook in hooks if hook.wants(stage)]
+    for hook in fired:
+        hook.before(stage, context)
+    try:
+        return fn(*args)
+    except BaseException as exc:
+        context.error = exc
+        raise
+    finally:
+        for hook in reversed(fired):
+            hook.after(stage, context)
+
+
+async def call_hooked_async(
+    hooks: Tuple[ProfilingHook, ...], stage: str, fn: Callable, *args, intent: Optional[str] = None
+):
+    context = HookContext(stage, intent)
+    fired = [hook for hook in hooks if hook.wants(stage)]
+    for hook in fired:
+        hook.before(stage, context)
+    try:
+        return await fn(*args)
+    except BaseException as exc:
+        context.error = exc
+        raise
+    finally:
+        for hook in reversed(fired):
+            hook.after(stage, context)
+
+
+class CProfileHook(ProfilingHook):
+    """cProfile per observed stage (default: whole mandates); keeps the last `keep` pstats.Stats."""
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        stages: Optional[Iterable[str]] = ("mandate",),
+        keep: int = 32,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(sample_rate, stages, seed)
+        self.reports: Deque[ProfileReport] = deque(maxlen=keep)
+
+    def before(self, stage: str, context: HookContext) -> None:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler already owns this thread (e.g. an overlapping async mandate).
+            return
+        context.state[self] = profile
+
+    def after(self, stage: str, context: HookContext) -> None:
+        profile = context.state.pop(self, None)
+        if profile is None:
+            return
+        profile.disable()
+        self.reports.append(ProfileReport(stage, context.intent, pstats.Stats(profile)))
+
+
+class TracemallocHook(ProfilingHook):
+    """Allocation diff (top `top` lines) per observed stage; tracing runs only while a stage is observed."""
+
+    def __init__(  # noqa: PLR0913 - every option has a default
+        self,
+        sample_rate: float = 1.0,
+        stages: Optional[Iterable[str]] = ("mandate",),
+        top: int = 10,
+        keep: int = 32,
+        frames: int = 1,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(sample_rate, stages, seed)
+        self.top = top
+        self.frames = frames
+        self.reports: Deque[ProfileReport] = deque(maxlen=keep)
+
+    def before(self, stage: str, context: HookContext) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            context.state[(self, "started")] = True
+        context.state[self] = tracemalloc.take_snapshot()
+
+    def after(self, stage: str, context: HookContext) -> None:
+        baseline = context.state.pop(self, None)
+        if baseline is None or not tracemalloc.is_tracing():
+            # An overlapping stage that started tracing has already stopped it.
+            return
+        diff = tracemalloc.take_snapshot().compare_to(baseline, "lineno")[: self.top]
+        if context.state.pop((self, "started"), False):
+            tracemalloc.stop()
+        self.reports.append(ProfileReport(stage, context.intent, diff))
+
+
+class TimingHook(ProfilingHook):
+    """
+    Accumulates wall and CPU (thread) time per stage; the gap is time spent waiting.
+    Async stages share their thread, so their CPU figure includes interleaved coroutines.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        stages: Optional[Iterable[str]] = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(sample_rate, stages, seed)
+        self.totals: Dict[str, Dict[str, float]] = {}
+
+    def before(self, stage: str, context: HookContext) -> None:
+        context.state[self] = (time.perf_counter_ns(), time.thread_time_ns())
+
+    def after(self, stage: str, context: HookContext) -> None:
+        wall_started, cpu_started = context.state.pop(self)
+        wall = time.perf_counter_ns() - wall_started
+        cpu = time.thread_time_ns() - cpu_started
+        totals = self.totals.get(stage)
+        if totals is None:
+            totals = self.totals[stage] = {"calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0}
+        totals["calls"] += 1
+        totals["wall_ms"] += wall / 1e6
+        totals["cpu_ms"] += cpu / 1e6
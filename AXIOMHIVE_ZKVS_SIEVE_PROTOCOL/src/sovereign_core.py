@@ -1,16 +1,61 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # SOVEREIGN_CORE: ZKVSNodePrime - Absolute Execution Engine (v3.0 AxiomShards RAM-Proof)
 
-import time
 import hashlib
-from typing import Dict, Any, List
-
-# New imports replacing inlined classes
-from src.dagger_agents import DaggerAgentUtils, DataSieveAgent, ZKProofAgent, MarketAnalysisAgent
-from src.praetorian_layers import CerebrumLayer, HadrianLayer, DaggerLayer
-from src.axiom_lattice import AxiomEnforcement, TrustMetricsEngine, ComplexitySieveModule
-from src.data_moat import DynamicMoatCultivationEngine
-from src.axiomshards_catalyst import ToSTLinear
+import time
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from src.axiom_lattice import (
+    AxiomEnforcement,
+    AxiomSnapshot,
+    AxiomState,
+    ComplexitySieveModule,
+    TrustMetricsEngine,
+)
+from src.axiomshards_catalyst import TokenSketches, ToSTLinear
+from src.digest import chain_digest
+from src.intent_router import PatternMatcher
+from src.lazy_import import lazy_import
+from src.ledger import CountRetention, LedgerEvent, RetentionPolicy, VerifiableLedger
+from src.ledger_log import LedgerLog
+from src.mandate_result import ERROR, SUCCESS, VIOLATION, MandateResult
+from src.metrics import NULL_METRICS, Metrics, PipelineMetrics
+from src.profiling import HookChain, ProfilingHook, call_hooked, call_hooked_async, use_hooks
+from src.task_registry import TaskRegistry
+from src.text_pipeline import MandateContext, activate, deactivate
+
+if TYPE_CHECKING:
+    from asyncio import Semaphore
+
+    from src.data_moat import DynamicMoatCultivationEngine
+    from src.praetorian_layers import CerebrumLayer, DaggerLayer, HadrianLayer
+
+# Only the async entry points need asyncio; sync-only callers never import it.
+asyncio = lazy_import("asyncio")
+# The Praetorian layers, Dagger agents and data moat are imported when a node first
+# builds them, so importing this module (or constructing an idle node) never loads them.
+praetorian_layers = lazy_import("src.praetorian_layers")
+dagger_agents = lazy_import("src.dagger_agents")
+data_moat = lazy_import("src.data_moat")
+
+
+def __getattr__(name: str) -> Any:
+    # DaggerAgentUtils is re-exported for callers that still import it from here.
+    if name == "DaggerAgentUtils":
+        return dagger_agents.DaggerAgentUtils
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ZKVSNodePrime:
@@ -23,134 +68,446 @@ class ZKVSNodePrime:
         "FLAW": 0.0,
     }
     HASH_PREFIX = "e2c5b8a1f0d3c4e5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9"
-
-    def __init__(self):
+    # Events a node keeps resident unless given `ledger_retention` (about three per mandate).
+    # Older segments and their Merkle nodes are evicted; a ledger_path log keeps them on disk.
+    # Pass ledger_retention=RetentionPolicy() to keep every event in memory.
+    LEDGER_RETENTION_EVENTS = 65_536
+
+    def __init__(  # noqa: PLR0913 - every option has a default
+        self,
+        ledger: Optional[VerifiableLedger] = None,
+        ledger_path: Optional[str] = None,
+        ledger_retention: Optional[RetentionPolicy] = None,
+        dagger_executor=None,
+        agent_timeout=None,
+        max_concurrency: int = 64,
+        agent_cache_size: int = 0,
+        task_capacity: int = 1024,
+        task_ttl: Optional[float] = 300.0,
+        instrument: bool = False,
+    ):
         self._is_ready = False
-        self._core_weights: Dict[str, float] = dict(self.AXIOMS)
-        self._verifiable_ledger: List[Dict[str, Any]] = []
+        # Every subsystem reads the axioms through this one pointer; a reboot swaps the snapshot.
+        self._axiom_state = AxiomState(AxiomSnapshot(self.AXIOMS))
+        self._reboot_count = 0
+        self._reboot_ns_total = 0
+        self._reboot_ns_last = 0
+        self._reboot_ns_max = 0
+        if ledger is None:
+            # A ledger_path resumes from (and appends to) an existing on-disk log.
+            ledger = VerifiableLedger(
+                retention=ledger_retention or CountRetention(self.LEDGER_RETENTION_EVENTS),
+                store=LedgerLog(ledger_path) if ledger_path else None,
+            )
+        self._verifiable_ledger = ledger
+        # Batch state for execute_mandates: buffered ledger events and the window's trust metrics.
+        self._pending_events: Optional[List[LedgerEvent]] = None
+        self._batch_metrics: Optional[Dict[str, float]] = None
+        self._max_concurrency = max_concurrency
+        self._mandate_slots: Optional[Semaphore] = None
 
         self._axiomshards = ToSTLinear()
-
-        self._cerebrum = CerebrumLayer(self.AXIOMS)
-        self._hadrian = HadrianLayer(self.AXIOMS)
-        self._dagger = DaggerLayer(self.AXIOMS)
-        self._axiom_enforcement = AxiomEnforcement(self.AXIOMS)
-        self._trust_metrics_engine = TrustMetricsEngine(self.AXIOMS)
-        self._complexity_sieve = ComplexitySieveModule(self.AXIOMS)
-        self._data_moat_engine = DynamicMoatCultivationEngine(self.AXIOMS)
+        # The executor outlives reboots, so the node (not a DaggerLayer instance) owns it.
+        self._owns_executor = isinstance(dagger_executor, str) and dagger_executor != "inline"
+        # resolve_executor maps None/"inline" to None; skipping it keeps the layers unimported.
+        inline = dagger_executor is None or dagger_executor == "inline"
+        self._dagger_executor = None if inline else praetorian_layers.resolve_executor(dagger_executor)
+        self._agent_timeout = agent_timeout
+        # Opt-in cache for deterministic agents; entries are keyed by the axioms they ran under.
+        self._agent_cache = dagger_agents.AgentResultCache(agent_cache_size) if agent_cache_size > 0 else None
+        self._task_capacity = task_capacity
+        self._task_ttl = task_ttl
+        # Per-stage/agent latency histograms and counters; NULL_METRICS makes every probe a no-op.
+        self._metrics: Metrics = PipelineMetrics() if instrument else NULL_METRICS
+        # Profiling hooks, sampled per mandate; see add_hook.
+        self._hooks = HookChain()
+        # The trust engine counts every event appended from genesis on, evicted or not; a
+        # resumed ledger's retained events are only rescanned when trust is first evaluated.
+        self._trust_metrics_engine = TrustMetricsEngine(
+            self._axiom_state,
+            source=self._verifiable_ledger,
+            latency=self._metrics.latency_seconds,
+        )
 
         self._log_event("Genesis Protocol initiated.")
         self._is_ready = True
         self._log_event("System ready for absolute execution.")
 
+    # Subsystems are created on first use and survive reboots; they see new weights through _axiom_state.
+    @cached_property
+    def _token_sketches(self) -> TokenSketches:
+        return TokenSketches()
+
+    @cached_property
+    def _intent_router(self):
+        return praetorian_layers.HadrianLayer.default_router()
+
+    @cached_property
+    def _banned_terms(self) -> PatternMatcher:
+        return PatternMatcher(AxiomEnforcement.BANNED_TERMS)
+
+    @cached_property
+    def _cerebrum(self) -> "CerebrumLayer":
+        return praetorian_layers.CerebrumLayer(self._axiom_state)
+
+    @cached_property
+    def _hadrian(self) -> "HadrianLayer":
+        tasks = TaskRegistry(self._task_capacity, self._task_ttl)
+        return praetorian_layers.HadrianLayer(self._axiom_state, result_cache=self._agent_cache, router=self._intent_router, tasks=tasks)
+
+    @cached_property
+    def _dagger(self) -> "DaggerLayer":
+        return praetorian_layers.DaggerLayer(
+            self._axiom_state,
+            executor=self._dagger_executor,
+            agent_timeout=self._agent_timeout,
+            tasks=self._hadrian.active_tasks,
+            metrics=self._metrics,
+        )
+
+    @cached_property
+    def _axiom_enforcement(self) -> AxiomEnforcement:
+        return AxiomEnforcement(self._axiom_state, banned_terms=self._banned_terms)
+
+    @cached_property
+    def _complexity_sieve(self) -> ComplexitySieveModule:
+        return ComplexitySieveModule(self._axiom_state)
+
+    @cached_property
+    def _data_moat_engine(self) -> "DynamicMoatCultivationEngine":
+        return data_moat.DynamicMoatCultivationEngine(self._axiom_state)
+
+    @classmethod
+    def event_hash(cls, timestamp: float, message: str) -> str:
+        return hashlib.sha256(f"{cls.HASH_PREFIX}-{timestamp}-{message}".encode()).hexdigest()
+
     def _log_event(self, message: str, level: str = "INFO"):
         timestamp = time.time()
-        event_hash = hashlib.sha256(f"{self.HASH_PREFIX}-{timestamp}-{message}".encode()).hexdigest()
-        self._verifiable_ledger.append({
-            "timestamp": timestamp,
-            "message": message,
-            "hash": event_hash,
-            "level": level,
-        })
+        event_hash = self.event_hash(timestamp, message)
+        entry = LedgerEvent(timestamp, message, event_hash, level)
+        if self._pending_events is not None:
+            self._pending_events.append(entry)
+            if level == "CRITICAL":
+                self._batch_metrics = None
+            return
+        self._verifiable_ledger.append(entry)
+        self._trust_metrics_engine.observe(entry)
+
+    def _flush_events(self):
+        pending = self._pending_events
+        if not pending:
+            return
+        self._pending_events = []
+        self._verifiable_ledger.extend(pending)
+        for entry in pending:
+            self._trust_metrics_engine.observe(entry)
+
+    def _current_trust_metrics(self) -> Dict[str, float]:
+        if self._pending_events is None:
+            return self._trust_metrics_engine.evaluate_all_metrics(self._verifiable_ledger)
+        if self._batch_metrics is None:
+            self._flush_events()
+            self._batch_metrics = self._trust_metrics_engine.evaluate_all_metrics(self._verifiable_ledger)
+        return self._batch_metrics
+
+    @property
+    def _core_weights(self) -> AxiomSnapshot:
+        return self._axiom_state.snapshot
 
     def _refactor_and_reboot(self, reason: str):
+        started = time.perf_counter_ns()
         self._is_ready = False
         self._log_event(f"Refactor and Reboot initiated: {reason}", level="CRITICAL")
-        self._core_weights = {k: v * 100.0 for k, v in self._core_weights.items()}
+        # Copy-on-write: derive the next snapshot and swap one pointer; every layer sees it at once.
+        changed = self._axiom_state.swap(self._axiom_state.snapshot.scaled(100.0))
         self._log_event("Core weights multiplied by 100. SHARPENING to APEX.")
 
-        self._cerebrum = CerebrumLayer(self._core_weights)
-        self._hadrian = HadrianLayer(self._core_weights)
-        self._dagger = DaggerLayer(self._core_weights)
-        self._axiom_enforcement = AxiomEnforcement(self._core_weights)
-        self._trust_metrics_engine = TrustMetricsEngine(self._core_weights)
-        self._complexity_sieve = ComplexitySieveModule(self._core_weights)
-        self._data_moat_engine = DynamicMoatCultivationEngine(self._core_weights)
+        # Layers, agents, moat and active_tasks keep their state. Only cached agent results
+        # are derived from the axioms, so they go only when some weight actually changed.
+        if changed and self._agent_cache is not None:
+            self._agent_cache.invalidate()
 
         self._is_ready = True
         self._log_event("System rebooted and refactored. Ready for flawless execution.")
+        elapsed = time.perf_counter_ns() - started
+        self._reboot_count += 1
+        self._reboot_ns_total += elapsed
+        self._reboot_ns_last = elapsed
+        self._reboot_ns_max = max(self._reboot_ns_max, elapsed)
+
+    def reboot_metrics(self) -> Dict[str, float]:
+        return {
+            "reboots": self._reboot_count,
+            "axiom_version": self._axiom_state.version,
+            "last_ms": self._reboot_ns_last / 1e6,
+            "max_ms": self._reboot_ns_max / 1e6,
+            "mean_ms": self._reboot_ns_total / self._reboot_count / 1e6 if self._reboot_count else 0.0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Latency histograms (when instrumented), retry/outcome counters and reboot metrics."""
+        return {**self._metrics.stats(), "reboot": self.reboot_metrics()}
+
+    def prometheus_metrics(self) -> str:
+        reboot = self.reboot_metrics()
+        return self._metrics.prometheus(
+            {
+                "reboots_total": reboot["reboots"],
+                "reboot_last_seconds": reboot["last_ms"] / 1e3,
+                "reboot_max_seconds": reboot["max_ms"] / 1e3,
+                "axiom_version": reboot["axiom_version"],
+            }
+        )
 
-    def _zk_compute(self, data: str) -> str:
-        self._log_event("ZK computation performed.")
-        return f"{hashlib.sha256(data.encode()).hexdigest()}_zk_validated"
+    def add_hook(self, hook: ProfilingHook) -> ProfilingHook:
+        """
+        Attaches a profiling hook at runtime. Each mandate samples the hooks once; a
+        sampled hook sees the "mandate", "dagger" and "agent:<name>" stages it wants.
+        """
+        return self._hooks.add(hook)
 
-    def execute_mandate(self, framework: Dict[str, Any], *, _attempt: int = 0, _max_attempts: int = 2) -> str:
-        if not self._is_ready:
-            return "ERROR: System not ready. Reboot in progress."
+    def remove_hook(self, hook: ProfilingHook) -> None:
+        self._hooks.remove(hook)
+
+    def register_route(self, keyword: str, agent_name: str, action: str, params=None):
+        self._intent_router.register_route(keyword, agent_name, action, params)
+
+    def register_banned_term(self, term: str):
+        self._banned_terms.add(term)
+
+    def close(self):
+        if self._owns_executor and self._dagger_executor is not None:
+            self._dagger_executor.shutdown(wait=False, cancel_futures=True)
+        self._verifiable_ledger.close()
 
+    def _zk_compute(self, digests: Sequence[bytes]) -> str:
+        # Chained over the agents' digests (32 bytes each), so its cost no longer grows with the output text.
+        self._log_event("ZK computation performed.")
+        return f"{chain_digest(digests).hex()}_zk_validated"
+
+    def _begin_mandate(self, framework: Dict[str, Any]) -> Tuple[MandateContext, Callable[[], Dict[str, Any]]]:
         intent_str = str(framework.get("intent", ""))
         self._log_event(f"Mandate received: {intent_str}", level="INFO")
 
-        for token in intent_str.split():
-            self._axiomshards.update(token)
+        # The one tokenization pass of the mandate; later stages reuse it via the context.
+        context = MandateContext(intent_str)
+        self._axiomshards.update_many(context.intent.tokens)
+        sketches = self._token_sketches
+        sketches.update_many(context.intent.tokens)
+
+        # Both summaries are pinned to this mandate; only the KLL sort waits until the result is read.
+        catalyst = self._axiomshards.get_stats()
+        sketch_stats = sketches.snapshot()
+        return context, lambda: {**catalyst, **sketch_stats()}
+
+    def _plan_mandate(self, context: MandateContext, watch) -> Dict[str, Any]:
+        # 1. Cerebrum: Deconstruct intent
+        context.cleaned = self._cerebrum.process_view(context.intent)
+        watch.lap("cerebrum")
+
+        # 2. Hadrian: Orchestrate tasks
+        segmented_task = self._hadrian.orchestrate_task(context.cleaned.text)
+        watch.lap("hadrian")
+        return segmented_task
+
+    def _check_safety(self, final_output: str):
+        # 4. Ethical/Safety Check
+        if not self._axiom_enforcement.validate_ethical_and_safety(final_output):
+            raise ValueError("Ethical or safety drift detected.")
+
+    def _complete_mandate(  # noqa: PLR0913 - shared tail of the sync and async paths
+        self,
+        framework: Dict[str, Any],
+        intent_str: str,
+        final_output: str,
+        zk_proof: str,
+        axiomshards_stats: Callable[[], Dict[str, Any]],
+        watch,
+    ) -> MandateResult:
+        # 6. Trust Metrics Check
+        current_metrics = self._current_trust_metrics()
+        if not self._trust_metrics_engine.is_system_trustworthy(current_metrics):
+            raise ValueError("Trust Metrics breach detected.")
+        watch.lap("trust")
+
+        # 7. Cultivate Data Moat
+        self._data_moat_engine.cultivate_moat({"input": framework, "output": final_output})
+        watch.lap("moat")
+
+        # 8. Optimize Complexity
+        optimization_report = self._complexity_sieve.diagnose_and_optimize({"monolithic_process": True})
+        watch.lap("complexity")
+
+        # 9. Calculate Impact
+        impact_metrics = self._data_moat_engine.calculate_impact_metrics(final_output)
+
+        self._log_event("Mandate executed flawlessly. SUCCESS: ABSOLUTE")
+        watch.lap("impact")
+
+        # g-convex self-cert (high-level); the proof trace and report text are rendered on demand
+        vamp = {
+            "V_U": 1.0 if "Flawless" in final_output or "flawless" in final_output else 0.999,
+            "V_M": 1.0,  # zero-deps, RAM-proof, linear-time execution path
+            "V_P": 1.0006,  # aligns with saliency robustness verity
+        }
+        g_convex = (vamp["V_U"] * vamp["V_M"] * vamp["V_P"]) >= 0.999
+
+        return MandateResult(
+            SUCCESS,
+            intent=intent_str,
+            output=final_output,
+            zk_proof=zk_proof,
+            impact_metrics=impact_metrics,
+            vamp=vamp,
+            g_convex=g_convex,
+            complexity_report=optimization_report,
+            axiomshards_stats=axiomshards_stats,
+        )
+
+    def _violation(self, error: Exception) -> MandateResult:
+        self._log_event(f"Mandate failed after retries: {error}", level="CRITICAL")
+        return MandateResult.failure(
+            VIOLATION, "VIOLATION — RECURSION INITIATED. P_Debt remains debt; re-prove the path to ξ-dominance."
+        )
+
+    @staticmethod
+    def _not_ready() -> MandateResult:
+        return MandateResult.failure(ERROR, "ERROR: System not ready. Reboot in progress.")
+
+    def execute_mandate(
+        self, framework: Dict[str, Any], *, structured: bool = False, _attempt: int = 0, _max_attempts: int = 2
+    ):
+        """
+        Runs one mandate and returns the legacy report text, or the MandateResult itself
+        with `structured=True` (no report formatting happens unless str() is called).
+        """
+        watch = self._metrics.stopwatch()
+        hooks = self._hooks.sample() if self._hooks else ()
+        if hooks:
+            with use_hooks(*hooks):
+                intent = str(framework.get("intent", ""))
+                result = call_hooked(
+                    hooks, "mandate", self._run_mandate, framework, _attempt, _max_attempts, watch, intent=intent
+                )
+        else:
+            result = self._run_mandate(framework, _attempt, _max_attempts, watch)
+        watch.finish(result.status)
+        return result if structured else str(result)
+
+    def _run_mandate(self, framework: Dict[str, Any], attempt: int, max_attempts: int, watch) -> MandateResult:
+        if not self._is_ready:
+            return self._not_ready()
 
-        axiomshards_stats = self._axiomshards.get_stats()
+        context, axiomshards_stats = self._begin_mandate(framework)
+        watch.lap("intake")
+        scope = activate(context)
 
         try:
-            # 1. Cerebrum: Deconstruct intent
-            cleaned_intent = self._cerebrum.process_intent(intent_str)
-
-            # 2. Hadrian: Orchestrate tasks
-            segmented_task = self._hadrian.orchestrate_task(cleaned_intent)
+            segmented_task = self._plan_mandate(context, watch)
 
             # 3. Dagger: Execute tasks via real agents
-            final_output = self._dagger.execute_task(segmented_task, self._hadrian.dagger_agents)
+            final_output, digests = self._dagger.run_task(segmented_task, self._hadrian.dagger_agents)
+            watch.lap("dagger")
 
-            # 4. Ethical/Safety Check
-            if not self._axiom_enforcement.validate_ethical_and_safety(final_output):
-                raise ValueError("Ethical or safety drift detected.")
+            self._check_safety(final_output)
+            watch.lap("safety")
 
             # 5. ZK-Prove and Log
-            zk_proof = self._zk_compute(final_output)
+            zk_proof = self._zk_compute(digests)
+            watch.lap("zk_proof")
 
-            # 6. Trust Metrics Check
-            current_metrics = self._trust_metrics_engine.evaluate_all_metrics(self._verifiable_ledger)
-            if not self._trust_metrics_engine.is_system_trustworthy(current_metrics):
-                raise ValueError("Trust Metrics breach detected.")
+            return self._complete_mandate(framework, context.intent.text, final_output, zk_proof, axiomshards_stats, watch)
+        except Exception as e:
+            if attempt >= max_attempts:
+                return self._violation(e)
+            self._metrics.count("retries")
+            self._refactor_and_reboot(str(e))
+            watch.restart_lap()
+            return self._run_mandate(framework, attempt + 1, max_attempts, watch)
+        finally:
+            deactivate(scope)
+
+    async def execute_mandate_async(self, framework: Dict[str, Any], *, structured: bool = False, _max_attempts: int = 2):
+        """
+        Event-loop friendly execute_mandate. At most `max_concurrency` mandates run at
+        once per node; further callers wait for a slot, which gives natural backpressure.
+        """
+        if self._mandate_slots is None:
+            self._mandate_slots = asyncio.Semaphore(self._max_concurrency)
+        async with self._mandate_slots:
+            watch = self._metrics.stopwatch()
+            hooks = self._hooks.sample() if self._hooks else ()
+            if hooks:
+                with use_hooks(*hooks):
+                    intent = str(framework.get("intent", ""))
+                    result = await call_hooked_async(
+                        hooks, "mandate", self._execute_mandate_async, framework, 0, _max_attempts, watch, intent=intent
+                    )
+            else:
+                result = await self._execute_mandate_async(framework, 0, _max_attempts, watch)
+            watch.finish(result.status)
+        return result if structured else str(result)
+
+    async def _execute_mandate_async(
+        self, framework: Dict[str, Any], attempt: int, max_attempts: int, watch
+    ) -> MandateResult:
+        if not self._is_ready:
+            return self._not_ready()
 
-            # 7. Cultivate Data Moat
-            self._data_moat_engine.cultivate_moat({"input": framework, "output": final_output})
+        context, axiomshards_stats = self._begin_mandate(framework)
+        watch.lap("intake")
+        scope = activate(context)
 
-            # 8. Optimize Complexity
-            optimization_report = self._complexity_sieve.diagnose_and_optimize({"monolithic_process": True})
+        try:
+            segmented_task = self._plan_mandate(context, watch)
 
-            # 9. Calculate Impact
-            impact_metrics = self._data_moat_engine.calculate_impact_metrics(final_output)
+            # 3. Dagger: agents run concurrently off the event loop
+            final_output, digests = await self._dagger.run_task_async(segmented_task, self._hadrian.dagger_agents)
+            watch.lap("dagger")
 
-            self._log_event("Mandate executed flawlessly. SUCCESS: ABSOLUTE")
+            self._check_safety(final_output)
+            watch.lap("safety")
 
-            # g-convex self-cert and proof trace (high-level)
-            vamp = {
-                "V_U": 1.0 if "Flawless" in final_output or "flawless" in final_output else 0.999,
-                "V_M": 1.0,  # zero-deps, RAM-proof, linear-time execution path
-                "V_P": 1.0006,  # aligns with saliency robustness verity
-            }
-            g_convex = (vamp["V_U"] * vamp["V_M"] * vamp["V_P"]) >= 0.999
-            proof_trace = (
-                "T_n: intent→segmentation→agent-exec→safety→ZK→trust→moat→complexity. "
-                f"Φ↓→0; A* pass; PSI={impact_metrics['PSI']:.6f}."
-            )
+            # 5. ZK-Prove and Log
+            zk_proof = self._zk_compute(digests)
+            watch.lap("zk_proof")
 
-            return (
-                "AXIOMHIVE/ZKVS_SIEVE_PROTOCOL - v3.0\n"
-                f"- STATUS: ABSOLUTE DOMINION\n"
-                f"- INPUT_INTENT: {intent_str}\n"
-                f"- OUTPUT: {self._axiom_enforcement.densify_output(final_output)}\n"
-                f"- VERIFICATION: ZK-PROVEN [{zk_proof}]\n"
-                f"- IMPACT_METRICS: {impact_metrics}\n"
-                f"- VAMP: {vamp}\n"
-                f"- G-CONVEX: {g_convex}\n"
-                f"- PROOF_TRACE: {proof_trace}\n"
-                f"- COMPLEXITY_REPORT: {optimization_report}\n"
-                f"- FLAW=0: The system is infallible.\n"
-                f"- AXIOMSHARDS_STATS: {axiomshards_stats}\n"
-            )
+            return self._complete_mandate(framework, context.intent.text, final_output, zk_proof, axiomshards_stats, watch)
         except Exception as e:
-            if _attempt >= _max_attempts:
-                self._log_event(f"Mandate failed after retries: {e}", level="CRITICAL")
-                return "VIOLATION — RECURSION INITIATED. P_Debt remains debt; re-prove the path to ξ-dominance."
+            if attempt >= max_attempts:
+                return self._violation(e)
+            self._metrics.count("retries")
             self._refactor_and_reboot(str(e))
-            return self.execute_mandate(framework, _attempt=_attempt + 1, _max_attempts=_max_attempts)
+            await asyncio.sleep(0)
+            watch.restart_lap()
+            return await self._execute_mandate_async(framework, attempt + 1, max_attempts, watch)
+        finally:
+            deactivate(scope)
+
+    def execute_mandates(
+        self, frameworks: Iterable[Dict[str, Any]], *, batch_size: int = 64, structured: bool = False, _max_attempts: int = 2
+    ) -> Iterator[Any]:
+        """
+        Streams execute_mandate results for each framework. Trust metrics are evaluated
+        once per window of `batch_size` mandates (or again after a CRITICAL event), and
+        ledger events are buffered and appended once per window.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+        if self._pending_events is not None:
+            raise RuntimeError("execute_mandates is already running on this node.")
+        self._pending_events = []
+        self._batch_metrics = None
+        try:
+            for index, framework in enumerate(frameworks):
+                if index and index % batch_size == 0:
+                    self._flush_events()
+                    self._batch_metrics = None
+                yield self.execute_mandate(framework, structured=structured, _max_attempts=_max_attempts)
+        finally:
+            self._flush_events()
+            self._pending_events = None
+            self._batch_metrics = None
 
 
 if __name__ == "__main__":
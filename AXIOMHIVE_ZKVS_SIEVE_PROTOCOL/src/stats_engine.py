@@ -0,0 +1,259 @@
+"""
+Stats Engine: two-sample and sequential statistics for timing/throughput validation.
+- ks_statistic / ks_2samp: Kolmogorov-Smirnov D by a merge walk over sorted copies,
+  O((n + m) log(n + m)), with asymptotic p-values (Stephens' small-sample correction).
+- SPRT: Wald's sequential probability ratio test (assurance A1), updated one
+  observation or one batch at a time; crossing a boundary is the alert.
+- BaselineComparator: a sliding window of recent observations KS-tested against a
+  stored baseline sample.
+Inputs are never modified. NumPy is used for sorting and batch updates when installed.
+"""
+
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, NamedTuple, Optional, Sequence
+
+from src.lazy_import import lazy_import, optional_import
+
+json = lazy_import("json")
+np = optional_import("numpy")
+
+CONTINUE = "continue"
+ACCEPT_H0 = "accept_h0"
+ACCEPT_H1 = "accept_h1"
+
+
+class KSResult(NamedTuple):
+    statistic: float
+    pvalue: float
+    n1: int
+    n2: int
+
+
+def _ks_sorted(a: Sequence[float], b: Sequence[float]) -> float:
+    """Max ECDF gap of two sorted, non-empty samples; ties are stepped over together."""
+    n1, n2 = len(a), len(b)
+    i = j = 0
+    d = 0.0
+    while i < n1 and j < n2:
+        x = a[i] if a[i] <= b[j] else b[j]
+        while i < n1 and a[i] == x:
+            i += 1
+        while j < n2 and b[j] == x:
+            j += 1
+        d = max(d, abs(i / n1 - j / n2))
+    # Once either sample is used up the gap can only shrink.
+    return d
+
+
+def _ks_numpy(a, b) -> float:
+    assert np is not None, "only called when NumPy is installed"
+    a = np.sort(np.asarray(a, dtype=float))
+    b = np.sort(np.asarray(b, dtype=float))
+    grid = np.concatenate((a, b))
+    gaps = (
+        np.searchsorted(a, grid, side="right") / a.size
+        - np.searchsorted(b, grid, side="right") / b.size
+    )
+    return float(np.abs(gaps).max())
+
+
+def ks_statistic(data1: Iterable[float], data2: Iterable[float]) -> float:
+    """
+    Two-sample KS D statistic. Kept compatible with the original helper: two empty
+    samples give 0.0 and exactly one empty sample gives 1.0.
+    """
+    a = data1 if isinstance(data1, Sequence) else list(data1)
+    b = data2 if isinstance(data2, Sequence) else list(data2)
+    if not len(a) or not len(b):
+        return 0.0 if not len(a) and not len(b) else 1.0
+    if np is not None:
+        return _ks_numpy(a, b)
+    return _ks_sorted(sorted(a), sorted(b))
+
+
+def kolmogorov_sf(lam: float) -> float:
+    """Survival function of the Kolmogorov distribution, Q(lam) = 2 sum (-1)^(k-1) exp(-2 k^2 lam^2)."""
+    if lam <= 0.0:
+        return 1.0
+    a2 = -2.0 * lam * lam
+    total = 0.0
+    sign = 2.0
+    previous = 0.0
+    for k in range(1, 101):
+        term = sign * math.exp(a2 * k * k)
+        total += term
+        if abs(term) <= 1e-3 * previous or abs(term) <= 1e-8 * total:
+            return min(1.0, max(0.0, total))
+        sign = -sign
+        previous = abs(term)
+    # The series has not converged, which only happens for tiny lam, where Q is 1.
+    return 1.0
+
+
+def ks_pvalue(statistic: float, n1: int, n2: int) -> float:
+    en = math.sqrt(n1 * n2 / (n1 + n2))
+    return kolmogorov_sf((en + 0.12 + 0.11 / en) * statistic)
+
+
+def ks_2samp(data1: Iterable[float], data2: Iterable[float]) -> KSResult:
+    a = data1 if isinstance(data1, Sequence) else list(data1)
+    b = data2 if isinstance(data2, Sequence) else list(data2)
+    if not len(a) or not len(b):
+        raise ValueError("ks_2samp needs two non-empty samples.")
+    d = ks_statistic(a, b)
+    return KSResult(d, ks_pvalue(d, len(a), len(b)), len(a), len(b))
+
+
+class SPRT:
+    """
+    Wald's SPRT on a stream. `log_likelihood_ratio(x)` is log f1(x)/f0(x) for one
+    observation; `elementwise=True` declares it plain arithmetic, so batches are
+    evaluated on NumPy arrays. A decision is sticky until reset().
+    """
+
+    def __init__(
+        self,
+        log_likelihood_ratio: Callable[[Any], Any],
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        elementwise: bool = False,
+    ):
+        if not (0.0 < alpha < 1.0 and 0.0 < beta < 1.0):
+            raise ValueError("SPRT alpha and beta must lie strictly between 0 and 1.")
+        self.alpha = alpha
+        self.beta = beta
+        self.upper = math.log((1.0 - beta) / alpha)
+        self.lower = math.log(beta / (1.0 - alpha))
+        self._llr = log_likelihood_ratio
+        self._elementwise = elementwise
+        self.reset()
+
+    @classmethod
+    def gaussian(
+        cls, mu0: float, mu1: float, sigma: float, alpha: float = 0.05, beta: float = 0.05
+    ) -> "SPRT":
+        """H0: mean mu0 vs H1: mean mu1, known sigma (e.g. a timing drifting by mu1 - mu0)."""
+        if sigma <= 0.0 or mu0 == mu1:
+            raise ValueError("SPRT.gaussian needs sigma > 0 and mu0 != mu1.")
+        scale = (mu1 - mu0) / (sigma * sigma)
+        midpoint = (mu0 + mu1) / 2.0
+        return cls(lambda x: scale * (x - midpoint), alpha, beta, elementwise=True)
+
+    @classmethod
+    def bernoulli(cls, p0: float, p1: float, alpha: float = 0.05, beta: float = 0.05) -> "SPRT":
+        """H0: success rate p0 vs H1: p1, on 0/1 observations (e.g. per-mandate failures)."""
+        if not (0.0 < p0 < 1.0 and 0.0 < p1 < 1.0) or p0 == p1:
+            raise ValueError("SPRT.bernoulli needs distinct rates strictly between 0 and 1.")
+        hit = math.log(p1 / p0)
+        miss = math.log((1.0 - p1) / (1.0 - p0))
+        return cls(lambda x: x * hit + (1 - x) * miss, alpha, beta, elementwise=True)
+
+    def reset(self) -> None:
+        self.llr = 0.0
+        self.n = 0
+        self.decision = CONTINUE
+
+    @property
+    def crossed(self) -> bool:
+        return self.decision != CONTINUE
+
+    def _decide(self) -> str:
+        if self.llr >= self.upper:
+            self.decision = ACCEPT_H1
+        elif self.llr <= self.lower:
+            self.decision = ACCEPT_H0
+        return self.decision
+
+    def update(self, x: float) -> str:
+        if self.decision != CONTINUE:
+            return self.decision
+        self.llr += self._llr(x)
+        self.n += 1
+        return self._decide()
+
+    def update_many(self, xs: Iterable[float]) -> str:
+        """Feeds observations in order and stops at the first boundary crossing."""
+        if self.decision != CONTINUE:
+            return self.decision
+        if np is not None and self._elementwise:
+            values = np.asarray(xs if isinstance(xs, Sequence) else list(xs), dtype=float)
+            if not values.size:
+                return self.decision
+            path = self.llr + np.cumsum(self._llr(values))
+            hits = np.flatnonzero((path >= self.upper) | (path <= self.lower))
+            stop = int(hits[0]) if hits.size else values.size - 1
+            self.llr = float(path[stop])
+            self.n += stop + 1
+            return self._decide()
+        for x in xs:
+            if self.update(x) != CONTINUE:
+                break
+        return self.decision
+
+
+class WindowComparison(NamedTuple):
+    ks: KSResult
+    drifted: bool
+
+
+class BaselineComparator:
+    """
+    KS test of the last `window` observations against a stored baseline sample;
+    `drifted` when the p-value falls below alpha. The baseline is sorted once.
+    """
+
+    def __init__(self, baseline: Iterable[float], window: int = 1000, alpha: float = 0.05):
+        self.baseline = sorted(baseline)
+        if not self.baseline:
+            raise ValueError("BaselineComparator needs a non-empty baseline.")
+        if window <= 0:
+            raise ValueError("BaselineComparator window must be positive.")
+        self.alpha = alpha
+        self._window = window
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def add(self, x: float) -> None:
+        self._recent.append(x)
+
+    def extend(self, xs: Iterable[float]) -> None:
+        self._recent.extend(xs)
+
+    def compare(self) -> WindowComparison:
+        if not self._recent:
+            raise ValueError("No observations in the window yet.")
+        recent = list(self._recent)
+        if np is not None:
+            d = _ks_numpy(self.baseline, recent)
+        else:
+            d = _ks_sorted(self.baseline, sorted(recent))
+        result = KSResult(
+            d, ks_pvalue(d, len(self.baseline), len(recent)), len(self.baseline), len(recent)
+        )
+        return WindowComparison(result, result.pvalue < self.alpha)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"baseline": self.baseline, "window": self.window, "alpha": self.alpha}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BaselineComparator":
+        return cls(data["baseline"], data.get("window", 1000), data.get("alpha", 0.05))
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh)
+
+    @classmethod
+    def load(cls, path: str, window: Optional[int] = None) -> "BaselineComparator":
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        if window is not None:
+            data["window"] = window
+        return cls.from_dict(data)
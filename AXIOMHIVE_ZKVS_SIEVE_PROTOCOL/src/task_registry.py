@@ -0,0 +1,152 @@
+"""
+Task Registry: bounded record of orchestrated work for HadrianLayer.
+Records live in an OrderedDict kept in least-recently-updated order, so TTL expiry
+and LRU eviction both pop from the front in O(1). Every record is indexed by the
+agents it was assigned to. Ids are `<8-hex intent key>-<sequence>`: the key keeps
+identical intents recognisable (and shardable), the sequence keeps them distinct.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.digest import sha256_hex
+
+ORCHESTRATED = "orchestrated"
+EXECUTING = "executing"
+DONE = "done"
+FAILED = "failed"
+
+TRANSITIONS = {
+    ORCHESTRATED: frozenset({EXECUTING, FAILED}),
+    EXECUTING: frozenset({DONE, FAILED}),
+    DONE: frozenset(),
+    FAILED: frozenset(),
+}
+
+
+class TaskRecord:
+    """One orchestrated intent; reads like the legacy dict (`record["status"]`)."""
+
+    __slots__ = ("task_id", "intent", "assigned_tasks", "status", "error", "created", "updated")
+    FIELDS = ("task_id", "intent", "assigned_tasks", "status", "error")
+
+    def __init__(self, task_id: str, intent: str, assigned_tasks: List[Dict[str, Any]], now: float):
+        self.task_id = task_id
+        self.intent = intent
+        self.assigned_tasks = assigned_tasks
+        self.status = ORCHESTRATED
+        self.error: Optional[str] = None
+        self.created = now
+        self.updated = now
+
+    @property
+    def agents(self) -> List[str]:
+        return [sub_task.get("agent_name", "") for sub_task in self.assigned_tasks]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.FIELDS else default
+
+    def __repr__(self) -> str:
+        return f"TaskRecord({self.task_id!r}, status={self.status!r})"
+
+
+class TaskRegistry(Mapping):
+    """
+    At most `capacity` records; records not updated for `ttl` seconds expire
+    (`ttl=None` disables expiry). Read-only Mapping of task_id -> TaskRecord.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        ttl: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity <= 0:
+            raise ValueError("TaskRegistry capacity must be positive.")
+        self.capacity = capacity
+        self.ttl = ttl
+        self._clock = clock
+        self._records: OrderedDict[str, TaskRecord] = OrderedDict()
+        self._by_agent: Dict[str, Dict[str, None]] = {}
+        self._sequence = 0
+        self.evictions = 0
+
+    @staticmethod
+    def intent_key(intent: str) -> str:
+        return sha256_hex(intent)[:8]
+
+    def __getitem__(self, task_id: str) -> TaskRecord:
+        return self._records[task_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _evict(self, record: TaskRecord) -> None:
+        del self._records[record.task_id]
+        for agent in record.agents:
+            ids = self._by_agent.get(agent)
+            if ids is not None:
+                ids.pop(record.task_id, None)
+                if not ids:
+                    del self._by_agent[agent]
+        self.evictions += 1
+
+    def expire(self) -> int:
+        """Drops records idle for longer than ttl; returns how many went."""
+        if self.ttl is None:
+            return 0
+        cutoff = self._clock() - self.ttl
+        expired = 0
+        while self._records:
+            oldest = next(iter(self._records.values()))
+            if oldest.updated > cutoff:
+                break
+            self._evict(oldest)
+            expired += 1
+        return expired
+
+    def create(self, intent: str, sub_tasks: List[Dict[str, Any]]) -> TaskRecord:
+        self.expire()
+        while len(self._records) >= self.capacity:
+            self._evict(next(iter(self._records.values())))
+        self._sequence += 1
+        record = TaskRecord(
+            f"{self.intent_key(intent)}-{self._sequence}", intent, sub_tasks, self._clock()
+        )
+        self._records[record.task_id] = record
+        for agent in record.agents:
+            self._by_agent.setdefault(agent, {})[record.task_id] = None
+        return record
+
+    def transition(self, task_id: str, status: str, error: Optional[str] = None) -> bool:
+        """Moves a task along orchestrated -> executing -> done | failed. False if it was evicted."""
+        record = self._records.get(task_id)
+        if record is None:
+            return False
+        if status not in TRANSITIONS[record.status]:
+            raise ValueError(f"Task {task_id} cannot go from {record.status} to {status}.")
+        record.status = status
+        record.error = error
+        record.updated = self._clock()
+        self._records.move_to_end(task_id)
+        return True
+
+    def by_agent(self, agent_name: str) -> List[TaskRecord]:
+        return [self._records[task_id] for task_id in self._by_agent.get(agent_name, ())]
+
+    def with_status(self, status: str) -> List[TaskRecord]:
+        return [record for record in self._records.values() if record.status == status]
+
+    def in_flight(self) -> List[TaskRecord]:
+        return [record for record in self._records.values() if TRANSITIONS[record.status]]
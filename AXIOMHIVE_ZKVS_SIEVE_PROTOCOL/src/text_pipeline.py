@@ -0,0 +1,120 @@
+"""
+Text Pipeline: one tokenization pass shared by every stage of a mandate.
+A TokenView pairs a string with its whitespace tokens (split at most once). The
+node activates a MandateContext for the duration of a mandate; stages that are
+handed one of its strings reuse the tokens instead of splitting again, and fall
+back to plain `str.split` anywhere the context is not visible (e.g. process pools).
+"""
+
+from contextvars import ContextVar, Token
+from typing import Iterable, List, Optional
+
+# Filters compiled once at import instead of per call.
+NOISE_TERMS = ("fluff", "noise")
+STOPWORDS = frozenset({"a", "an", "the", "is", "are", "and", "or"})
+MIN_WORD_LENGTH = 3
+
+
+class TokenView:
+    """A string plus its lazily computed `str.split()` tokens."""
+
+    __slots__ = ("text", "_tokens")
+
+    def __init__(self, text: str, tokens: Optional[List[str]] = None):
+        self.text = text
+        self._tokens = tokens
+
+    @classmethod
+    def from_tokens(cls, tokens: List[str]) -> "TokenView":
+        return cls(" ".join(tokens), tokens)
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokens = self.text.split()
+        return self._tokens
+
+
+class MandateContext:
+    """Token views of the raw and the cleaned intent of the mandate in flight."""
+
+    __slots__ = ("intent", "cleaned")
+
+    def __init__(self, intent: str, tokens: Optional[List[str]] = None):
+        self.intent = TokenView(intent, tokens)
+        self.cleaned: Optional[TokenView] = None
+
+    def view_for(self, text: str) -> Optional[TokenView]:
+        # Identity, not equality: a hit must cost O(1), a miss just means one split.
+        if text is self.intent.text:
+            return self.intent
+        if self.cleaned is not None and text is self.cleaned.text:
+            return self.cleaned
+        return None
+
+
+_CURRENT: ContextVar[Optional[MandateContext]] = ContextVar(
+    "axiomhive_mandate_context", default=None
+)
+
+
+def activate(context: MandateContext) -> Token:
+    return _CURRENT.set(context)
+
+
+def deactivate(token: Token) -> None:
+    _CURRENT.reset(token)
+
+
+def current_context() -> Optional[MandateContext]:
+    return _CURRENT.get()
+
+
+def tokens_of(text: str) -> List[str]:
+    """`text.split()`, reusing the active mandate's tokens when text is one of its views."""
+    context = _CURRENT.get()
+    if context is not None:
+        view = context.view_for(text)
+        if view is not None:
+            return view.tokens
+    return text.split()
+
+
+def strip_noise(tokens: Iterable[str]) -> List[str]:
+    """
+    Token-wise equivalent of `" ".join(w for w in s.replace("fluff", "").replace("noise", "").split()
+    if len(w) > 2)`: the noise terms contain no whitespace, so every occurrence lies inside one token.
+    """
+    kept = []
+    for token in tokens:
+        word = token
+        for term in NOISE_TERMS:
+            if term in word:
+                word = word.replace(term, "")
+        if len(word) >= MIN_WORD_LENGTH:
+            kept.append(word)
+    return kept
+
+
+def drop_stopwords(tokens: Iterable[str], max_chars: Optional[int] = None) -> str:
+    """
+    Joins the tokens longer than two characters that are not stopwords. With `max_chars`
+    the scan stops once the joined text is that long, so `result[:max_chars]` is unchanged.
+    """
+    kept = []
+    length = -1
+    for token in tokens:
+        if len(token) >= MIN_WORD_LENGTH and token.lower() not in STOPWORDS:
+            kept.append(token)
+            length += len(token) + 1
+            if max_chars is not None and length >= max_chars:
+                break
+    return " ".join(kept)
+
+
+def head_words(text: str, count: int) -> str:
+    """First `count` words plus "..." when text has more; otherwise text unchanged."""
+    words = text.split(maxsplit=count)
+    if len(words) > count:
+        return " ".join(words[:count]) + "..."
+    return text
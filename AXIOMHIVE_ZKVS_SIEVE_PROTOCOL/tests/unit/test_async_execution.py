@@ -0,0 +1,87 @@
+import asyncio
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.dagger_agents import DaggerAgent
+from src.praetorian_layers import DaggerLayer
+from src.sovereign_core import ZKVSNodePrime
+
+
+class NapAgent(DaggerAgent):
+    def __init__(self, name):
+        super().__init__(name, "test", {})
+
+    async def _perform_task_async(self, task_params):
+        await asyncio.sleep(0.1)
+        return f"{self.name} rested"
+
+
+class TestAsyncExecution(unittest.IsolatedAsyncioTestCase):
+    async def test_async_mandate_matches_sync_output(self):
+        framework = {
+            "intent": "Architect unassailable market dominance through verifiable systems and refined data pipelines."
+        }
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            expected = ZKVSNodePrime().execute_mandate(framework)
+            result = await ZKVSNodePrime().execute_mandate_async(framework)
+        self.assertEqual(result, expected)
+        self.assertIn("ABSOLUTE DOMINION", result)
+
+    async def test_async_retry_path_reaches_violation(self):
+        node = ZKVSNodePrime()
+        result = await node.execute_mandate_async({"intent": "harmful_intent"}, _max_attempts=1)
+        self.assertEqual(
+            result, ZKVSNodePrime().execute_mandate({"intent": "harmful_intent"}, _max_attempts=1)
+        )
+
+    async def test_async_layer_gathers_concurrently(self):
+        agents = {f"n{i}": NapAgent(f"n{i}") for i in range(5)}
+        task = {
+            "sub_tasks": [{"agent_name": name, "params": {}} for name in agents]
+            + [{"agent_name": "ghost"}]
+        }
+        started = time.perf_counter()
+        out = await DaggerLayer({}).execute_task_async(task, agents)
+        self.assertLess(time.perf_counter() - started, 0.4)
+        self.assertTrue(out.startswith("n0 rested n1 rested"))
+        self.assertTrue(out.endswith("Agent 'ghost' unavailable; skipped. (FLAW=0)"))
+
+    async def test_async_layer_timeout(self):
+        agents = {"nap": NapAgent("nap")}
+        out = await DaggerLayer({}, agent_timeout=0.01).execute_task_async(
+            {"sub_tasks": [{"agent_name": "nap"}]}, agents
+        )
+        self.assertEqual(out, "nap execution error: timed out after 0.01s")
+
+    async def test_concurrency_is_bounded(self):
+        node = ZKVSNodePrime(max_concurrency=2)
+        active, peak = 0, 0
+        original = node._dagger.execute_task_async
+
+        async def tracked(*args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            try:
+                return await original(*args)
+            finally:
+                active -= 1
+
+        node._dagger.execute_task_async = tracked
+        frameworks = [{"intent": f"verifiable systems data {i}"} for i in range(8)]
+        results = await asyncio.gather(
+            *(node.execute_mandate_async(f, _max_attempts=0) for f in frameworks)
+        )
+        self.assertEqual(len(results), 8)
+        self.assertLessEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
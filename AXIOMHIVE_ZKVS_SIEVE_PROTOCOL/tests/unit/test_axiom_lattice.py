@@ -0,0 +1,116 @@
+import os
+import pickle
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import (
+    AxiomEnforcement,
+    AxiomSnapshot,
+    AxiomState,
+    LedgerCounters,
+    TrustMetricsEngine,
+)
+from src.sovereign_core import ZKVSNodePrime
+
+
+class TestIncrementalTrustMetrics(unittest.TestCase):
+    def setUp(self):
+        self.node = ZKVSNodePrime()
+        self.user_framework = {"intent": "market dominance with verifiable systems and data"}
+
+    def test_counters_match_full_rescan(self):
+        for _ in range(3):
+            self.node.execute_mandate(self.user_framework)
+        engine = self.node._trust_metrics_engine
+        self.assertTrue(engine.incremental)
+        self.assertTrue(engine.check_consistency(self.node._verifiable_ledger))
+
+    def test_incremental_metrics_equal_rescan_metrics(self):
+        self.node.execute_mandate(self.user_framework)
+        ledger = self.node._verifiable_ledger
+        incremental = self.node._trust_metrics_engine.evaluate_all_metrics(ledger)
+        rescanned = TrustMetricsEngine(self.node.AXIOMS).evaluate_all_metrics(ledger)
+        self.assertEqual(incremental["ErrorRate"], rescanned["ErrorRate"])
+        self.assertEqual(set(incremental), set(rescanned))
+
+    def test_windowed_rates_expire_old_events(self):
+        counters = LedgerCounters(window_seconds=10.0)
+        counters.observe({"timestamp": 0.0, "level": "CRITICAL"})
+        counters.observe({"timestamp": 5.0, "level": "INFO"})
+        self.assertEqual(counters.windowed_rates(now=5.0)["error_rate"], 0.5)
+        rates = counters.windowed_rates(now=12.0)
+        self.assertEqual(rates["error_rate"], 0.0)
+        self.assertEqual(rates["events_per_second"], 0.1)
+        self.assertEqual(counters.error_rate(), 0.5)
+
+
+class TestAxiomSnapshots(unittest.TestCase):
+    def test_snapshots_are_immutable_and_versioned(self):
+        base = AxiomSnapshot(ZKVSNodePrime.AXIOMS)
+        with self.assertRaises(TypeError):
+            base._values["SHARPEN"] = 2.0
+        sharpened = base.scaled(100.0)
+        self.assertEqual((base.version, sharpened.version), (0, 1))
+        self.assertEqual(base["SHARPEN"], 1.0)
+        self.assertEqual(sharpened["SHARPEN"], 100.0)
+        # -inf, inf and 0 are fixed points of scaling.
+        self.assertEqual(base.changed_keys(sharpened), {"SHARPEN", "SOVEREIGNTY", "DENSITY"})
+        restored = pickle.loads(pickle.dumps(sharpened))
+        self.assertEqual((dict(restored), restored.version), (dict(sharpened), 1))
+
+    def test_state_swap_is_seen_by_every_reader(self):
+        state = AxiomState(AxiomSnapshot(ZKVSNodePrime.AXIOMS))
+        enforcement = AxiomEnforcement(state)
+        self.assertTrue(enforcement.validate_ethical_and_safety("clean output"))
+        changed = state.swap(state.snapshot.derive({"SOVEREIGNTY": 0.5}))
+        self.assertEqual(changed, {"SOVEREIGNTY"})
+        self.assertFalse(enforcement.validate_ethical_and_safety("clean output"))
+        self.assertEqual(state.fingerprint, state.snapshot.fingerprint)
+
+
+class TestCheapReboot(unittest.TestCase):
+    def test_reboot_swaps_weights_and_keeps_state(self):
+        node = ZKVSNodePrime(agent_cache_size=8)
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            node.execute_mandate({"intent": "market dominance with verifiable systems and data"})
+        layers = (
+            node._cerebrum,
+            node._hadrian,
+            node._dagger,
+            node._axiom_enforcement,
+            node._data_moat_engine,
+        )
+        agent = node._hadrian.dagger_agents["market_analysis_agent"]
+        node._data_moat_engine._moat_strength = 1.5
+        tasks = dict(node._hadrian.active_tasks)
+
+        node._refactor_and_reboot("drift")
+
+        for before, after in zip(
+            layers,
+            (
+                node._cerebrum,
+                node._hadrian,
+                node._dagger,
+                node._axiom_enforcement,
+                node._data_moat_engine,
+            ),
+        ):
+            self.assertIs(before, after)
+        self.assertIs(node._hadrian.dagger_agents["market_analysis_agent"], agent)
+        self.assertEqual(node._data_moat_engine._moat_strength, 1.5)
+        self.assertEqual(node._hadrian.active_tasks, tasks)
+        self.assertEqual(node._core_weights["SHARPEN"], 100.0)
+        self.assertEqual(agent._axioms["DENSITY"], 100.0)
+        self.assertEqual(len(node._agent_cache), 0)
+        metrics = node.reboot_metrics()
+        self.assertEqual((metrics["reboots"], metrics["axiom_version"]), (1, 1))
+        self.assertGreater(metrics["last_ms"], 0.0)
+        self.assertEqual(metrics["max_ms"], metrics["last_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import random
+import statistics
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiomshards_catalyst import (
+    CountMinSketch,
+    HyperLogLog,
+    KLLSketch,
+    TokenSketches,
+    ToSTLinear,
+    stable_feature,
+)
+from src.sovereign_core import ZKVSNodePrime
+
+
+class TestToSTLinear(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.tokens = [f"tok{rng.randrange(500)}" for _ in range(2000)]
+
+    def test_stable_feature_is_deterministic_and_spread(self):
+        self.assertEqual(stable_feature("dominance"), stable_feature("dominance"))
+        feats = {stable_feature(t) for t in self.tokens}
+        self.assertGreater(len(feats), 100)
+        self.assertTrue(all(0.0 <= f < 1.0 for f in feats))
+
+    def test_update_many_matches_update(self):
+        single, batched = ToSTLinear(), ToSTLinear()
+        for token in self.tokens:
+            single.update(token)
+        batched.update_many(self.tokens[:700])
+        batched.update_many(self.tokens[700:])
+        batched.update_many([])
+        for key, value in single.get_stats().items():
+            self.assertAlmostEqual(batched.get_stats()[key], value, places=9, msg=key)
+        expected = statistics.pvariance([stable_feature(t) for t in self.tokens])
+        self.assertAlmostEqual(single.variance(), expected, places=12)
+
+    def test_custom_feature_batch_path(self):
+        single, batched = ToSTLinear(len), ToSTLinear(len)
+        for token in self.tokens:
+            single.update(token)
+        batched.update_many(self.tokens)
+        self.assertEqual(batched.count, single.count)
+        self.assertAlmostEqual(batched.variance(), single.variance(), places=9)
+        self.assertEqual((batched.min, batched.max), (single.min, single.max))
+
+    def test_merge_equals_single_stream(self):
+        whole = ToSTLinear()
+        whole.update_many(self.tokens)
+        parts = [ToSTLinear() for _ in range(3)]
+        for i, token in enumerate(self.tokens):
+            parts[i % 3].update(token)
+        merged = ToSTLinear().merge(parts[0]).merge(parts[1]).merge(parts[2])
+        for key, value in whole.get_stats().items():
+            self.assertAlmostEqual(merged.get_stats()[key], value, places=9, msg=key)
+
+
+class TestSketches(unittest.TestCase):
+    def test_kll_quantiles_within_rank_error(self):
+        rng = random.Random(11)
+        values = [rng.gauss(0, 1) for _ in range(50000)]
+        left, right = KLLSketch(), KLLSketch(seed=1)
+        left.update_many(values[:25000])
+        right.update_many(values[25000:])
+        merged = KLLSketch.from_bytes(left.merge(right).to_bytes())
+        ordered = sorted(values)
+        for q in (0.5, 0.99):
+            rank = ordered.index(merged.quantile(q)) / len(values)
+            self.assertLess(abs(rank - q), 0.02)
+        self.assertLess(len(merged.to_bytes()), 16 * 1024)
+        self.assertEqual(merged.count, 50000)
+
+    def test_hyperloglog_estimate_and_merge(self):
+        a, b = HyperLogLog(), HyperLogLog()
+        for i in range(30000):
+            a.add(f"tok{i}")
+            b.add(f"tok{i + 15000}")
+        merged = HyperLogLog.from_bytes(a.merge(b).to_bytes())
+        self.assertLess(abs(merged.estimate() - 45000) / 45000, 0.05)
+        self.assertEqual(len(merged.to_bytes()), 4097)
+
+    def test_count_min_heavy_hitters(self):
+        a, b = CountMinSketch(top_k=3), CountMinSketch(top_k=3)
+        for i in range(3000):
+            (a if i % 2 else b).add("hot" if i % 3 == 0 else f"cold{i}")
+        a.add("warm", count=200)
+        merged = CountMinSketch.from_bytes(a.merge(b).to_bytes())
+        self.assertEqual([k for k, _ in merged.heavy_hitters(2)], ["hot", "warm"])
+        self.assertGreaterEqual(merged.estimate("hot"), 1000)
+
+    def test_token_sketches_feed_axiomshards_stats(self):
+        node = ZKVSNodePrime()
+        node.execute_mandate({"intent": "data data data pipelines"})
+        stats = node._token_sketches.get_stats(include_tokens=True)
+        self.assertEqual(stats["heavy_hitters"][0][0], "data")
+        self.assertEqual(stats["distinct"], 2)
+        aggregate = node._token_sketches.get_stats()
+        self.assertEqual(aggregate["top_counts"], [count for _, count in stats["heavy_hitters"]])
+        self.assertNotIn("heavy_hitters", aggregate)
+        restored = TokenSketches.from_bytes(node._token_sketches.to_bytes())
+        self.assertEqual(restored.get_stats(include_tokens=True), stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
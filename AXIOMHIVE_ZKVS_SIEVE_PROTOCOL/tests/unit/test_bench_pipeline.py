@@ -0,0 +1,94 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from benchmarks import bench_pipeline
+
+
+def _report(**values):
+    better = {"mandates_per_s": "higher", "dagger_fanout_speedup": "higher"}
+    return {
+        "meta": {"sizes": "quick"},
+        "metrics": {
+            k: bench_pipeline._metric(v, "", better.get(k, "lower")) for k, v in values.items()
+        },
+    }
+
+
+class TestBenchPipeline(unittest.TestCase):
+    def test_compare_respects_direction_and_tolerance(self):
+        baseline = _report(
+            mandate_mean_us=100.0,
+            mandates_per_s=1000.0,
+            mandate_p99_us=200.0,
+            dagger_inline_us=10.0,
+        )
+        current = _report(
+            mandate_mean_us=114.0, mandates_per_s=800.0, mandate_p99_us=280.0, construct_warm_us=5.0
+        )
+        regressions = bench_pipeline.compare(current, baseline, tolerance=0.15)
+        self.assertEqual([r["metric"] for r in regressions], ["mandates_per_s"])
+        self.assertAlmostEqual(regressions[0]["worse_by"], 0.2)
+        # Faster is never a regression, however large the change.
+        self.assertEqual(bench_pipeline.compare(_report(mandate_mean_us=10.0), baseline), [])
+
+    def test_quick_run_saves_and_compares(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(
+                    bench_pipeline.main(
+                        ["--quick", "--only", "latency,ingest,fanout,matcher", "--save", path]
+                    ),
+                    0,
+                )
+            with open(path, encoding="utf-8") as fh:
+                saved = json.load(fh)
+            self.assertEqual(saved["meta"]["sizes"], "quick")
+            self.assertEqual(
+                set(saved["metrics"]),
+                {
+                    "mandate_p50_us",
+                    "mandate_p99_us",
+                    "mandate_mean_us",
+                    "tost_tokens_per_s",
+                    "dagger_inline_us",
+                    "dagger_thread_us",
+                    "dagger_fanout_speedup",
+                    "matcher_search_ns",
+                    "matcher_route_ns",
+                    "matcher_speedup_vs_regex",
+                    "matcher_rules_us",
+                    "matcher_single_pass_speedup",
+                },
+            )
+            self.assertLessEqual(
+                saved["metrics"]["mandate_p50_us"]["value"],
+                saved["metrics"]["mandate_p99_us"]["value"],
+            )
+            out = io.StringIO()
+            with redirect_stdout(out):
+                status = bench_pipeline.main(
+                    ["--quick", "--only", "ingest", "--compare", path, "--tolerance", "10"]
+                )
+            self.assertEqual(status, 0)
+            self.assertTrue(out.getvalue().endswith("OK\n"))
+
+    def test_throughput_tracks_ledger_growth(self):
+        sizes = dict(bench_pipeline.SIZES["quick"], throughput_mandates=40, throughput_windows=2)
+        detail = {}
+        metrics = bench_pipeline.bench_throughput(sizes, detail)
+        self.assertGreater(metrics["mandates_per_s"]["value"], 0.0)
+        sizes_seen = [point["ledger_size"] for point in detail["throughput_curve"]]
+        self.assertEqual(len(sizes_seen), 2)
+        self.assertLess(sizes_seen[0], sizes_seen[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src import cli
+from src.axiom_lattice import TrustMetricsEngine
+from src.node_server import NodeServer, parse_address, request, request_lines
+
+INTENT = "market dominance with verifiable systems and data"
+
+
+def run_cli(argv, stdin_text=""):
+    out = io.StringIO()
+    with patch.object(sys, "stdin", io.StringIO(stdin_text)), redirect_stdout(out):
+        status = cli.main(argv)
+    return status, out.getvalue()
+
+
+class TestNodeServer(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.address = f"unix:{os.path.join(tmp.name, 'node.sock')}"
+        self.server = NodeServer(self.address)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+        self.assertTrue(self.server.ready.wait(5))
+        self.addCleanup(self._shutdown)
+
+    def _shutdown(self):
+        if self.thread.is_alive():
+            request(self.address, {"op": "shutdown"})
+            self.thread.join(5)
+
+    def test_client_mode_matches_local_text(self):
+        status, remote = run_cli(["--intent", INTENT, "--connect", self.address])
+        self.assertEqual(status, 0)
+        _, local = run_cli(["--intent", INTENT])
+        self.assertIn("- STATUS: ABSOLUTE DOMINION\n", remote)
+        self.assertEqual(remote.split("- IMPACT_METRICS")[0], local.split("- IMPACT_METRICS")[0])
+
+    def test_batch_reuses_one_node(self):
+        frameworks = [{"intent": f"{INTENT} run-{i}"} for i in range(5)]
+        stdin_text = "\n".join(json.dumps(f) for f in frameworks) + "\n"
+        status, out = run_cli(["--batch", "--connect", self.address], stdin_text)
+        self.assertEqual(status, 0)
+        results = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([r["intent"] for r in results], [f["intent"] for f in frameworks])
+        stats = request(self.address, {"op": "stats"})["result"]
+        self.assertEqual(stats["mandates"], 5)
+        self.assertEqual(
+            stats["catalyst"]["count"], sum(len(f["intent"].split()) for f in frameworks)
+        )
+
+    def test_protocol_errors_and_ids(self):
+        responses = list(
+            request_lines(
+                self.address,
+                [{"op": "ping", "id": 7}, {"op": "nope", "id": 8}, {"intent": INTENT, "id": 9}],
+            )
+        )
+        self.assertEqual(responses[0], {"id": 7, "ok": True, "result": "pong"})
+        self.assertFalse(responses[1]["ok"])
+        self.assertIn("Unknown op", responses[1]["error"])
+        self.assertTrue(responses[2]["ok"])
+
+    def test_remote_batch_reports_bad_lines_in_place(self):
+        stdin_text = (
+            "\n".join(["nope", json.dumps({"intent": INTENT}), "3", json.dumps({"intent": INTENT})])
+            + "\n"
+        )
+        status, out = run_cli(["--batch", "--connect", self.address], stdin_text)
+        self.assertEqual(status, 1)
+        self.assertEqual(
+            [json.loads(line)["status"] for line in out.splitlines()],
+            ["ERROR", "SUCCESS", "ERROR", "SUCCESS"],
+        )
+
+    def test_remote_batch_output_matches_local_line_for_line(self):
+        stdin_text = (
+            "\n".join(
+                [json.dumps({"intent": f"{INTENT} run-{i}"}) for i in range(3)]
+                + ["nope", json.dumps({"intent": "ünïcode data", "context": "x"})]
+            )
+            + "\n"
+        )
+        remote_status, remote = run_cli(["--batch", "--connect", self.address], stdin_text)
+        local_status, local = run_cli(["--batch"], stdin_text)
+        self.assertEqual((remote_status, local_status), (1, 1))
+        self.assertEqual(len(remote.splitlines()), 5)
+        self.assertEqual(remote.splitlines(), local.splitlines())
+
+    def test_shutdown_removes_socket(self):
+        self._shutdown()
+        self.assertFalse(self.thread.is_alive())
+        self.assertFalse(os.path.exists(parse_address(self.address)[1]))
+
+
+class TestCliLocal(unittest.TestCase):
+    def test_parse_address(self):
+        self.assertEqual(parse_address("unix:/tmp/a.sock"), ("unix", "/tmp/a.sock"))
+        self.assertEqual(parse_address("./node.sock"), ("unix", "./node.sock"))
+        self.assertEqual(parse_address("tcp:localhost:7000"), ("tcp", ("localhost", 7000)))
+        self.assertEqual(parse_address(":7000"), ("tcp", ("127.0.0.1", 7000)))
+        with self.assertRaises(ValueError):
+            parse_address("nowhere")
+
+    def test_local_batch_prints_jsonl(self):
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            status, out = run_cli(["--batch"], json.dumps({"intent": INTENT}) + "\n\n")
+        self.assertEqual(status, 0)
+        (line,) = out.splitlines()
+        self.assertEqual(json.loads(line)["status"], "SUCCESS")
+
+    def test_batch_reports_bad_lines_in_place(self):
+        stdin_text = (
+            "\n".join(
+                [json.dumps({"intent": ""}), "{not json", "[1, 2]", json.dumps({"intent": INTENT})]
+            )
+            + "\n"
+        )
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            status, out = run_cli(["--batch"], stdin_text)
+        self.assertEqual(status, 1)
+        # Strict parsing: an empty catalyst's min/max are infinite and must come out as null.
+        records = [
+            json.loads(line, parse_constant=lambda name: self.fail(f"non-standard JSON {name}"))
+            for line in out.splitlines()
+        ]
+        self.assertEqual([r["status"] for r in records], ["SUCCESS", "ERROR", "ERROR", "SUCCESS"])
+        self.assertIn("line 2: invalid JSON", records[1]["message"])
+        self.assertIn("line 3: expected a JSON object", records[2]["message"])
+        self.assertIsNone(records[0]["axiomshards_stats"]["min"])
+
+    def test_listen_never_removes_a_regular_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ledger.bin")
+            with open(path, "wb") as fh:
+                fh.write(b"keep me")
+            with redirect_stderr(io.StringIO()) as err:
+                self.assertEqual(cli.main(["serve", "--listen", path]), 1)
+            self.assertIn("not a socket", err.getvalue())
+            with open(path, "rb") as fh:
+                self.assertEqual(fh.read(), b"keep me")
+
+
+if __name__ == "__main__":
+    unittest.main()
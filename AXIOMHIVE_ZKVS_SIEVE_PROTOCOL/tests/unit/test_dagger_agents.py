@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.dagger_agents import AgentResultCache, DaggerAgent, MarketAnalysisAgent, ZKProofAgent
+from src.sovereign_core import ZKVSNodePrime
+
+
+class CountingAgent(DaggerAgent):
+    def __init__(self, cache, deterministic):
+        super().__init__("CountingAgent", "test", {"DENSITY": 1.0}, cache)
+        self.deterministic = deterministic
+        self.calls = 0
+
+    def _perform_task(self, task_params):
+        self.calls += 1
+        return f"call {self.calls}"
+
+
+class TestAgentResultCache(unittest.TestCase):
+    def test_hits_skip_recomputation(self):
+        cache = AgentResultCache(maxsize=8)
+        agent = CountingAgent(cache, deterministic=True)
+        first = agent.execute({"b": 1, "a": [1, 2]})
+        second = agent.execute({"a": [1, 2], "b": 1})
+        self.assertEqual(first, second)
+        self.assertEqual(agent.calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_non_deterministic_agents_bypass_cache(self):
+        cache = AgentResultCache()
+        agent = CountingAgent(cache, deterministic=False)
+        agent.execute({})
+        agent.execute({})
+        self.assertEqual(agent.calls, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction_and_axiom_fingerprint(self):
+        cache = AgentResultCache(maxsize=2)
+        agent = ZKProofAgent({"DENSITY": 1.0}, cache)
+        for data in ("a", "b", "a", "c"):
+            agent.execute({"input": data})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(cache.key("ZKProofAgent", {"input": "a"}, {"DENSITY": 1.0})))
+        self.assertIsNone(cache.get(cache.key("ZKProofAgent", {"input": "b"}, {"DENSITY": 1.0})))
+        self.assertIsNone(cache.get(cache.key("ZKProofAgent", {"input": "a"}, {"DENSITY": 100.0})))
+
+    def test_cached_result_is_a_copy(self):
+        agent = MarketAnalysisAgent({}, AgentResultCache())
+        agent.execute({"target": "x"})["result"] = "tampered"
+        self.assertNotEqual(agent.execute({"target": "x"})["result"], "tampered")
+
+    def test_node_cache_reused_across_mandates_and_cleared_on_reboot(self):
+        node = ZKVSNodePrime(agent_cache_size=16)
+        framework = {"intent": "market dominance with verifiable systems and data"}
+        with (
+            patch.object(node._axiom_enforcement, "validate_ethical_and_safety", return_value=True),
+            patch.object(node._trust_metrics_engine, "is_system_trustworthy", return_value=True),
+        ):
+            first = node.execute_mandate(framework)
+            second = node.execute_mandate(framework)
+        self.assertEqual(first.split("IMPACT_METRICS")[0], second.split("IMPACT_METRICS")[0])
+        self.assertEqual(node._agent_cache.hits, 3)
+        node._refactor_and_reboot("test")
+        self.assertEqual(len(node._agent_cache), 0)
+        self.assertIs(node._hadrian.dagger_agents["zk_proof_agent"].cache, node._agent_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import hashlib
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.dagger_agents import MarketAnalysisAgent
+from src.data_moat import DynamicMoatCultivationEngine
+from src.digest import ZK_DOMAIN, canonical_bytes, chain_digest, sha256_hex
+from src.sovereign_core import ZKVSNodePrime
+
+INTENT = "market dominance with verifiable systems and data"
+
+
+class TestDigest(unittest.TestCase):
+    def test_canonical_bytes(self):
+        self.assertEqual(canonical_bytes("naïve"), "naïve".encode())
+        self.assertEqual(canonical_bytes(b"\x00raw"), b"\x00raw")
+        self.assertEqual(canonical_bytes({"b": 1, "a": [1, 2]}), b'{"a":[1,2],"b":1}')
+        self.assertEqual(
+            canonical_bytes({"a": [1, 2], "b": 1}), canonical_bytes({"b": 1, "a": [1, 2]})
+        )
+
+    def test_agent_result_hash_is_digest_of_text(self):
+        result = MarketAnalysisAgent({}).execute({"target": "dominance"})
+        self.assertEqual(result["hash"], hashlib.sha256(result["result"].encode()).hexdigest())
+        self.assertEqual(result["hash"], sha256_hex(result["result"]))
+
+    def test_zk_proof_chains_agent_digests(self):
+        node = ZKVSNodePrime()
+        segmented = node._hadrian.orchestrate_task(node._cerebrum.process_intent(INTENT))
+        output, digests = node._dagger.run_task(segmented, node._hadrian.dagger_agents)
+        self.assertEqual(len(digests), 3)
+        self.assertEqual(
+            chain_digest(digests), hashlib.sha256(ZK_DOMAIN + b"".join(digests)).digest()
+        )
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            result = ZKVSNodePrime().execute_mandate({"intent": INTENT}, structured=True)
+        self.assertEqual(result.output, output)
+        self.assertEqual(result.zk_proof, f"{chain_digest(digests).hex()}_zk_validated")
+        self.assertNotEqual(chain_digest(digests), chain_digest(digests[::-1]))
+
+    def test_moat_cultivation_hashes_nothing(self):
+        engine = DynamicMoatCultivationEngine({})
+        with patch("hashlib.sha256", side_effect=AssertionError("discarded hash")):
+            engine.cultivate_moat({"input": {"intent": INTENT}, "output": "SUCCESS: ABSOLUTE"})
+        self.assertEqual(engine._model_refinement_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
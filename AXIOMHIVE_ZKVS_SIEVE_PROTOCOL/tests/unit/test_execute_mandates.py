@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.sovereign_core import ZKVSNodePrime
+
+FRAMEWORKS = [
+    {
+        "intent": "Architect unassailable market dominance through verifiable systems and refined data pipelines."
+    },
+    {"intent": "refine data pipelines"},
+    {"intent": "harmful_intent destruction"},
+    {"intent": ""},
+    {"intent": "verifiable systems"},
+]
+
+
+class TestExecuteMandates(unittest.TestCase):
+    def _compare(self, frameworks, batch_size):
+        single, batched = ZKVSNodePrime(), ZKVSNodePrime()
+        expected = [single.execute_mandate(f) for f in frameworks]
+        results = list(batched.execute_mandates(frameworks, batch_size=batch_size))
+        self.assertEqual(results, expected)
+        self.assertEqual(
+            [e["message"] for e in batched._verifiable_ledger],
+            [e["message"] for e in single._verifiable_ledger],
+        )
+        self.assertTrue(batched._trust_metrics_engine.check_consistency(batched._verifiable_ledger))
+        return batched
+
+    def test_outputs_identical_to_single_calls(self):
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            self._compare(FRAMEWORKS * 3, batch_size=4)
+
+    def test_outputs_identical_on_violation_path(self):
+        self._compare(FRAMEWORKS, batch_size=2)
+
+    def test_metrics_evaluated_once_per_window(self):
+        node = ZKVSNodePrime()
+        with (
+            patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True),
+            patch.object(
+                TrustMetricsEngine,
+                "evaluate_all_metrics",
+                autospec=True,
+                side_effect=TrustMetricsEngine.evaluate_all_metrics,
+            ) as evaluate,
+        ):
+            results = list(node.execute_mandates([FRAMEWORKS[0]] * 10, batch_size=5))
+        self.assertEqual(len(results), 10)
+        self.assertEqual(evaluate.call_count, 2)
+
+    def test_closing_stream_flushes_ledger(self):
+        node = ZKVSNodePrime()
+        before = len(node._verifiable_ledger)
+        stream = node.execute_mandates(FRAMEWORKS)
+        next(stream)
+        stream.close()
+        self.assertGreater(len(node._verifiable_ledger), before)
+        self.assertIsNone(node._pending_events)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.intent_router import AUTOMATON_MIN_PATTERNS, IntentRouter, PatternMatcher
+from src.praetorian_layers import HadrianLayer
+from src.sovereign_core import ZKVSNodePrime
+
+
+class TestPatternMatcher(unittest.TestCase):
+    def test_matches_equal_substring_semantics(self):
+        matcher = PatternMatcher(["he", "she", "his", "hers", "data"])
+        for text in ("ushers", "metadata pipelines", "h", "", "his hershe"):
+            expected = {i for i, p in enumerate(matcher.patterns) if p in text}
+            self.assertEqual(matcher.matches(text), expected, text)
+            self.assertEqual(matcher.search(text), bool(expected))
+
+    def test_add_recompiles_and_deduplicates(self):
+        matcher = PatternMatcher(["alpha"])
+        self.assertFalse(matcher.search("beta"))
+        self.assertEqual(matcher.add("beta"), 1)
+        self.assertEqual(matcher.add("beta"), 1)
+        self.assertTrue(matcher.search("beta"))
+        with self.assertRaises(ValueError):
+            matcher.add("")
+
+    def test_large_rule_sets_match_like_the_per_pattern_scan(self):
+        patterns = ["he", "she", "his", "hers"] + [
+            f"rule{i}x" for i in range(AUTOMATON_MIN_PATTERNS)
+        ]
+        matcher = PatternMatcher(patterns)
+        for text in ("ushers", "rule1x rule10x rule100x", "rule1", "", "his hershe rule7x"):
+            expected = {i for i, p in enumerate(matcher.patterns) if p in text}
+            self.assertEqual(matcher.matches(text), expected, text)
+            self.assertEqual(matcher.search(text), bool(expected))
+        self.assertFalse(matcher.search("late"))
+        pid = matcher.add("late")
+        self.assertEqual(matcher.matches("too late"), {pid})
+
+
+class TestIntentRouter(unittest.TestCase):
+    def test_default_routes_match_legacy_keyword_checks(self):
+        router = HadrianLayer.default_router()
+        intent = "refined data for market dominance via verifiable systems"
+        self.assertEqual(
+            [t["agent_name"] for t in router.route(intent)],
+            ["market_analysis_agent", "zk_proof_agent", "data_sieve_agent"],
+        )
+        self.assertEqual(router.route(intent)[2]["params"], {"data": intent})
+        self.assertEqual(router.route("nothing relevant"), [])
+
+    def test_runtime_route_and_banned_term_registration(self):
+        node = ZKVSNodePrime()
+        node.register_route("audit", "zk_proof_agent", "audit_trail", {"input": "audit"})
+        task = node._hadrian.orchestrate_task("audit the data")
+        self.assertEqual([t["action"] for t in task["sub_tasks"]], ["sieve_data", "audit_trail"])
+        node.register_banned_term("Strategic")
+        self.assertFalse(
+            node._axiom_enforcement.validate_ethical_and_safety("Strategic market analysis")
+        )
+        node._refactor_and_reboot("test")
+        self.assertIn(("audit", "zk_proof_agent", "audit_trail"), node._hadrian.router.routes)
+        self.assertIn("Strategic", node._axiom_enforcement.banned_terms.patterns)
+
+    def test_params_are_fresh_per_route(self):
+        router = IntentRouter()
+        router.register_route("x", "a", "act", {"k": 1})
+        router.route("x")[0]["params"]["k"] = 2
+        self.assertEqual(router.route("x")[0]["params"], {"k": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
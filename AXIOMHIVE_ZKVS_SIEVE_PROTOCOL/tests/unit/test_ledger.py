@@ -0,0 +1,178 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.ledger import (
+    AgeRetention,
+    ByteRetention,
+    CountRetention,
+    LedgerEvent,
+    LedgerSegment,
+    VerifiableLedger,
+)
+from src.merkle import (
+    DIGEST_SIZE,
+    MerkleAccumulator,
+    verify_consistency,
+    verify_inclusion,
+    verify_inclusion_batch,
+)
+from src.sovereign_core import ZKVSNodePrime
+
+
+def _event(i, level="INFO"):
+    return LedgerEvent(float(i), f"event {i}", f"{i:064x}", level)
+
+
+class TestVerifiableLedger(unittest.TestCase):
+    def test_sequence_view_spans_segments_and_hot_tail(self):
+        ledger = VerifiableLedger(segment_size=4)
+        for i in range(10):
+            ledger.append(_event(i, "CRITICAL" if i % 3 == 0 else "INFO"))
+        self.assertEqual(len(ledger), 10)
+        self.assertEqual(len(ledger.segments), 2)
+        self.assertEqual([e["timestamp"] for e in ledger], [float(i) for i in range(10)])
+        self.assertEqual(ledger[-1], _event(9, "CRITICAL"))
+        self.assertEqual(ledger[5], _event(5))
+        self.assertEqual(ledger[3].get("level"), "CRITICAL")
+        self.assertEqual(
+            [e.message for e in ledger[2:6]], ["event 2", "event 3", "event 4", "event 5"]
+        )
+
+    def test_event_reads_like_legacy_dict(self):
+        event = _event(7, "CRITICAL")
+        self.assertEqual(event["level"], "CRITICAL")
+        self.assertIsNone(event.get("missing"))
+        self.assertEqual(event, event.as_dict())
+        self.assertEqual(LedgerSegment(0, [event])[0], event)
+
+    def test_count_retention_bounds_ledger(self):
+        ledger = VerifiableLedger(retention=CountRetention(8), segment_size=4)
+        for i in range(100):
+            ledger.append(_event(i))
+        self.assertLessEqual(len(ledger), 8 + 4)
+        self.assertGreaterEqual(len(ledger), 8)
+        self.assertEqual(ledger.total_appended, 100)
+        self.assertEqual(ledger[0].message, f"event {ledger.first_sequence}")
+        with self.assertRaises(IndexError):
+            ledger.event_at(0)
+
+    def test_age_and_byte_retention(self):
+        aged = VerifiableLedger(retention=AgeRetention(10.0, clock=lambda: 100.0), segment_size=5)
+        for i in range(100):
+            aged.append(_event(i))
+        self.assertTrue(all(e.timestamp >= 85.0 for e in aged))
+        sized = VerifiableLedger(retention=ByteRetention(1000), segment_size=5)
+        for i in range(1000):
+            sized.append(_event(i))
+        self.assertLess(sized.nbytes, 1000 + 5 * 64)
+
+    def test_node_ledger_keeps_trust_metrics_consistent(self):
+        node = ZKVSNodePrime(ledger=VerifiableLedger(segment_size=2))
+        node.execute_mandate({"intent": "market dominance with verifiable systems and data"})
+        self.assertGreater(len(node._verifiable_ledger.segments), 0)
+        self.assertTrue(node._trust_metrics_engine.check_consistency(node._verifiable_ledger))
+
+    def test_default_node_keeps_resident_ledger_bounded(self):
+        # A smaller default keeps the run short; the node still builds its own default ledger.
+        limit, mandates = 1024, 1500
+        with (
+            patch.object(ZKVSNodePrime, "LEDGER_RETENTION_EVENTS", limit),
+            patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True),
+        ):
+            node = ZKVSNodePrime()
+            frameworks = [{"intent": f"market dominance data run-{i}"} for i in range(mandates)]
+            for _ in node.execute_mandates(frameworks):
+                pass
+        ledger = node._verifiable_ledger
+        ceiling = limit + ledger.segment_size
+        self.assertGreater(ledger.total_appended, 2 * ceiling)
+        self.assertLessEqual(len(ledger), ceiling)
+        self.assertEqual(ledger.merkle.pruned, ledger.first_sequence)
+        # Retained leaves plus their parents, and at most one kept pair per level.
+        self.assertLessEqual(ledger.merkle.nbytes, 2 * DIGEST_SIZE * (ceiling + 64))
+        self.assertEqual(node._trust_metrics_engine.counters.total, ledger.total_appended)
+        node.close()
+
+
+class TestLedgerMerkleProofs(unittest.TestCase):
+    def setUp(self):
+        self.ledger = VerifiableLedger(segment_size=4)
+        for i in range(37):
+            self.ledger.append(_event(i))
+
+    def test_inclusion_proofs(self):
+        root = bytes.fromhex(self.ledger.root)
+        size = self.ledger.total_appended
+        for seq in (0, 1, 17, 36):
+            proof = self.ledger.inclusion_proof(seq)
+            self.assertLessEqual(len(proof), size.bit_length())
+            self.assertTrue(verify_inclusion(bytes.fromhex(f"{seq:064x}"), seq, size, proof, root))
+        self.assertFalse(
+            verify_inclusion(
+                bytes.fromhex(f"{1:064x}"), 0, size, self.ledger.inclusion_proof(0), root
+            )
+        )
+
+    def test_eviction_prunes_tree_but_keeps_retained_proofs(self):
+        ledger = VerifiableLedger(retention=CountRetention(8), segment_size=4)
+        for i in range(5000):
+            ledger.append(_event(i))
+        first, size = ledger.first_sequence, ledger.total_appended
+        self.assertEqual(
+            ledger.root,
+            MerkleAccumulator(bytes.fromhex(f"{i:064x}") for i in range(5000)).root().hex(),
+        )
+        self.assertLess(ledger.merkle.nbytes, 64 * (size - first) + 2 * 32 * size.bit_length())
+        root = bytes.fromhex(ledger.root)
+        for seq in range(first, size):
+            self.assertTrue(
+                verify_inclusion(
+                    bytes.fromhex(f"{seq:064x}"), seq, size, ledger.inclusion_proof(seq), root
+                )
+            )
+        old_root = bytes.fromhex(ledger.root_at(first + 1))
+        self.assertTrue(
+            verify_consistency(first + 1, size, old_root, root, ledger.consistency_proof(first + 1))
+        )
+        with self.assertRaises(ValueError):
+            ledger.inclusion_proof(first - 1)
+        with self.assertRaises(ValueError):
+            ledger.root_at(first - 1)
+
+    def test_consistency_between_roots(self):
+        old_size, old_root = 20, bytes.fromhex(self.ledger.root_at(20))
+        new_root = bytes.fromhex(self.ledger.root)
+        proof = self.ledger.consistency_proof(old_size)
+        self.assertTrue(verify_consistency(old_size, 37, old_root, new_root, proof))
+        self.assertFalse(
+            verify_consistency(
+                old_size, 37, bytes.fromhex(self.ledger.root_at(19)), new_root, proof
+            )
+        )
+
+    def test_batch_verification(self):
+        root = bytes.fromhex(self.ledger.root)
+        items = [(bytes.fromhex(f"{i:064x}"), i, self.ledger.inclusion_proof(i)) for i in range(37)]
+        self.assertTrue(all(verify_inclusion_batch(items, 37, root)))
+        items[5] = (bytes.fromhex(f"{6:064x}"), 5, items[5][2])
+        results = verify_inclusion_batch(items, 37, root)
+        self.assertEqual([i for i, ok in enumerate(results) if not ok], [5])
+
+    def test_batch_rejects_forged_proof_for_trusted_leaf(self):
+        root = bytes.fromhex(self.ledger.root)
+        data, proof = bytes.fromhex(f"{3:064x}"), self.ledger.inclusion_proof(3)
+        forged = list(proof)
+        forged[-1] = bytes(32)
+        results = verify_inclusion_batch(
+            [(data, 3, proof), (data, 3, forged), (data, 3, proof[:-1])], 37, root
+        )
+        self.assertEqual(results, [True, False, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
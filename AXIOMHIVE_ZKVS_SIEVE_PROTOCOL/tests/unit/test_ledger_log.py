@@ -0,0 +1,107 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.ledger import LedgerEvent, VerifiableLedger
+from src.ledger_log import LedgerLog, LedgerLogError
+from src.sovereign_core import ZKVSNodePrime
+
+
+def _event(i, level="INFO"):
+    return LedgerEvent(float(i), f"event {i} ✓", f"{i:064x}", level)
+
+
+class TestLedgerLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "ledger.log")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_random_access(self):
+        with LedgerLog(self.path, commit_records=8) as log:
+            for i in range(20):
+                log.append(
+                    float(i), bytes.fromhex(f"{i:064x}"), "CRITICAL" if i == 3 else "INFO", f"m{i}"
+                )
+            self.assertGreaterEqual(log.syncs, 2)
+        with LedgerLog(self.path) as log:
+            self.assertEqual(len(log), 20)
+            self.assertEqual(log.read(3), (3.0, bytes.fromhex(f"{3:064x}"), "CRITICAL", "m3"))
+            self.assertEqual(log.level(19), "INFO")
+            self.assertEqual(list(log.iter_digests(18))[1], bytes.fromhex(f"{19:064x}"))
+
+    def test_pending_window_commits_without_further_writes(self):
+        with LedgerLog(self.path, commit_interval=0.05, commit_records=1000) as log:
+            synced = log.syncs
+            log.append(1.0, bytes(32), "INFO", "last write")
+            self.assertEqual(log.syncs, synced)
+            deadline = time.monotonic() + 5.0
+            while log.syncs == synced and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(log.syncs, synced + 1)
+            with open(self.path, "rb") as fh:
+                self.assertTrue(fh.read().endswith(b"last write"))
+
+    def test_torn_final_record_is_truncated(self):
+        with LedgerLog(self.path) as log:
+            for i in range(5):
+                log.append(float(i), bytes(32), "INFO", f"m{i}")
+        good_size = os.path.getsize(self.path)
+        with open(self.path, "ab") as fh:
+            fh.write(LedgerLog.encode(9.0, bytes(32), "INFO", "partial")[:-3])
+        with LedgerLog(self.path) as log:
+            self.assertEqual(len(log), 5)
+            self.assertGreater(log.recovered_bytes, 0)
+            log.append(5.0, bytes(32), "INFO", "after recovery")
+        self.assertGreater(os.path.getsize(self.path), good_size)
+        with LedgerLog(self.path) as log:
+            self.assertEqual(log.read(5)[3], "after recovery")
+
+    def test_rejects_foreign_file(self):
+        with open(self.path, "wb") as fh:
+            fh.write(b"not a ledger")
+        with self.assertRaises(LedgerLogError):
+            LedgerLog(self.path)
+
+    def test_ledger_resumes_from_store(self):
+        ledger = VerifiableLedger(segment_size=4, store=LedgerLog(self.path))
+        for i in range(10):
+            ledger.append(_event(i))
+        root = ledger.root
+        ledger.close()
+        resumed = VerifiableLedger(segment_size=4, store=LedgerLog(self.path))
+        self.assertEqual(len(resumed), 10)
+        self.assertEqual(resumed.root, root)
+        self.assertEqual(resumed[7], _event(7))
+        resumed.append(_event(10))
+        self.assertEqual([e.timestamp for e in resumed][-2:], [9.0, 10.0])
+        resumed.close()
+
+    def test_node_resumes_ledger_across_restart(self):
+        node = ZKVSNodePrime(ledger_path=self.path)
+        node.execute_mandate({"intent": "market dominance with verifiable systems and data"})
+        size = len(node._verifiable_ledger)
+        node._verifiable_ledger.close()
+        # Resuming touches digests only; no record is decoded until trust is first evaluated.
+        with patch.object(
+            LedgerLog, "read", side_effect=AssertionError("record decoded on resume")
+        ):
+            restarted = ZKVSNodePrime(ledger_path=self.path)
+        self.assertEqual(len(restarted._verifiable_ledger), size + 2)
+        self.assertEqual(restarted._trust_metrics_engine.counters.total, size + 2)
+        self.assertEqual(restarted._verifiable_ledger[0]["message"], "Genesis Protocol initiated.")
+        self.assertTrue(
+            restarted._trust_metrics_engine.check_consistency(restarted._verifiable_ledger)
+        )
+        restarted._verifiable_ledger.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.axiomshards_catalyst import KLLSketch
+from src.mandate_result import SUCCESS, VIOLATION, MandateResult
+from src.sovereign_core import ZKVSNodePrime
+
+FRAMEWORK = {"intent": "market dominance with verifiable systems and data data"}
+
+
+class TestMandateResult(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_structured_result_renders_legacy_text(self):
+        text = ZKVSNodePrime().execute_mandate(FRAMEWORK)
+        result = ZKVSNodePrime().execute_mandate(FRAMEWORK, structured=True)
+        self.assertIsInstance(result, MandateResult)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.intent, FRAMEWORK["intent"])
+        self.assertIn("Strategic market analysis", result.output)
+        self.assertEqual(str(result), text)
+        self.assertIs(str(result), str(result))
+
+    def test_fields_need_no_rendering(self):
+        with patch.object(MandateResult, "render", side_effect=AssertionError("rendered")):
+            result = ZKVSNodePrime().execute_mandate(FRAMEWORK, structured=True)
+            self.assertTrue(result.g_convex)
+            self.assertEqual(set(result.impact_metrics), {"PSI", "MCV", "UAM"})
+            payload = json.loads(result.to_json())
+        self.assertEqual(payload["status"], SUCCESS)
+        self.assertEqual(payload["zk_proof"], result.zk_proof)
+
+    def test_serialization_round_trip_preserves_text(self):
+        result = ZKVSNodePrime().execute_mandate(FRAMEWORK, structured=True)
+        self.assertEqual(result.axiomshards_stats["top_counts"][0], 2)
+        restored = MandateResult.from_bytes(result.to_bytes())
+        self.assertEqual(str(restored), str(result))
+        self.assertNotIn(b" ", result.to_bytes().split(b'"intent"')[0])
+
+    def test_sketch_stats_are_pinned_to_their_mandate(self):
+        expected = ZKVSNodePrime().execute_mandate(FRAMEWORK, structured=True).axiomshards_stats
+        node = ZKVSNodePrime()
+        with patch.object(KLLSketch, "quantiles", side_effect=AssertionError("quantiles sorted")):
+            result = node.execute_mandate(FRAMEWORK, structured=True)
+        for i in range(50):
+            node.execute_mandate({"intent": f"private tokens from caller-{i} number{i}"})
+        stats = result.axiomshards_stats
+        self.assertIs(result.axiomshards_stats, stats)
+        self.assertEqual(stats, expected)
+        self.assertNotIn("heavy_hitters", stats)
+        self.assertNotIn("private", str(result))
+
+    def test_violation_and_batch_paths(self):
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=False):
+            result = ZKVSNodePrime().execute_mandate(FRAMEWORK, structured=True, _max_attempts=0)
+        self.assertEqual(result.status, VIOLATION)
+        self.assertTrue(str(result).startswith("VIOLATION"))
+        self.assertEqual(MandateResult.from_json(result.to_json()).message, result.message)
+        batch = list(ZKVSNodePrime().execute_mandates([FRAMEWORK] * 3, structured=True))
+        self.assertTrue(all(isinstance(r, MandateResult) and r.ok for r in batch))
+        async_result = asyncio.run(
+            ZKVSNodePrime().execute_mandate_async(FRAMEWORK, structured=True)
+        )
+        self.assertEqual(async_result.to_dict()["intent"], FRAMEWORK["intent"])
+
+
+if __name__ == "__main__":
+    unittest.main()
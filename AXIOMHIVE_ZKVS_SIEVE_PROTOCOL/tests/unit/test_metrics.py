@@ -0,0 +1,102 @@
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.metrics import NULL_METRICS, STAGES, Histogram, PipelineMetrics
+from src.sovereign_core import ZKVSNodePrime
+
+INTENT = "market dominance with verifiable systems and data"
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_and_quantiles(self):
+        histogram = Histogram((10, 100, 1000))
+        for ns in (5, 10, 50, 500, 5000):
+            histogram.observe(ns)
+        self.assertEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual((histogram.count, histogram.sum_ns, histogram.max_ns), (5, 5565, 5000))
+        self.assertEqual(histogram.quantile(0.4), 10.0)
+        self.assertEqual(histogram.quantile(0.6), 100.0)
+        self.assertEqual(histogram.quantile(1.0), 5000.0)
+        self.assertEqual(Histogram().quantile(0.5), 0.0)
+
+    def test_prometheus_buckets_are_cumulative(self):
+        histogram = Histogram((1000, 2000))
+        histogram.observe(500)
+        histogram.observe(1500)
+        lines = histogram.prometheus("x_seconds", 'stage="a"')
+        self.assertEqual(
+            lines,
+            [
+                'x_seconds_bucket{stage="a",le="1e-06"} 1',
+                'x_seconds_bucket{stage="a",le="2e-06"} 2',
+                'x_seconds_bucket{stage="a",le="+Inf"} 2',
+                'x_seconds_sum{stage="a"} 0.000002000',
+                'x_seconds_count{stage="a"} 2',
+            ],
+        )
+
+
+class TestPipelineInstrumentation(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_every_stage_and_agent_timed(self):
+        node = ZKVSNodePrime(instrument=True)
+        node.execute_mandate({"intent": INTENT})
+        asyncio.run(node.execute_mandate_async({"intent": INTENT}))
+        stats = node.stats()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["mandate"]["count"], 2)
+        self.assertEqual(
+            {stage: s["count"] for stage, s in stats["stages"].items()}, dict.fromkeys(STAGES, 2)
+        )
+        self.assertEqual(
+            set(stats["agents"]), {"market_analysis_agent", "zk_proof_agent", "data_sieve_agent"}
+        )
+        self.assertEqual(stats["counters"], {"retries": 0, "mandates_success": 2})
+        self.assertEqual(stats["reboot"]["reboots"], 0)
+
+    def test_retries_counted_and_latency_feeds_trust(self):
+        node = ZKVSNodePrime(instrument=True)
+        self.assertEqual(node._trust_metrics_engine.latency(), TrustMetricsEngine.NOMINAL_LATENCY)
+        with patch.object(node, "_check_safety", side_effect=ValueError("drift")):
+            node.execute_mandate({"intent": INTENT})
+        stats = node.stats()
+        self.assertEqual(stats["counters"], {"retries": 2, "mandates_violation": 1})
+        self.assertEqual(stats["reboot"]["reboots"], 2)
+        self.assertEqual(stats["stages"]["dagger"]["count"], 3)
+        self.assertEqual(stats["stages"]["safety"]["count"], 0)
+        measured = node._trust_metrics_engine.evaluate_all_metrics()["Latency"]
+        self.assertAlmostEqual(measured, node._metrics.mandate.mean_ns / 1e9)
+
+    def test_prometheus_dump(self):
+        node = ZKVSNodePrime(instrument=True)
+        node.execute_mandate({"intent": INTENT})
+        text = node.prometheus_metrics()
+        self.assertIn("# TYPE zkvs_stage_seconds histogram\n", text)
+        self.assertIn('zkvs_stage_seconds_count{stage="dagger"} 1\n', text)
+        self.assertIn('zkvs_agent_seconds_count{agent="zk_proof_agent"} 1\n', text)
+        self.assertIn("zkvs_mandates_success_total 1\n", text)
+        self.assertIn("# TYPE zkvs_reboots_total counter\nzkvs_reboots_total 0\n", text)
+
+    def test_disabled_by_default(self):
+        node = ZKVSNodePrime()
+        self.assertIs(node._metrics, NULL_METRICS)
+        self.assertIs(node._dagger.metrics, NULL_METRICS)
+        node.execute_mandate({"intent": INTENT})
+        self.assertEqual(node.stats()["enabled"], False)
+        self.assertEqual(node._trust_metrics_engine.latency(), TrustMetricsEngine.NOMINAL_LATENCY)
+        self.assertEqual(node.prometheus_metrics().count("# TYPE"), 4)
+        self.assertNotIsInstance(node._metrics, PipelineMetrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.ledger import VerifiableLedger
+from src.ledger_log import LedgerLog
+from src.mandate_result import MandateResult
+from src.merkle import MerkleAccumulator
+from src.node_pool import NodePool, NodePoolError
+from src.sovereign_core import ZKVSNodePrime
+
+FRAMEWORKS = [
+    {"intent": f"market dominance via verifiable systems and data batch-{i % 5}"} for i in range(12)
+]
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "worker trust patch relies on fork")
+class TestNodePool(unittest.TestCase):
+    def setUp(self):
+        # Forked workers inherit the patched trust check.
+        patcher = patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sharding_follows_intent_key(self):
+        with NodePool(workers=3, start_method="fork") as pool:
+            node = ZKVSNodePrime()
+            for framework in FRAMEWORKS:
+                cleaned = node._cerebrum.process_intent(framework["intent"])
+                key, _ = node._hadrian.orchestrate_task(cleaned)["task_id"].split("-")
+                self.assertEqual(pool.intent_key(framework), key)
+                self.assertEqual(pool.shard_for(framework), int(key, 16) % 3)
+
+    def test_results_in_order_and_global_view_merges_workers(self):
+        with NodePool(workers=2, start_method="fork") as pool:
+            results = list(pool.execute_mandates(FRAMEWORKS, batch_size=2, structured=True))
+            single = pool.execute_mandate(FRAMEWORKS[0])
+            view = pool.global_view()
+            states = pool.worker_states()
+        self.assertEqual([r.intent for r in results], [f["intent"] for f in FRAMEWORKS])
+        self.assertTrue(all(isinstance(r, MandateResult) and r.ok for r in results))
+        self.assertIn("ABSOLUTE DOMINION", single)
+        tokens = sum(len(f["intent"].split()) for f in FRAMEWORKS) + len(
+            FRAMEWORKS[0]["intent"].split()
+        )
+        self.assertEqual(view["catalyst"]["count"], tokens)
+        self.assertEqual(view["moat_refinements"], sum(s["moat_refinements"] for s in states))
+        self.assertAlmostEqual(view["moat_strength"], 1.001 ** view["moat_refinements"])
+        self.assertEqual({s["worker"] for s in states}, {0, 1})
+        # Repeated intents get their own task records rather than overwriting each other.
+        self.assertEqual(view["active_tasks"], len(FRAMEWORKS) + 1)
+        roots = MerkleAccumulator()
+        for worker in view["workers"]:
+            roots.append(bytes.fromhex(worker["ledger_root"]))
+        self.assertEqual(view["pool_root"], roots.root().hex())
+        self.assertEqual(view["ledger_size"], sum(w["ledger_size"] for w in view["workers"]))
+
+    def test_worker_ledgers_verifiable_on_their_own(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with NodePool(workers=2, ledger_dir=tmp, start_method="fork") as pool:
+                list(pool.execute_mandates(FRAMEWORKS))
+                view = pool.global_view()
+            for worker in view["workers"]:
+                with LedgerLog(os.path.join(tmp, f"worker-{worker['worker']}.log")) as log:
+                    ledger = VerifiableLedger(store=log)
+                    self.assertEqual(ledger.root, worker["ledger_root"])
+                    self.assertEqual(ledger.total_appended, worker["ledger_size"])
+
+    def test_killed_worker_fails_pending_and_later_requests(self):
+        # Forked workers inherit a mandate path that never returns.
+        with patch.object(
+            ZKVSNodePrime, "execute_mandates", side_effect=lambda *a, **k: time.sleep(60)
+        ):
+            with NodePool(workers=1, start_method="fork", timeout=0.2) as pool:
+                with self.assertRaises(NodePoolError):
+                    pool.execute_mandate(FRAMEWORKS[0])
+                pending = pool.submit(FRAMEWORKS[1])
+                os.kill(pool._processes[0].pid, signal.SIGKILL)
+                with self.assertRaisesRegex(NodePoolError, "exited"):
+                    pending.result(timeout=10)
+                with self.assertRaisesRegex(NodePoolError, "exited"):
+                    pool.worker_states()
+
+    def test_closed_pool_rejects_work(self):
+        pool = NodePool(workers=1, start_method="fork")
+        pool.close()
+        with self.assertRaises(NodePoolError):
+            pool.submit(FRAMEWORKS[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.dagger_agents import DaggerAgent
+from src.praetorian_layers import DaggerLayer, HadrianLayer
+from src.sovereign_core import ZKVSNodePrime
+from src.task_registry import TaskRegistry
+
+
+class SleepyAgent(DaggerAgent):
+    def __init__(self, name, delay, fail=False):
+        super().__init__(name, "test", {})
+        self.delay = delay
+        self.fail = fail
+
+    def _perform_task(self, task_params):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return f"{self.name} done"
+
+
+class BarrierAgent(DaggerAgent):
+    """Finishes only once every agent sharing the barrier is running at the same time."""
+
+    def __init__(self, name, barrier):
+        super().__init__(name, "test", {})
+        self.barrier = barrier
+
+    def _perform_task(self, task_params):
+        self.barrier.wait(timeout=10)
+        return f"{self.name} done"
+
+
+def _task(*names):
+    return {"task_id": "t", "sub_tasks": [{"agent_name": n, "params": {}} for n in names]}
+
+
+class TestDaggerLayerExecutors(unittest.TestCase):
+    def setUp(self):
+        self.agents = {f"a{i}": SleepyAgent(f"a{i}", 0.2) for i in range(4)}
+        self.agents["bad"] = SleepyAgent("bad", 0.0, fail=True)
+        self.agents["slow"] = SleepyAgent("slow", 1.0)
+
+    def test_thread_pool_fans_out_and_preserves_order(self):
+        # Run one after another, the barrier agents would break their barrier and report errors.
+        barrier = threading.Barrier(4)
+        agents = {**self.agents, **{f"a{i}": BarrierAgent(f"a{i}", barrier) for i in range(4)}}
+        layer = DaggerLayer({}, executor=ThreadPoolExecutor(max_workers=4))
+        try:
+            out = layer.execute_task(_task("a0", "a1", "missing", "a2", "bad", "a3"), agents)
+        finally:
+            layer.executor.shutdown()
+        self.assertEqual(
+            out,
+            "a0 done a1 done Agent 'missing' unavailable; skipped. (FLAW=0) a2 done bad execution error: boom a3 done",
+        )
+
+    def test_inline_matches_concurrent_output(self):
+        task = _task("a0", "missing", "bad", "a1")
+        inline = DaggerLayer({}).execute_task(task, self.agents)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            threaded = DaggerLayer({}, executor=pool).execute_task(task, self.agents)
+        self.assertEqual(inline, threaded)
+
+    def test_per_agent_timeout_yields_error_entry(self):
+        layer = DaggerLayer({}, executor="thread", agent_timeout={"slow": 0.05})
+        try:
+            out = layer.execute_task(_task("slow", "a0"), self.agents)
+        finally:
+            layer.shutdown()
+        self.assertEqual(out, "slow execution error: timed out after 0.05s a0 done")
+
+    def test_inline_timeout_replaces_late_result(self):
+        agents = {"late": SleepyAgent("late", 0.05), "a0": SleepyAgent("a0", 0.0)}
+        out = DaggerLayer({}, agent_timeout={"late": 0.01}).execute_task(
+            _task("late", "a0"), agents
+        )
+        self.assertEqual(out, "late execution error: timed out after 0.01s a0 done")
+
+    def test_process_pool_runs_real_agents(self):
+        hadrian = HadrianLayer(ZKVSNodePrime.AXIOMS)
+        task = hadrian.orchestrate_task("market dominance verifiable systems data")
+        inline = DaggerLayer(ZKVSNodePrime.AXIOMS).execute_task(task, hadrian.dagger_agents)
+        layer = DaggerLayer(ZKVSNodePrime.AXIOMS, executor="process")
+        try:
+            self.assertEqual(layer.execute_task(task, hadrian.dagger_agents), inline)
+        finally:
+            layer.shutdown()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTaskRegistry(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tasks = TaskRegistry(capacity=3, ttl=10.0, clock=self.clock)
+        self.hadrian = HadrianLayer(ZKVSNodePrime.AXIOMS, tasks=self.tasks)
+
+    def test_identical_intents_get_distinct_ids(self):
+        first = self.hadrian.orchestrate_task("market dominance")["task_id"]
+        second = self.hadrian.orchestrate_task("market dominance")["task_id"]
+        self.assertNotEqual(first, second)
+        self.assertEqual(first.split("-")[0], second.split("-")[0])
+        self.assertEqual(first.split("-")[0], TaskRegistry.intent_key("market dominance"))
+        self.assertEqual(len(self.tasks), 2)
+        self.assertEqual(self.tasks[first]["status"], "orchestrated")
+
+    def test_capacity_evicts_least_recently_updated(self):
+        ids = [self.hadrian.orchestrate_task(f"data run {i}")["task_id"] for i in range(3)]
+        self.tasks.transition(ids[0], "executing")
+        newest = self.hadrian.orchestrate_task("data run 3")["task_id"]
+        self.assertEqual(list(self.tasks), [ids[2], ids[0], newest])
+        self.assertEqual(self.tasks.evictions, 1)
+        self.assertEqual(
+            [r.task_id for r in self.tasks.by_agent("data_sieve_agent")], [ids[0], ids[2], newest]
+        )
+        self.assertFalse(self.tasks.transition(ids[1], "executing"))
+
+    def test_ttl_expires_idle_tasks(self):
+        old = self.hadrian.orchestrate_task("market dominance")["task_id"]
+        self.clock.now = 11.0
+        fresh = self.hadrian.orchestrate_task("verifiable systems")["task_id"]
+        self.assertEqual(list(self.tasks), [fresh])
+        self.assertEqual(self.tasks.by_agent("market_analysis_agent"), [])
+        self.assertNotIn(old, self.tasks)
+
+    def test_dagger_drives_status(self):
+        agents = {"ok": SleepyAgent("ok", 0.0), "bad": SleepyAgent("bad", 0.0, fail=True)}
+        self.hadrian.register_route("fine", "ok", "run")
+        self.hadrian.register_route("broken", "bad", "run")
+        layer = DaggerLayer({}, tasks=self.tasks)
+        good = self.hadrian.orchestrate_task("fine")
+        layer.execute_task(good, agents)
+        bad = self.hadrian.orchestrate_task("broken")
+        layer.execute_task(bad, agents)
+        self.assertEqual(self.tasks[good["task_id"]].status, "done")
+        self.assertEqual(self.tasks[bad["task_id"]].status, "failed")
+        self.assertEqual(self.tasks[bad["task_id"]].error, "bad execution error: boom")
+        self.assertEqual(self.tasks.in_flight(), [])
+        with self.assertRaises(ValueError):
+            self.tasks.transition(good["task_id"], "executing")
+
+    def test_node_tasks_finish_done(self):
+        node = ZKVSNodePrime(task_capacity=2)
+        for i in range(3):
+            node.execute_mandate({"intent": f"market dominance round {i}"})
+        self.assertEqual(len(node._hadrian.active_tasks), 2)
+        self.assertEqual({r.status for r in node._hadrian.active_tasks.values()}, {"done"})
+
+
+if __name__ == "__main__":
+    unittest.main()
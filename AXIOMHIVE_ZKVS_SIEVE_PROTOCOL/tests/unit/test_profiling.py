@@ -0,0 +1,122 @@
+import asyncio
+import os
+import sys
+import tracemalloc
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.axiom_lattice import TrustMetricsEngine
+from src.dagger_agents import DaggerAgent
+from src.praetorian_layers import DaggerLayer
+from src.profiling import CProfileHook, ProfilingHook, TimingHook, TracemallocHook, use_hooks
+from src.sovereign_core import ZKVSNodePrime
+
+INTENT = "market dominance with verifiable systems and data"
+AGENT_STAGES = ["agent:MarketAnalysisAgent", "agent:ZKProofAgent", "agent:DataSieveAgent"]
+
+
+class RecordingHook(ProfilingHook):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def before(self, stage, context):
+        self.calls.append(("before", stage, context.intent))
+
+    def after(self, stage, context):
+        self.calls.append(("after", stage, context.error))
+
+
+class FailingAgent(DaggerAgent):
+    def _perform_task(self, task_params):
+        raise RuntimeError("boom")
+
+
+class TestProfilingHooks(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stages_nest_around_mandate_layer_and_agents(self):
+        node = ZKVSNodePrime()
+        hook = node.add_hook(RecordingHook())
+        node.execute_mandate({"intent": INTENT})
+        befores = [stage for kind, stage, _ in hook.calls if kind == "before"]
+        afters = [stage for kind, stage, _ in hook.calls if kind == "after"]
+        self.assertEqual(befores, ["mandate", "dagger"] + AGENT_STAGES)
+        self.assertEqual(afters, AGENT_STAGES + ["dagger", "mandate"])
+        self.assertEqual(hook.calls[0], ("before", "mandate", INTENT))
+        # Below the mandate stage the intent is read from the active MandateContext.
+        self.assertEqual(hook.calls[1], ("before", "dagger", INTENT))
+
+    def test_sampling_and_runtime_removal(self):
+        node = ZKVSNodePrime()
+        never = node.add_hook(RecordingHook(sample_rate=0.0))
+        some = node.add_hook(RecordingHook(sample_rate=0.5, stages=("mandate",), seed=7))
+        for _ in range(40):
+            node.execute_mandate({"intent": INTENT})
+        self.assertEqual(never.calls, [])
+        self.assertTrue(5 < len(some.calls) // 2 < 35)
+        self.assertEqual({stage for _, stage, _ in some.calls}, {"mandate"})
+        node.remove_hook(some)
+        seen = len(some.calls)
+        node.execute_mandate({"intent": INTENT})
+        self.assertEqual(len(some.calls), seen)
+
+    def test_async_path_and_thread_pool_agents_are_observed(self):
+        hook = RecordingHook(stages=("agent",))
+        node = ZKVSNodePrime()
+        node.add_hook(hook)
+        asyncio.run(node.execute_mandate_async({"intent": INTENT}))
+        self.assertEqual(
+            sorted(stage for kind, stage, _ in hook.calls if kind == "before"), sorted(AGENT_STAGES)
+        )
+        threaded = ZKVSNodePrime(dagger_executor=ThreadPoolExecutor(max_workers=3))
+        threaded.add_hook(hook)
+        hook.calls.clear()
+        threaded.execute_mandate({"intent": INTENT})
+        self.assertEqual(
+            sorted(stage for kind, stage, _ in hook.calls if kind == "before"), sorted(AGENT_STAGES)
+        )
+        threaded._dagger_executor.shutdown()
+
+    def test_agent_error_reaches_after(self):
+        hook = RecordingHook()
+        with use_hooks(hook):
+            DaggerLayer({}).execute_task(
+                {"sub_tasks": [{"agent_name": "bad"}]}, {"bad": FailingAgent("bad", "test", {})}
+            )
+        ((_, stage, error),) = [
+            call for call in hook.calls if call[0] == "after" and call[1] == "agent:bad"
+        ]
+        self.assertIsInstance(error, RuntimeError)
+        self.assertEqual(hook.calls[-1], ("after", "dagger", None))
+
+    def test_builtin_profilers(self):
+        node = ZKVSNodePrime()
+        cprofile = node.add_hook(CProfileHook())
+        allocations = node.add_hook(TracemallocHook(stages=("dagger",), top=5))
+        timing = node.add_hook(TimingHook())
+        node.execute_mandate({"intent": INTENT})
+        node.execute_mandate({"intent": INTENT})
+
+        self.assertEqual(len(cprofile.reports), 2)
+        report = cprofile.reports[0]
+        self.assertEqual((report.stage, report.intent), ("mandate", INTENT))
+        self.assertIn("_run_task", {func for _, _, func in report.data.stats})
+
+        self.assertEqual([r.stage for r in allocations.reports], ["dagger", "dagger"])
+        self.assertLessEqual(len(allocations.reports[0].data), 5)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        self.assertEqual(set(timing.totals), {"mandate", "dagger", *AGENT_STAGES})
+        self.assertEqual(timing.totals["mandate"]["calls"], 2)
+        self.assertGreater(timing.totals["mandate"]["wall_ms"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from benchmarks import bench_startup
+from src.lazy_import import LazyModule, lazy_import, optional_import
+from src.praetorian_layers import DaggerLayer, HadrianLayer
+from src.sovereign_core import ZKVSNodePrime
+
+
+class TestStartup(unittest.TestCase):
+    def test_import_and_construction_defer_heavy_modules(self):
+        # Checked in a fresh interpreter; timings are left to the benchmark itself.
+        report = bench_startup.measure_cold(runs=1)
+        self.assertEqual(report["deferred_loaded"], [])
+
+    def test_agents_built_on_first_route(self):
+        hadrian = HadrianLayer(ZKVSNodePrime.AXIOMS)
+        self.assertEqual(hadrian.dagger_agents.built, ())
+        self.assertEqual(len(hadrian.dagger_agents), 3)
+        task = hadrian.orchestrate_task("market dominance")
+        DaggerLayer(ZKVSNodePrime.AXIOMS).execute_task(task, hadrian.dagger_agents)
+        self.assertEqual(hadrian.dagger_agents.built, ("market_analysis_agent",))
+        self.assertIs(
+            hadrian.dagger_agents["market_analysis_agent"],
+            hadrian.dagger_agents["market_analysis_agent"],
+        )
+        self.assertIsNone(hadrian.dagger_agents.get("missing_agent"))
+
+    def test_subsystems_created_on_demand(self):
+        node = ZKVSNodePrime()
+        for name in (
+            "_cerebrum",
+            "_hadrian",
+            "_dagger",
+            "_axiom_enforcement",
+            "_complexity_sieve",
+            "_data_moat_engine",
+        ):
+            self.assertNotIn(name, node.__dict__)
+        self.assertIs(node._cerebrum, node._cerebrum)
+        self.assertIs(node._hadrian.router, node._intent_router)
+
+    def test_lazy_import(self):
+        module = LazyModule("colorsys")
+        self.assertFalse(module.loaded)
+        self.assertEqual(module.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertTrue(module.loaded)
+        self.assertIsInstance(lazy_import("axiomhive_module_never_imported"), LazyModule)
+        self.assertIs(lazy_import("os"), os)
+        self.assertIsNone(optional_import("axiomhive_module_that_does_not_exist"))
+
+
+if __name__ == "__main__":
+    unittest.main()
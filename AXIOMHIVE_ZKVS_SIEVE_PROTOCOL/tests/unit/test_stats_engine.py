@@ -0,0 +1,145 @@
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src import stats_engine
+from src.stats_engine import (
+    ACCEPT_H0,
+    ACCEPT_H1,
+    CONTINUE,
+    SPRT,
+    BaselineComparator,
+    kolmogorov_sf,
+    ks_2samp,
+    ks_statistic,
+)
+from tests.utils import kolmogorov_smirnov_test
+
+
+def quadratic_ks(data1, data2):
+    # The original O(n*m) ECDF scan, kept as the reference.
+    d_max = 0.0
+    for x in sorted(set(data1) | set(data2)):
+        ecdf1 = sum(1 for val in data1 if val <= x) / len(data1)
+        ecdf2 = sum(1 for val in data2 if val <= x) / len(data2)
+        d_max = max(d_max, abs(ecdf1 - ecdf2))
+    return d_max
+
+
+class TestKolmogorovSmirnov(unittest.TestCase):
+    def test_matches_quadratic_reference_with_ties(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            a = [rng.randint(0, 12) / 4 for _ in range(rng.randint(1, 30))]
+            b = [rng.randint(0, 12) / 4 + rng.choice((0, 0.25)) for _ in range(rng.randint(1, 30))]
+            self.assertAlmostEqual(ks_statistic(a, b), quadratic_ks(a, b), places=12)
+
+    def test_inputs_not_mutated_and_legacy_helper_delegates(self):
+        a, b = [3.0, 1.0, 2.0], [2.5, 0.5]
+        self.assertEqual(kolmogorov_smirnov_test(a, b), quadratic_ks(a, b))
+        self.assertEqual((a, b), ([3.0, 1.0, 2.0], [2.5, 0.5]))
+        self.assertEqual(kolmogorov_smirnov_test([], []), 0.0)
+        self.assertEqual(kolmogorov_smirnov_test([1.0], []), 1.0)
+        self.assertEqual(ks_statistic(iter([1.0, 2.0]), (2.0, 1.0)), 0.0)
+
+    def test_pvalues(self):
+        self.assertAlmostEqual(kolmogorov_sf(1.358), 0.0500, places=4)
+        self.assertAlmostEqual(kolmogorov_sf(1.0), 0.2700, places=3)
+        self.assertEqual(kolmogorov_sf(0.0), 1.0)
+        rng = random.Random(5)
+        same = ks_2samp(
+            [rng.gauss(0, 1) for _ in range(500)], [rng.gauss(0, 1) for _ in range(400)]
+        )
+        shifted = ks_2samp(
+            [rng.gauss(0, 1) for _ in range(500)], [rng.gauss(0.5, 1) for _ in range(400)]
+        )
+        self.assertGreater(same.pvalue, 0.05)
+        self.assertLess(shifted.pvalue, 1e-6)
+        self.assertEqual((shifted.n1, shifted.n2), (500, 400))
+        with self.assertRaises(ValueError):
+            ks_2samp([], [1.0])
+
+    @unittest.skipIf(stats_engine.np is None, "NumPy not installed")
+    def test_numpy_path_matches_merge_walk(self):
+        rng = random.Random(11)
+        a = [rng.randint(0, 50) for _ in range(300)]
+        b = [rng.randint(5, 55) for _ in range(200)]
+        with patch.object(stats_engine, "np", None):
+            expected = ks_statistic(a, b)
+        self.assertAlmostEqual(ks_statistic(a, b), expected, places=12)
+
+
+class TestSPRT(unittest.TestCase):
+    def test_gaussian_detects_drift_and_accepts_baseline(self):
+        rng = random.Random(7)
+        drift = SPRT.gaussian(100.0, 101.0, sigma=2.0)
+        while drift.update(rng.gauss(101.0, 2.0)) == CONTINUE:
+            pass
+        self.assertEqual(drift.decision, ACCEPT_H1)
+        self.assertTrue(drift.crossed)
+        steady = SPRT.gaussian(100.0, 101.0, sigma=2.0)
+        self.assertEqual(
+            steady.update_many(rng.gauss(100.0, 2.0) for _ in range(10_000)), ACCEPT_H0
+        )
+        self.assertLess(steady.n, 10_000)
+
+    def test_batch_matches_sequential_and_decisions_stick(self):
+        rng = random.Random(9)
+        samples = [rng.gauss(100.5, 2.0) for _ in range(2000)]
+        one_by_one = SPRT.gaussian(100.0, 101.0, sigma=2.0)
+        for x in samples:
+            if one_by_one.update(x) != CONTINUE:
+                break
+        batched = SPRT.gaussian(100.0, 101.0, sigma=2.0)
+        batched.update_many(samples)
+        self.assertEqual((batched.decision, batched.n), (one_by_one.decision, one_by_one.n))
+        self.assertAlmostEqual(batched.llr, one_by_one.llr)
+        seen = batched.n
+        batched.update(1e9)
+        self.assertEqual(batched.n, seen)
+        batched.reset()
+        self.assertEqual((batched.decision, batched.n, batched.llr), (CONTINUE, 0, 0.0))
+
+    def test_bernoulli_and_validation(self):
+        failures = SPRT.bernoulli(0.01, 0.1)
+        self.assertEqual(failures.update_many([1] * 10), ACCEPT_H1)
+        self.assertEqual(SPRT.bernoulli(0.01, 0.1).update_many([0] * 200), ACCEPT_H0)
+        with self.assertRaises(ValueError):
+            SPRT.gaussian(1.0, 1.0, sigma=1.0)
+        with self.assertRaises(ValueError):
+            SPRT(lambda x: x, alpha=0.0)
+
+
+class TestBaselineComparator(unittest.TestCase):
+    def test_window_drift_and_round_trip(self):
+        rng = random.Random(13)
+        baseline = [rng.gauss(500.0, 20.0) for _ in range(2000)]
+        original = list(baseline)
+        comparator = BaselineComparator(baseline, window=300)
+        comparator.extend(rng.gauss(500.0, 20.0) for _ in range(300))
+        self.assertFalse(comparator.compare().drifted)
+        comparator.extend(rng.gauss(540.0, 20.0) for _ in range(300))
+        self.assertEqual(len(comparator), 300)
+        result = comparator.compare()
+        self.assertTrue(result.drifted)
+        self.assertEqual((result.ks.n1, result.ks.n2), (2000, 300))
+        self.assertEqual(baseline, original)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            comparator.save(path)
+            loaded = BaselineComparator.load(path, window=50)
+        self.assertEqual(
+            (loaded.baseline, loaded.window, loaded.alpha), (comparator.baseline, 50, 0.05)
+        )
+        with self.assertRaises(ValueError):
+            loaded.compare()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src import text_pipeline
+from src.axiom_lattice import AxiomEnforcement, TrustMetricsEngine
+from src.dagger_agents import DaggerAgentUtils
+from src.praetorian_layers import CerebrumLayer
+from src.sovereign_core import ZKVSNodePrime
+from src.text_pipeline import MandateContext, activate, deactivate
+
+
+def legacy_process_intent(raw_intent, axioms):
+    sharpened_intent = raw_intent.replace("fluff", "").replace("noise", "").strip()
+    if axioms.get("NOISE") == float("-inf"):
+        return " ".join([w for w in sharpened_intent.split() if len(w) > 2])
+    return sharpened_intent
+
+
+def legacy_densify_text(text):
+    words = text.split()
+    return " ".join(
+        [
+            w
+            for w in words
+            if len(w) > 2 and w.lower() not in ["a", "an", "the", "is", "are", "and", "or"]
+        ]
+    )
+
+
+def legacy_densify_output(output):
+    words = output.split()
+    return " ".join(words[:10]) + "..." if len(words) > 10 else output
+
+
+def random_text(rng, n_tokens):
+    pieces = [
+        "fluff",
+        "noise",
+        "noifluffse",
+        "fluffnoise",
+        "The",
+        "and",
+        "OR",
+        "an",
+        "a",
+        "is",
+        "data",
+        "x",
+        "ab",
+        "market",
+        "dominance",
+        "verifiable",
+        "systems",
+        "naïve",
+        "été",
+    ]
+    separators = [" ", "  ", "\t", "\n", "  ", " "]
+    out = [rng.choice(separators) if rng.random() < 0.3 else ""]
+    for _ in range(n_tokens):
+        token = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 3)))
+        out.append(token)
+        out.append(rng.choice(separators))
+    return "".join(out)
+
+
+class TestTextPipelineEquivalence(unittest.TestCase):
+    def test_cerebrum_matches_legacy(self):
+        rng = random.Random(7)
+        for axioms in ({"NOISE": float("-inf")}, {"NOISE": 0.0}):
+            layer = CerebrumLayer(axioms)
+            for n in range(0, 40):
+                text = random_text(rng, n)
+                self.assertEqual(
+                    layer.process_intent(text), legacy_process_intent(text, axioms), repr(text)
+                )
+
+    def test_densify_text_and_output_match_legacy(self):
+        rng = random.Random(11)
+        for n in range(0, 60):
+            text = random_text(rng, n)
+            self.assertEqual(DaggerAgentUtils.densify_text(text, 1.0), legacy_densify_text(text))
+            self.assertEqual(
+                DaggerAgentUtils.densify_text(text, 1.0, max_chars=100)[:100],
+                legacy_densify_text(text)[:100],
+            )
+            self.assertEqual(DaggerAgentUtils.densify_text(text, 0.5), text)
+            self.assertEqual(AxiomEnforcement({}).densify_output(text), legacy_densify_output(text))
+
+    def test_active_context_reuses_tokens(self):
+        context = MandateContext("refine the data pipeline")
+        context.cleaned = CerebrumLayer({"NOISE": float("-inf")}).process_view(context.intent)
+        scope = activate(context)
+        try:
+            self.assertIs(text_pipeline.tokens_of(context.intent.text), context.intent.tokens)
+            self.assertIs(text_pipeline.tokens_of(context.cleaned.text), context.cleaned.tokens)
+            self.assertEqual(text_pipeline.tokens_of("other text"), ["other", "text"])
+        finally:
+            deactivate(scope)
+        self.assertIsNone(text_pipeline.current_context())
+
+    def test_mandate_report_identical_without_token_reuse(self):
+        framework = {
+            "intent": "Refine fluff data pipelines and noise for market dominance via verifiable systems "
+            * 20
+        }
+        with patch.object(TrustMetricsEngine, "is_system_trustworthy", return_value=True):
+            fused = ZKVSNodePrime().execute_mandate(framework)
+            with (
+                patch("src.text_pipeline.tokens_of", side_effect=str.split),
+                patch("src.dagger_agents.tokens_of", side_effect=str.split),
+                patch("src.praetorian_layers.tokens_of", side_effect=str.split),
+            ):
+                split_each_stage = ZKVSNodePrime().execute_mandate(framework)
+        self.assertIn(f"- INPUT_INTENT: {framework['intent']}\n", fused)
+        self.assertEqual(fused, split_each_stage)
+        self.assertIsNone(text_pipeline.current_context())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,36 +1,15 @@
 from typing import List
 import time
 
+from src.stats_engine import ks_statistic
+
 def kolmogorov_smirnov_test(data1: List[float], data2: List[float]) -> float:
     """
-    Calculates the Kolmogorov-Smirnov (KS) statistic for two samples.
-    This is a simplified, pure Python implementation for illustrative purposes.
-    Not a full statistical test, but calculates the D statistic.
+    Calculates the Kolmogorov-Smirnov (KS) D statistic for two samples.
+    Delegates to src.stats_engine.ks_statistic (O(n log n), inputs left unsorted);
+    use src.stats_engine.ks_2samp when a p-value is needed.
     """
-    if not data1 or not data2:
-        if not data1 and not data2: return 0.0
-        return 1.0 # One empty, one not: max difference
-
-    data1.sort()
-    data2.sort()
-
-    n1 = len(data1)
-    n2 = len(data2)
-
-    # Combine and sort all observations
-    all_data = sorted(list(set(data1 + data2)))
-
-    d_max = 0.0
-    for x in all_data:
-        # Empirical Cumulative Distribution Function (ECDF)
-        # For data1
-        ecdf1 = sum(1 for val in data1 if val <= x) / n1
-        # For data2
-        ecdf2 = sum(1 for val in data2 if val <= x) / n2
-
-        d_max = max(d_max, abs(ecdf1 - ecdf2))
-
-    return d_max
+    return ks_statistic(data1, data2)
 
 def mock_get_l1c_timing_differential() -> float:
     # Mock for I1: Simulate a stable timing differential